@@ -0,0 +1,90 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark per-call body/joint name resolution against ids resolved once at construction.
+
+Before the fingertip bodies and the arm/gripper joints were declared through ``SceneEntityCfg`` on the task state,
+``get_custom_scene_obs``, ``cube_transport_linear_reward`` and ``_compute_state`` each called
+``robot.find_bodies(["finger1", "finger2"])`` (a regex match over all body names) on every control step. This script
+times that pattern next to the cached index tensors used by :class:`TaskState` and reports the per-step cost.
+
+The resolution is pure Python, so its cost does not shrink with ``num_envs``: it dominates at small numbers of
+environments and is amortized at large ones. The synthetic ``find_bodies`` uses plain ``re.fullmatch``; Isaac Lab's
+``resolve_matching_names`` does more bookkeeping per call, so the numbers here are a lower bound.
+
+.. code-block:: bash
+
+    python scripts/benchmarks/bench_index_resolution.py --num_envs 1 64 4096 16384 --device cuda
+
+"""
+
+import argparse
+
+import torch
+
+from bench_utils import BODY_NAMES, JOINT_NAMES, SyntheticEnv, time_call  # isort: skip
+
+parser = argparse.ArgumentParser(description="Benchmark per-call name resolution against cached index tensors.")
+parser.add_argument(
+    "--num_envs", type=int, nargs="+", default=[1, 64, 1024, 4096, 16384], help="Numbers of environments to test."
+)
+parser.add_argument("--device", type=str, default="cpu", help="Torch device.")
+parser.add_argument("--iters", type=int, default=500, help="Timed iterations per measurement.")
+parser.add_argument("--calls_per_step", type=int, default=3, help="Terms reading the fingertips per control step.")
+args_cli = parser.parse_args()
+
+
+def per_call_step(env):
+    """Fingertip and joint reads of one control step, resolving the names on every call."""
+    robot = env.scene["robot"]
+    env_origins = env.scene.env_origins
+    for _ in range(args_cli.calls_per_step):
+        link_indices, _ = robot.find_bodies(["finger1", "finger2"])
+        robot.data.body_pos_w[:, link_indices[0], :] - env_origins
+        robot.data.body_pos_w[:, link_indices[1], :] - env_origins
+    joint_ids, _ = robot.find_joints(JOINT_NAMES)
+    robot.data.joint_pos[:, joint_ids]
+
+
+def make_cached_step(env):
+    """Same reads with the ids resolved once into device index tensors (as in :class:`TaskState`)."""
+    robot = env.scene["robot"]
+    env_origins = env.scene.env_origins
+    body_ids, _ = robot.find_bodies(["finger1", "finger2"])
+    tip_ids = torch.tensor(body_ids, dtype=torch.long, device=env.device)
+    joint_ids = slice(None)  # all joints in order resolve to slice(None)
+    tips_pos = torch.zeros(env.num_envs, 2, 3, device=env.device)
+
+    def cached_step():
+        torch.index_select(robot.data.body_pos_w, 1, tip_ids, out=tips_pos)
+        tips_pos.sub_(env_origins.unsqueeze(1))
+        robot.data.joint_pos[:, joint_ids]
+
+    return cached_step
+
+
+def main():
+    print(f"[INFO] Device: {args_cli.device}")
+    header = f"{'num_envs':>9} | {'per-call us':>11} | {'cached us':>9} | {'saved us':>8} | {'resolve-only us':>15}"
+    print(header)
+    print("-" * len(header))
+    for num_envs in args_cli.num_envs:
+        env = SyntheticEnv(num_envs, device=args_cli.device)
+        robot = env.scene["robot"]
+        per_call = time_call(lambda: per_call_step(env), args_cli.device, iters=args_cli.iters)
+        cached = time_call(make_cached_step(env), args_cli.device, iters=args_cli.iters)
+
+        def resolve_only():
+            for _ in range(args_cli.calls_per_step):
+                robot.find_bodies(["finger1", "finger2"])
+            robot.find_joints(JOINT_NAMES)
+
+        resolve = time_call(resolve_only, args_cli.device, iters=args_cli.iters)
+        print(f"{num_envs:>9} | {per_call:>11.1f} | {cached:>9.1f} | {per_call - cached:>8.1f} | {resolve:>15.1f}")
+    print(f"[INFO] Bodies searched per lookup: {len(BODY_NAMES)}")
+
+
+if __name__ == "__main__":
+    main()
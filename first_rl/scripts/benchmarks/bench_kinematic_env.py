@@ -0,0 +1,72 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Measure the step throughput of the FirstRL-v0 MDP on the kinematic stand-in backend.
+
+The kinematic backend (``kinematic/`` in the task directory) replaces Isaac Sim with SO-101 forward kinematics and an
+attach-when-clamped cube model, and runs the unmodified observation, reward, termination and event terms of the task.
+The numbers therefore measure our own code (MDP terms, task state, managers) plus a cheap kinematic "physics" step,
+without the simulator.
+
+.. code-block:: bash
+
+    python scripts/benchmarks/bench_kinematic_env.py --num_envs 64 1024 4096
+
+"""
+
+import argparse
+import time
+
+import torch
+
+from bench_utils import import_task_module  # isort: skip
+
+parser = argparse.ArgumentParser(description="Step throughput of the kinematic stand-in environment.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[64, 1024, 4096], help="Numbers of environments.")
+parser.add_argument("--device", type=str, default="cpu", help="Torch device.")
+parser.add_argument("--steps", type=int, default=200, help="Timed control steps per measurement.")
+parser.add_argument("--warmup", type=int, default=20, help="Untimed control steps before measuring.")
+parser.add_argument("--seed", type=int, default=42, help="Seed for the environment and the random actions.")
+args_cli = parser.parse_args()
+
+kinematic = import_task_module("kinematic")
+
+
+def measure(num_envs: int) -> tuple[float, int]:
+    """Run random actions and return (seconds per control step, number of episode resets)."""
+    env_cfg = kinematic.KinematicEnvCfg(num_envs=num_envs, device=args_cli.device, seed=args_cli.seed)
+    env = kinematic.KinematicRLEnv(env_cfg)
+    env.reset()
+    num_actions = env.action_manager.total_action_dim
+    actions = torch.empty(num_envs, num_actions, device=env.device)
+    resets = torch.zeros((), dtype=torch.long, device=env.device)
+    for i in range(args_cli.warmup + args_cli.steps):
+        if i == args_cli.warmup:
+            if args_cli.device.startswith("cuda"):
+                torch.cuda.synchronize()
+            start = time.perf_counter()
+        env.step(actions.uniform_(-1.0, 1.0))
+        if i >= args_cli.warmup:
+            resets += env.reset_buf.sum()
+    if args_cli.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) / args_cli.steps, int(resets)
+
+
+def main():
+    print(f"[INFO] Device: {args_cli.device}")
+    header = f"{'num_envs':>9} | {'ms/step':>9} | {'steps/s':>9} | {'env-steps/s':>12} | {'resets':>7}"
+    print(header)
+    print("-" * len(header))
+    for num_envs in args_cli.num_envs:
+        step_time, resets = measure(num_envs)
+        print(
+            f"{num_envs:>9} | {step_time * 1e3:>9.2f} | {1.0 / step_time:>9.1f} | {num_envs / step_time:>12.0f} |"
+            f" {resets:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark every custom MDP term of FirstRL-v0 across numbers of environments.
+
+The terms are driven with the random scene tensors of :class:`bench_utils.SyntheticEnv`. For each ``num_envs`` the
+script reports, per call, the wall time, the ATen ops (kernel launches on CUDA), the fresh tensor allocations and the
+host syncs (boolean-mask indexing, ``nonzero``, ``.item()``).
+
+The terms read the per-step :class:`TaskState` cache, so its update is measured as a row of its own (``task_state``:
+one new control step, including the cross-step advance), as is the single-pass termination evaluation
+(``termination_evaluator``). The terms are measured with warm caches, so the cost of one control step is ``task_state``
+plus ``termination_evaluator`` plus the sum of the term rows.
+
+Results are written to a JSON file (one record per term and ``num_envs``, plus the commit and torch version). Passing
+an earlier file with ``--baseline`` prints the time ratio of each record against it.
+
+.. code-block:: bash
+
+    # full sweep on the GPU, saved for later comparison
+    python scripts/benchmarks/bench_mdp_terms.py --device cuda --output bench_mdp_terms_main.json
+
+    # after a change: compare against the saved run
+    python scripts/benchmarks/bench_mdp_terms.py --device cuda --output new.json --baseline bench_mdp_terms_main.json
+
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+from datetime import datetime
+
+import torch
+
+from bench_utils import TRANSPORT_REWARD_PARAMS, SyntheticEnv, count_ops, import_task_module, time_call  # isort: skip
+
+parser = argparse.ArgumentParser(description="Benchmark the custom MDP terms of FirstRL-v0.")
+parser.add_argument(
+    "--num_envs",
+    type=int,
+    nargs="+",
+    default=[1, 4, 16, 64, 256, 1024, 4096, 16384, 65536],
+    help="Numbers of environments to sweep.",
+)
+parser.add_argument("--device", type=str, default="cpu", help="Torch device.")
+parser.add_argument("--iters", type=int, default=100, help="Timed iterations per measurement.")
+parser.add_argument(
+    "--reset_fraction", type=float, default=1.0, help="Fraction of the environments reset by the event term."
+)
+parser.add_argument("--output", type=str, default="bench_mdp_terms.json", help="Path of the JSON result file.")
+parser.add_argument("--baseline", type=str, default=None, help="Earlier JSON result file to compare against.")
+args_cli = parser.parse_args()
+
+task_state = import_task_module("mdp.task_state")
+observations = import_task_module("mdp.observations")
+rewards = import_task_module("mdp.rewards")
+terminations = import_task_module("mdp.terminations")
+events = import_task_module("mdp.events")
+
+
+def task_state_update(env):
+    """Start a new control step and rebuild the cache, as done by the first term that runs in the step."""
+    env.common_step_counter += 1
+    task_state.get_task_state(env)
+
+
+def termination_evaluator(env):
+    """Re-run the single-pass termination evaluation of the current step (normally done once, by the first term)."""
+    state = task_state.get_task_state(env)
+    state._terminations_step = -1
+    state.evaluate_terminations(env)
+
+
+def make_terms(env) -> dict:
+    """Callables of the benchmarked terms, bound to ``env`` with their configured parameters."""
+    num_reset = max(1, int(args_cli.reset_fraction * env.num_envs))
+    reset_ids = torch.arange(num_reset, device=env.device)
+    return {
+        "task_state": lambda: task_state_update(env),
+        "termination_evaluator": lambda: termination_evaluator(env),
+        "get_custom_scene_obs": lambda: observations.get_custom_scene_obs(env),
+        "cube_transport_linear_reward": lambda: rewards.cube_transport_linear_reward(env, **TRANSPORT_REWARD_PARAMS),
+        "task_success": lambda: terminations.task_success(env),
+        "task_fail_drop": lambda: terminations.task_fail_drop(env),
+        "cube_out_of_table": lambda: terminations.cube_out_of_table(env),
+        "task_time_out": lambda: terminations.task_time_out(env),
+        "reset_cube_to_left_table": lambda: events.reset_cube_to_left_table(env, reset_ids, cube_name="cube"),
+    }
+
+
+def git_commit() -> str | None:
+    """Commit hash of the working tree (``+dirty`` when it has local changes), if git is available."""
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=cwd, text=True).strip()
+        dirty = subprocess.check_output(["git", "status", "--porcelain", "--untracked-files=no"], cwd=cwd, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("+dirty" if dirty.strip() else "")
+
+
+def load_baseline(path: str) -> dict:
+    """Map ``(term, num_envs)`` to the time per call of an earlier run."""
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline["meta"]["device"] != args_cli.device:
+        print(f"[WARN] Baseline was measured on '{baseline['meta']['device']}', this run uses '{args_cli.device}'.")
+    return {(r["term"], r["num_envs"]): r["us_per_call"] for r in baseline["results"]}
+
+
+def main():
+    print(f"[INFO] Device: {args_cli.device}")
+    baseline = load_baseline(args_cli.baseline) if args_cli.baseline else {}
+
+    header = (
+        f"{'num_envs':>9} | {'term':>28} | {'ops/call':>8} | {'allocs/call':>11} | {'syncs/call':>10} |"
+        f" {'us/call':>9}"
+    )
+    if baseline:
+        header += f" | {'vs base':>7}"
+    print(header)
+    print("-" * len(header))
+
+    results = []
+    for num_envs in args_cli.num_envs:
+        env = SyntheticEnv(num_envs, device=args_cli.device)
+        # first call builds the cache (index resolution + buffer allocation), as at manager initialization
+        task_state.get_task_state(env).evaluate_terminations(env)
+        for name, fn in make_terms(env).items():
+            counter = count_ops(fn)
+            elapsed = time_call(fn, args_cli.device, iters=args_cli.iters)
+            record = {
+                "term": name,
+                "num_envs": num_envs,
+                "us_per_call": elapsed,
+                "ops": counter.ops,
+                "allocations": counter.allocations,
+                "syncs": counter.syncs,
+                "op_counts": dict(sorted(counter.op_names.items())),
+            }
+            results.append(record)
+            line = (
+                f"{num_envs:>9} | {name:>28} | {counter.ops:>8} | {counter.allocations:>11} | {counter.syncs:>10} |"
+                f" {elapsed:>9.1f}"
+            )
+            if (name, num_envs) in baseline:
+                line += f" | {elapsed / baseline[(name, num_envs)]:>6.2f}x"
+            print(line)
+        del env
+
+    meta = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "device": args_cli.device,
+        "device_name": torch.cuda.get_device_name(args_cli.device) if args_cli.device.startswith("cuda") else None,
+        "torch": torch.__version__,
+        "python": platform.python_version(),
+        "iters": args_cli.iters,
+        "reset_fraction": args_cli.reset_fraction,
+        "reward_params": TRANSPORT_REWARD_PARAMS,
+    }
+    with open(args_cli.output, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+    print(f"[INFO] Results written to: {os.path.abspath(args_cli.output)}")
+
+
+if __name__ == "__main__":
+    main()
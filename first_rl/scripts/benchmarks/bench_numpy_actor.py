@@ -0,0 +1,153 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark the NumPy actor runtime (``policy.npz``) against the TorchScript export (``policy.pt``).
+
+The script starts one fresh process per backend and reports the time from the process launch until the first action is
+computed (interpreter start, imports and loading), the resident memory of the process and the median per-call latency
+at several batch sizes. Without ``--policy_dir``, a randomly initialized actor of ``agents/rsl_rl_ppo_cfg.py``
+(``[256, 128, 64]``, ELU, observation normalization with random statistics) is exported to a temporary directory. That
+both backends compute the same actions is checked by ``tests/test_numpy_actor.py``.
+
+.. code-block:: bash
+
+    # synthetic actor
+    python scripts/benchmarks/bench_numpy_actor.py
+
+    # exports of a trained run (python scripts/rsl_rl/export.py <run> --activate)
+    python scripts/benchmarks/bench_numpy_actor.py --policy_dir logs/rsl_rl/cube_transport_task/<run>/exported
+
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# the runtimes of the deployment tools
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "deploy"))
+from policy_server import load_policy  # isort: skip
+
+parser = argparse.ArgumentParser(description="Benchmark the NumPy actor runtime against TorchScript.")
+parser.add_argument("--policy_dir", type=str, default=None, help="Directory with policy.pt and policy.npz.")
+parser.add_argument("--obs_dim", type=int, default=30, help="Observation size of the synthetic actor.")
+parser.add_argument("--action_dim", type=int, default=6, help="Action size of the synthetic actor.")
+parser.add_argument("--batch_sizes", type=int, nargs="+", default=[1, 64, 1024], help="Batch sizes to time.")
+parser.add_argument("--iters", type=int, default=500, help="Timed calls per batch size.")
+parser.add_argument("--threads", type=int, default=1, help="CPU threads of both backends.")
+parser.add_argument("--worker", type=str, default=None, help=argparse.SUPPRESS)
+
+
+def export_synthetic(obs_dim: int, action_dim: int, path: str, normalize: bool = True):
+    """Export a random actor with the architecture of the PPO runner configuration as policy.pt and policy.npz.
+
+    With ``normalize=False`` the normalizer is ``nn.Identity``, as in rsl_rl without observation normalization.
+    """
+    import torch
+    from rsl_rl.networks import MLP, EmpiricalNormalization
+
+    from numpy_actor import export_policy_as_npz  # isort: skip
+
+    class Exporter(torch.nn.Module):
+        """Same forward as Isaac Lab's JIT exporter: the normalizer followed by the actor."""
+
+        def __init__(self, actor, normalizer):
+            super().__init__()
+            self.actor = actor
+            self.normalizer = normalizer
+
+        def forward(self, x):
+            return self.actor(self.normalizer(x))
+
+    torch.manual_seed(0)
+    actor = MLP(obs_dim, action_dim, [256, 128, 64], "elu")
+    if normalize:
+        normalizer = EmpiricalNormalization(obs_dim)
+        normalizer._mean.uniform_(-1.0, 1.0)
+        normalizer._std.uniform_(0.1, 2.0)
+    else:
+        normalizer = torch.nn.Identity()
+    exporter = Exporter(actor, normalizer).eval()
+    torch.jit.script(exporter).save(os.path.join(path, "policy.pt"))
+    export_policy_as_npz(exporter, normalizer, path=path, filename="policy.npz")
+
+
+def resident_mb() -> float:
+    """Resident set size of this process in MB."""
+    # ru_maxrss would also count the peak of the parent process before the exec (Linux)
+    try:
+        with open("/proc/self/status") as f:
+            return next(int(line.split()[1]) for line in f if line.startswith("VmRSS:")) / 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def worker(path: str, batch_sizes: list[int], iters: int, threads: int):
+    """Load one backend in this fresh process and print its ready time, RSS and latencies as JSON."""
+    policy = load_policy(path, threads=threads, max_batch=max(batch_sizes))
+    policy(np.zeros((1, policy.obs_dim), dtype=np.float32))
+    ready = time.time()
+    rng = np.random.default_rng(0)
+    latencies = {}
+    for batch_size in batch_sizes:
+        obs = rng.standard_normal((batch_size, policy.obs_dim), dtype=np.float32)
+        for _ in range(20):
+            policy(obs)
+        times = np.empty(iters)
+        for i in range(iters):
+            start = time.perf_counter()
+            policy(obs)
+            times[i] = time.perf_counter() - start
+        latencies[batch_size] = float(np.median(times))
+    rss_mb = resident_mb()
+    print(json.dumps({"ready": ready, "rss_mb": rss_mb, "latency_s": latencies}))
+
+
+def run_worker(path: str, args_cli) -> dict:
+    env = dict(os.environ)
+    for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        env[var] = str(args_cli.threads)
+    command = [sys.executable, os.path.abspath(__file__), "--worker", path, "--iters", str(args_cli.iters)]
+    command += ["--threads", str(args_cli.threads)]
+    command += ["--batch_sizes", *map(str, args_cli.batch_sizes)]
+    launched = time.time()
+    output = subprocess.run(command, env=env, capture_output=True, text=True, check=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    # from the process launch (interpreter start included) to the first computed action
+    result["startup_s"] = result["ready"] - launched
+    return result
+
+
+def main():
+    args_cli = parser.parse_args()
+    if args_cli.worker:
+        worker(args_cli.worker, args_cli.batch_sizes, args_cli.iters, args_cli.threads)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        policy_dir = args_cli.policy_dir
+        if policy_dir is None:
+            policy_dir = tmp_dir
+            export_synthetic(args_cli.obs_dim, args_cli.action_dim, policy_dir)
+
+        results = {name: run_worker(os.path.join(policy_dir, name), args_cli) for name in ("policy.pt", "policy.npz")}
+
+    header = f"{'backend':<12}{'startup [s]':>13}{'RSS [MB]':>10}"
+    header += "".join(f"{f'batch {b} [us]':>16}" for b in args_cli.batch_sizes)
+    print(header)
+    for name, result in results.items():
+        row = f"{name:<12}{result['startup_s']:>13.3f}{result['rss_mb']:>10.1f}"
+        row += "".join(f"{result['latency_s'][str(b)] * 1e6:>16.1f}" for b in args_cli.batch_sizes)
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
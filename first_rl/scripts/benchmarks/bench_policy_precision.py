@@ -0,0 +1,123 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Accuracy and CPU latency of the reduced-precision actor variants against the float32 policy.
+
+For the float32 ``policy.pt`` and each of the ``policy_<int8|fp16|bf16>.pt`` variants (see
+``scripts/rsl_rl/policy_variants.py``), the script reports the maximum and mean action deviation from the float32
+policy on replayed observations, the median latency of one call at batch size 1 (one robot, one control step) and the
+throughput at larger batch sizes. The observations are ``obs_replay.npy`` of the policy directory (recorded with
+``play.py --record_obs``) or, without it, standard normal samples. Without ``--policy_dir``, a randomly initialized
+actor of ``agents/rsl_rl_ppo_cfg.py`` is used.
+
+.. code-block:: bash
+
+    # exports of a trained run
+    python scripts/rsl_rl/export.py logs/rsl_rl/cube_transport_task/<run> --precisions int8 fp16 bf16 --activate
+    python scripts/benchmarks/bench_policy_precision.py --policy_dir logs/rsl_rl/cube_transport_task/<run>/exported
+
+    # synthetic actor, on-robot thread budget
+    python scripts/benchmarks/bench_policy_precision.py --threads 1
+
+"""
+
+import argparse
+import os
+import sys
+import time
+import types
+
+import numpy as np
+import torch
+
+# the export helpers of the RSL-RL scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "rsl_rl"))
+import policy_variants  # isort: skip
+
+parser = argparse.ArgumentParser(description="Accuracy and CPU latency of the reduced-precision actor variants.")
+parser.add_argument("--policy_dir", type=str, default=None, help="Export directory with policy.pt and the variants.")
+parser.add_argument(
+    "--precisions", type=str, nargs="+", default=list(policy_variants.PRECISIONS), help="Variants to compare."
+)
+parser.add_argument("--obs_dim", type=int, default=30, help="Observation size of the synthetic actor.")
+parser.add_argument("--action_dim", type=int, default=6, help="Action size of the synthetic actor.")
+parser.add_argument("--num_obs", type=int, default=65536, help="Random observations when no replay file is found.")
+parser.add_argument("--batch_sizes", type=int, nargs="+", default=[256, 4096], help="Batch sizes of the throughput.")
+parser.add_argument("--iters", type=int, default=500, help="Timed calls at batch size 1.")
+parser.add_argument("--threads", type=int, default=1, help="CPU threads (torch.set_num_threads).")
+args_cli = parser.parse_args()
+
+
+def synthetic_policies(precisions: list[str]) -> dict:
+    """Float32 reference and variants of a random actor with the architecture of the PPO runner configuration."""
+    from rsl_rl.networks import MLP, EmpiricalNormalization
+
+    torch.manual_seed(0)
+    policy = types.SimpleNamespace(actor=MLP(args_cli.obs_dim, args_cli.action_dim, [256, 128, 64], "elu"))
+    normalizer = EmpiricalNormalization(args_cli.obs_dim)
+    normalizer._mean.uniform_(-1.0, 1.0)
+    normalizer._std.uniform_(0.1, 2.0)
+    policies = {"fp32": torch.jit.script(torch.nn.Sequential(normalizer, policy.actor).eval())}
+    for precision in precisions:
+        policies[precision] = torch.jit.script(policy_variants.make_variant(policy, normalizer, precision))
+    return policies
+
+
+def exported_policies(policy_dir: str, precisions: list[str]) -> dict:
+    policies = {"fp32": torch.jit.load(os.path.join(policy_dir, "policy.pt"), map_location="cpu").eval()}
+    for precision in precisions:
+        path = os.path.join(policy_dir, policy_variants.variant_filename(precision))
+        if not os.path.isfile(path):
+            print(f"[WARN] Skipping {precision}: {path} not found (export it with --precisions {precision}).")
+            continue
+        policies[precision] = torch.jit.load(path, map_location="cpu").eval()
+    return policies
+
+
+def latency(policy, obs: torch.Tensor, iters: int) -> float:
+    """Median wall time of one call (seconds)."""
+    for _ in range(20):
+        policy(obs)
+    times = np.empty(iters)
+    for i in range(iters):
+        start = time.perf_counter()
+        policy(obs)
+        times[i] = time.perf_counter() - start
+    return float(np.median(times))
+
+
+def main():
+    torch.set_num_threads(args_cli.threads)
+    if args_cli.policy_dir:
+        policies = exported_policies(args_cli.policy_dir, args_cli.precisions)
+        obs_path = os.path.join(args_cli.policy_dir, policy_variants.OBS_REPLAY_FILE)
+    else:
+        policies = synthetic_policies(args_cli.precisions)
+        obs_path = None
+    if obs_path and os.path.isfile(obs_path):
+        obs = np.load(obs_path)
+        print(f"[INFO] Replaying {len(obs)} recorded observations from {obs_path}")
+    else:
+        obs = np.random.default_rng(0).standard_normal((args_cli.num_obs, args_cli.obs_dim), dtype=np.float32)
+        print(f"[INFO] Replaying {len(obs)} random observations")
+    obs_t = torch.from_numpy(np.ascontiguousarray(obs, dtype=np.float32))
+
+    header = f"{'variant':<8}{'max dev':>11}{'mean dev':>11}{'batch 1 [us]':>14}"
+    header += "".join(f"{f'batch {b} [obs/s]':>20}" for b in args_cli.batch_sizes)
+    print(f"[INFO] CPU, {args_cli.threads} thread(s)")
+    print(header)
+    with torch.inference_mode():
+        for name, policy in policies.items():
+            deviation = policy_variants.action_deviation(policies["fp32"], policy, obs)
+            row = f"{name:<8}{deviation['max']:>11.2e}{deviation['mean']:>11.2e}"
+            row += f"{latency(policy, obs_t[:1], args_cli.iters) * 1e6:>14.1f}"
+            for batch_size in args_cli.batch_sizes:
+                batch = obs_t[:batch_size]
+                row += f"{len(batch) / latency(policy, batch, max(args_cli.iters // 10, 10)):>20.0f}"
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Check and benchmark the fused transport reward against the mask-scatter reference.
+
+The script first runs a parity check of :func:`transport_reward_fused` (eager and, with ``--compile``,
+``torch.compile``) and of the allocation-free :func:`transport_reward_inplace` against
+:func:`transport_reward_reference` on randomized inputs. The inputs are drawn around every
+threshold of the reward (near mask, drop zone, goal, lift height, table bounds) so that all branches are hit. It then
+reports ops, allocations, boolean-mask ``index``/``index_put_`` calls (each one a host sync on CUDA) and wall time
+per call for each variant. Op counts are not reported for the compiled variant, whose ops run inside generated kernels.
+
+.. code-block:: bash
+
+    # parity check + CPU benchmark at 1k, 4k and 16k envs
+    python scripts/benchmarks/bench_reward_kernel.py
+
+    # include the torch.compile variant (needs a working C++ toolchain on CPU)
+    python scripts/benchmarks/bench_reward_kernel.py --compile --device cuda
+
+"""
+
+import argparse
+import sys
+
+import torch
+
+from bench_utils import (  # isort: skip
+    TRANSPORT_REWARD_PARAMS,
+    count_ops,
+    import_task_module,
+    random_transport_inputs,
+    time_call,
+)
+
+parser = argparse.ArgumentParser(description="Check and benchmark the fused transport reward kernel.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[1024, 4096, 16384], help="Numbers of environments.")
+parser.add_argument("--device", type=str, default="cpu", help="Torch device.")
+parser.add_argument("--iters", type=int, default=200, help="Timed iterations per measurement.")
+parser.add_argument("--compile", action="store_true", default=False, help="Also check and time torch.compile.")
+parser.add_argument("--check_only", action="store_true", default=False, help="Only run the parity check.")
+parser.add_argument("--seeds", type=int, default=20, help="Number of random input sets for the parity check.")
+args_cli = parser.parse_args()
+
+kernels = import_task_module("mdp.reward_kernels")
+
+
+def inplace_kernel():
+    """:func:`transport_reward_inplace` with preallocated buffers sized on first use for each ``num_envs``."""
+    buffers = {}
+
+    def fn(*inputs, **params):
+        num_envs = inputs[0].shape[0]
+        if num_envs not in buffers:
+            buffers[num_envs] = kernels.TransportRewardBuffers(num_envs, inputs[0].device)
+        return kernels.transport_reward_inplace(*inputs, **params, buffers=buffers[num_envs])
+
+    return fn
+
+
+def check(variants: dict) -> bool:
+    """Compare each variant with the reference on ``--seeds`` random input sets."""
+    ok = True
+    for name, fn in variants.items():
+        max_err = 0.0
+        for seed in range(args_cli.seeds):
+            inputs = random_transport_inputs(4096, args_cli.device, seed)
+            expected = kernels.transport_reward_reference(*inputs, **TRANSPORT_REWARD_PARAMS)
+            actual = fn(*inputs, **TRANSPORT_REWARD_PARAMS)
+            max_err = max(max_err, (expected - actual).abs().max().item())
+            if not torch.allclose(expected, actual, rtol=1e-5, atol=1e-5):
+                ok = False
+        status = "OK" if max_err <= 1e-5 else "MISMATCH"
+        print(f"[CHECK] {name:>14}: max abs error {max_err:.3e} over {args_cli.seeds} seeds -> {status}")
+    return ok
+
+
+def main():
+    print(f"[INFO] Device: {args_cli.device}")
+    variants = {"fused (eager)": kernels.transport_reward_fused, "in-place": inplace_kernel()}
+    if args_cli.compile:
+        variants["fused (compile)"] = torch.compile(kernels.transport_reward_fused, dynamic=False)
+
+    if not check(variants):
+        sys.exit(1)
+    if args_cli.check_only:
+        return
+
+    all_variants = {"reference": kernels.transport_reward_reference, **variants}
+    header = (
+        f"{'num_envs':>9} | {'variant':>15} | {'ops/call':>8} | {'allocs/call':>11} | {'syncs/call':>10} |"
+        f" {'us/call':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for num_envs in args_cli.num_envs:
+        inputs = random_transport_inputs(num_envs, args_cli.device, seed=0)
+        for name, fn in all_variants.items():
+            # warm up first so compilation is not part of the measurement
+            fn(*inputs, **TRANSPORT_REWARD_PARAMS)
+            elapsed = time_call(
+                lambda fn=fn: fn(*inputs, **TRANSPORT_REWARD_PARAMS), args_cli.device, iters=args_cli.iters
+            )
+            if "compile" in name:
+                print(f"{num_envs:>9} | {name:>15} | {'-':>8} | {'-':>11} | {'-':>10} | {elapsed:>9.1f}")
+                continue
+            counter = count_ops(fn, *inputs, **TRANSPORT_REWARD_PARAMS)
+            syncs = counter.op_names.get("index", 0) + counter.op_names.get("index_put_", 0)
+            print(
+                f"{num_envs:>9} | {name:>15} | {counter.ops:>8} | {counter.allocations:>11} | {syncs:>10} |"
+                f" {elapsed:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
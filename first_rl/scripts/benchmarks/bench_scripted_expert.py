@@ -0,0 +1,116 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Success rate and demonstration throughput of the scripted expert on the kinematic stand-in backend.
+
+The batched expert (``mdp/scripted_expert.py``) drives all environments from the policy observations. The script
+reports, per number of environments, the environment steps per second (expert + environment), the same figure as
+demonstration steps per hour, the time of one expert call, and the outcome of the finished episodes (termination
+reasons). The success rate is the baseline to compare learned policies against. With ``--record_trajectories`` the
+rollouts of the last measurement are recorded as a trajectory dataset, ready for ``--bc_demos``.
+
+.. code-block:: bash
+
+    python scripts/benchmarks/bench_scripted_expert.py --num_envs 64 1024 4096
+
+    # demonstrations for the behavior-cloning warm start
+    python scripts/benchmarks/bench_scripted_expert.py --num_envs 4096 --steps 2000 --record_trajectories demos/expert
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import torch
+
+from bench_utils import import_task_module  # isort: skip
+
+# the trajectory recorder of the RSL-RL scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "rsl_rl"))
+import trajectory_recorder  # isort: skip
+
+parser = argparse.ArgumentParser(description="Success rate and throughput of the scripted expert.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[64, 1024, 4096], help="Numbers of environments.")
+parser.add_argument("--device", type=str, default="cpu", help="Torch device.")
+parser.add_argument("--steps", type=int, default=600, help="Timed control steps per measurement.")
+parser.add_argument("--seed", type=int, default=42, help="Seed for the environment.")
+parser.add_argument(
+    "--record_trajectories", type=str, default=None, help="Record the rollouts of the last measurement here."
+)
+args_cli = parser.parse_args()
+
+kinematic = import_task_module("kinematic")
+vec_env = import_task_module("kinematic.vec_env")
+scripted_expert = import_task_module("mdp.scripted_expert")
+task_state = import_task_module("mdp.task_state")
+
+
+def sync():
+    if args_cli.device.startswith("cuda"):
+        torch.cuda.synchronize()
+
+
+def measure(num_envs: int, record_dir: str | None) -> dict:
+    env_cfg = kinematic.KinematicEnvCfg(num_envs=num_envs, device=args_cli.device, seed=args_cli.seed)
+    env = vec_env.KinematicVecEnvWrapper(kinematic.KinematicRLEnv(env_cfg))
+    state = env.unwrapped.task_state
+    if record_dir:
+        env = trajectory_recorder.TrajectoryRecorder(
+            env, record_dir, reason_names=[reason.name.lower() for reason in task_state.TerminationReason]
+        )
+    params = env_cfg.rewards["transport_task"].params
+    expert = scripted_expert.ScriptedExpert(
+        state.obs_layout,
+        device=args_cli.device,
+        arm_scale=env_cfg.actions["arm_pos"].scale,
+        gripper_scale=env_cfg.actions["gripper_pos"].scale,
+        table_height=env_cfg.task_state.table_height,
+        cube_size=env_cfg.task_state.cube_size,
+        lift_height=params["target_lift_height"],
+    )
+
+    obs = env.get_observations()
+    counts = torch.zeros(len(task_state.TerminationReason), dtype=torch.long, device=args_cli.device)
+    sync()
+    start = time.perf_counter()
+    with torch.inference_mode():
+        for _ in range(args_cli.steps):
+            obs, _, _, _ = env.step(expert.act(obs["policy"]))
+            counts += torch.bincount(state.termination_reason.long(), minlength=len(counts))
+        sync()
+        elapsed = time.perf_counter() - start
+        # the expert alone, on the last observations
+        start = time.perf_counter()
+        for _ in range(20):
+            expert.act(obs["policy"])
+        sync()
+        expert_time = (time.perf_counter() - start) / 20
+    env.close()
+    return {"step_time": elapsed / args_cli.steps, "expert_time": expert_time, "counts": counts.tolist()}
+
+
+def main():
+    print(f"[INFO] Device: {args_cli.device}, {args_cli.steps} steps per measurement")
+    reasons = [reason for reason in task_state.TerminationReason if reason != task_state.TerminationReason.NONE]
+    header = f"{'num_envs':>9} | {'env-steps/s':>12} | {'steps/hour':>11} | {'expert ms':>9} | {'episodes':>8}"
+    header += "".join(f" | {reason.name.lower():>12}" for reason in reasons)
+    print(header)
+    print("-" * len(header))
+    for i, num_envs in enumerate(args_cli.num_envs):
+        record_dir = args_cli.record_trajectories if i == len(args_cli.num_envs) - 1 else None
+        result = measure(num_envs, record_dir)
+        counts = result["counts"]
+        num_episodes = sum(counts[reason] for reason in reasons)
+        rate = num_envs / result["step_time"]
+        row = f"{num_envs:>9} | {rate:>12.0f} | {rate * 3600:>11.2e} | {result['expert_time'] * 1e3:>9.3f}"
+        row += f" | {num_episodes:>8}"
+        row += "".join(f" | {counts[reason] / max(num_episodes, 1):>12.1%}" for reason in reasons)
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark the shared per-step task-state cache against per-term re-derivation.
+
+Before the cache, the observation, the reward, ``_compute_state`` and the three custom termination terms each derived
+the fingertip positions, finger distance, TCP, env-local cube position and cube height on their own. This script
+replays that per-step derivation pattern next to a single :class:`TaskState` update and reports the ATen ops
+(kernel launches on CUDA), fresh tensor allocations and wall time per control step.
+
+.. code-block:: bash
+
+    python scripts/benchmarks/bench_task_state.py --num_envs 4096 --device cuda
+
+"""
+
+import argparse
+
+import torch
+
+from bench_utils import SyntheticEnv, count_ops, import_task_module, time_call  # isort: skip
+
+parser = argparse.ArgumentParser(description="Benchmark the per-step task-state cache.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[1024, 4096], help="Numbers of environments to test.")
+parser.add_argument("--device", type=str, default="cpu", help="Torch device.")
+parser.add_argument("--iters", type=int, default=200, help="Timed iterations per measurement.")
+args_cli = parser.parse_args()
+
+task_state = import_task_module("mdp.task_state")
+
+
+def legacy_step(env, table_height: float = 0.5, cube_size: float = 0.05):
+    """Geometry derivations of one control step as done per term before the shared cache."""
+    scene = env.scene
+    robot = scene["robot"]
+    cube = scene["cube"]
+    env_origins = scene.env_origins
+
+    # get_custom_scene_obs
+    link_indices, _ = robot.find_bodies(["finger1", "finger2"])
+    tip1_env = robot.data.body_pos_w[:, link_indices[0], :] - env_origins
+    tip2_env = robot.data.body_pos_w[:, link_indices[1], :] - env_origins
+    cube_env = cube.data.root_pos_w - env_origins
+    tcp_env = 0.5 * (tip1_env + tip2_env)
+    torch.norm(tip1_env - tip2_env, dim=-1, keepdim=True)
+    cube_env - tcp_env
+
+    # cube_transport_linear_reward
+    link_indices, _ = robot.find_bodies(["finger1", "finger2"])
+    curr_tip1 = robot.data.body_pos_w[:, link_indices[0], :] - env_origins
+    curr_tip2 = robot.data.body_pos_w[:, link_indices[1], :] - env_origins
+    torch.norm(curr_tip1 - curr_tip2, dim=-1)
+    cube_env = cube.data.root_pos_w - env_origins
+    cube_env[:, 2] - table_height - (cube_size / 2.0)
+    tcp_env = 0.5 * (curr_tip1 + curr_tip2)
+    torch.norm(cube_env - tcp_env, dim=-1)
+
+    # _compute_state
+    link_indices, _ = robot.find_bodies(["finger1", "finger2"])
+    curr_tip1 = robot.data.body_pos_w[:, link_indices[0], :] - env_origins
+    curr_tip2 = robot.data.body_pos_w[:, link_indices[1], :] - env_origins
+    torch.norm(curr_tip1 - curr_tip2, dim=-1)
+    cube_env = cube.data.root_pos_w - env_origins
+    cube_env[:, 2] - table_height - cube_size / 2.0
+
+    # task_success, task_fail_drop, cube_out_of_table
+    for _ in range(3):
+        env_ids = torch.arange(env.num_envs, device=env.device)
+        cube_pos = (cube.data.root_pos_w - env_origins)[env_ids]
+        cube_pos[:, 2] - table_height - cube_size / 2.0
+
+
+def cached_step(env):
+    """One control step with the shared cache: one update (incl. the cross-step advance), five cached reads."""
+    env.common_step_counter += 1
+    for _ in range(6):
+        task_state.get_task_state(env)
+
+
+def main():
+    print(f"[INFO] Device: {args_cli.device}")
+    header = f"{'num_envs':>9} | {'variant':>8} | {'ops/step':>8} | {'allocs/step':>11} | {'us/step':>9}"
+    print(header)
+    print("-" * len(header))
+    for num_envs in args_cli.num_envs:
+        env = SyntheticEnv(num_envs, device=args_cli.device)
+        # first call builds the cache (body lookup + buffer allocation), as at manager initialization
+        task_state.get_task_state(env)
+
+        results = {}
+        for name, fn in (("per-term", legacy_step), ("cached", cached_step)):
+            counter = count_ops(fn, env)
+            elapsed = time_call(lambda fn=fn: fn(env), args_cli.device, iters=args_cli.iters)
+            results[name] = counter
+            print(f"{num_envs:>9} | {name:>8} | {counter.ops:>8} | {counter.allocations:>11} | {elapsed:>9.1f}")
+        saved_ops = results["per-term"].ops - results["cached"].ops
+        saved_allocs = results["per-term"].allocations - results["cached"].allocations
+        print(f"{num_envs:>9} | {'saved':>8} | {saved_ops:>8} | {saved_allocs:>11} |")
+
+
+if __name__ == "__main__":
+    main()
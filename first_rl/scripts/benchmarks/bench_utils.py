@@ -0,0 +1,404 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Shared helpers for the CPU/GPU micro-benchmarks of the first_rl task code.
+
+The benchmarks exercise the pure-torch parts of the task (e.g. ``mdp/task_state.py``) without launching Isaac Sim.
+Importing them through ``first_rl.tasks...`` would execute the package ``__init__`` (gym registration, Omniverse UI
+extension), so the task directory is mounted as a stand-alone package instead.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.machinery
+import importlib.util
+import os
+import re
+import sys
+import time
+from types import SimpleNamespace
+
+import torch
+from torch.utils._python_dispatch import TorchDispatchMode
+
+TASK_DIR = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__), "..", "..", "source", "first_rl", "first_rl", "tasks", "manager_based", "first_rl"
+    )
+)
+"""Directory of the FirstRL-v0 task (contains the ``mdp`` package)."""
+
+TASK_PACKAGE = "first_rl_task"
+"""Name under which :data:`TASK_DIR` is mounted."""
+
+
+def import_task_module(name: str):
+    """Import a module of the task directory without importing Isaac Sim.
+
+    Args:
+        name: Dotted module path relative to the task directory, e.g. ``"mdp.task_state"``.
+
+    Returns:
+        The imported module.
+    """
+    if TASK_PACKAGE not in sys.modules:
+        spec = importlib.machinery.ModuleSpec(TASK_PACKAGE, None, is_package=True)
+        spec.submodule_search_locations = [TASK_DIR]
+        sys.modules[TASK_PACKAGE] = importlib.util.module_from_spec(spec)
+    return importlib.import_module(f"{TASK_PACKAGE}.{name}")
+
+
+"""
+Op and allocation counting.
+"""
+
+
+class OpCounter(TorchDispatchMode):
+    """Counts ATen ops and fresh tensor allocations issued inside the context.
+
+    Every non-view op corresponds to (at least) one kernel launch on CUDA. An op output counts as an allocation when
+    its storage is not shared with any of the op inputs, i.e. in-place, ``out=`` and view ops are not allocations.
+    """
+
+    SYNC_OPS = ("nonzero", "masked_select", "_local_scalar_dense")
+    """Ops whose output size or value must be read back by the host (a device-to-host sync on CUDA)."""
+
+    def __init__(self):
+        super().__init__()
+        self.ops = 0
+        self.allocations = 0
+        self.syncs = 0
+        self.op_names: dict[str, int] = {}
+
+    def __torch_dispatch__(self, func, types, args=(), kwargs=None):
+        kwargs = kwargs or {}
+        out = func(*args, **kwargs)
+        if func.is_view:
+            return out
+        self.ops += 1
+        name = func.overloadpacket.__name__
+        self.op_names[name] = self.op_names.get(name, 0) + 1
+        if name in self.SYNC_OPS or (name in ("index", "index_put_") and _has_bool_index(args)):
+            self.syncs += 1
+        input_ptrs = {_storage_ptr(t) for t in _flatten_tensors((args, kwargs))}
+        for t in _flatten_tensors(out):
+            ptr = _storage_ptr(t)
+            if ptr != 0 and ptr not in input_ptrs:
+                self.allocations += 1
+        return out
+
+
+def _flatten_tensors(obj):
+    if isinstance(obj, torch.Tensor):
+        yield obj
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            yield from _flatten_tensors(item)
+    elif isinstance(obj, dict):
+        for item in obj.values():
+            yield from _flatten_tensors(item)
+
+
+def _has_bool_index(args) -> bool:
+    # aten.index / aten.index_put_ take the index tensors as second argument; boolean masks are resolved via nonzero
+    return len(args) > 1 and any(t.dtype == torch.bool for t in _flatten_tensors(args[1]))
+
+
+def _storage_ptr(t: torch.Tensor) -> int:
+    return t.untyped_storage().data_ptr()
+
+
+def count_ops(fn, *args, **kwargs) -> OpCounter:
+    """Run ``fn`` once under an :class:`OpCounter` and return the counter."""
+    with OpCounter() as counter:
+        fn(*args, **kwargs)
+    return counter
+
+
+def time_call(fn, device: str, iters: int = 200, warmup: int = 20) -> float:
+    """Average wall time of ``fn()`` in microseconds (synchronizes CUDA before reading the clock)."""
+    for _ in range(warmup):
+        fn()
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for _ in range(iters):
+        fn()
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) / iters * 1e6
+
+
+"""
+Transport reward inputs.
+"""
+
+TRANSPORT_REWARD_PARAMS = dict(import_task_module("mdp.task_params").TRANSPORT_REWARD_PARAMS)
+"""The RewardsCfg parameters of the transport term (``mdp/task_params.py``)."""
+
+
+def random_transport_inputs(num_envs: int, device: str, seed: int) -> tuple:
+    """Random inputs of the transport reward kernels, spread across every branch threshold of the reward.
+
+    The inputs are drawn around the near mask, the drop zone, the goal, the lift height and the table bounds, so that
+    all branches are hit.
+    """
+    gen = torch.Generator(device=device).manual_seed(seed)
+
+    def uniform(low, high, *shape):
+        return low + (high - low) * torch.rand(*shape, generator=gen, device=device)
+
+    finger_dist = uniform(0.0, 0.3, num_envs)
+    # half of the envs within the 0.015 m near mask
+    tcp_cube_dist = torch.where(
+        torch.rand(num_envs, generator=gen, device=device) < 0.5,
+        uniform(0.0, 0.02, num_envs),
+        uniform(0.0, 1.5, num_envs),
+    )
+    cube_pos = torch.stack(
+        [uniform(-0.5, 0.5, num_envs), uniform(-0.45, 0.7, num_envs), uniform(0.4, 0.8, num_envs)], dim=-1
+    )
+    cube_height = uniform(-0.15, 0.3, num_envs)
+    is_clamped = torch.rand(num_envs, generator=gen, device=device) < 0.5
+    has_been_lifted = torch.rand(num_envs, generator=gen, device=device) < 0.5
+    return finger_dist, tcp_cube_dist, cube_pos, cube_height, is_clamped, has_been_lifted
+
+
+"""
+Synthetic scene.
+"""
+
+BODY_NAMES = [
+    "base",
+    "shoulder",
+    "upper_arm",
+    "lower_arm",
+    "wrist",
+    "gripper",
+    "moving_jaw_so101_v1",
+    "finger1",
+    "finger2",
+]
+"""Rigid bodies of the SO-101 articulation (order as reported by the simulator)."""
+
+JOINT_NAMES = ["shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll", "gripper"]
+"""Joints of the SO-101 articulation."""
+
+
+class SyntheticArticulation:
+    """Random stand-in for ``isaaclab.assets.Articulation`` exposing the fields read by the task terms."""
+
+    def __init__(self, num_envs: int, env_origins: torch.Tensor, device: str):
+        self.body_names = list(BODY_NAMES)
+        self.joint_names = list(JOINT_NAMES)
+        self.num_bodies = len(BODY_NAMES)
+        self.num_joints = len(JOINT_NAMES)
+        self.data = SimpleNamespace(
+            body_pos_w=env_origins.unsqueeze(1) + 0.3 * torch.rand(num_envs, len(BODY_NAMES), 3, device=device),
+            joint_pos=torch.rand(num_envs, len(JOINT_NAMES), device=device) - 0.5,
+            joint_vel=torch.randn(num_envs, len(JOINT_NAMES), device=device),
+        )
+
+    def find_bodies(self, name_keys, preserve_order: bool = False):
+        return _find(self.body_names, name_keys, preserve_order)
+
+    def find_joints(self, name_keys, preserve_order: bool = False):
+        return _find(self.joint_names, name_keys, preserve_order)
+
+
+def _find(names: list[str], keys, preserve_order: bool):
+    # same regex matching semantics as isaaclab.utils.string.resolve_matching_names
+    keys = [keys] if isinstance(keys, str) else list(keys)
+    matches = []
+    for key_idx, key in enumerate(keys):
+        for idx, name in enumerate(names):
+            if re.fullmatch(key, name):
+                matches.append((key_idx if preserve_order else idx, idx, name))
+    matches.sort()
+    return [m[1] for m in matches], [m[2] for m in matches]
+
+
+class SyntheticRigidObject:
+    """Random stand-in for ``isaaclab.assets.RigidObject``: a root state buffer with the usual views."""
+
+    def __init__(self, num_envs: int, root_pos_w: torch.Tensor, device: str):
+        root_state_w = torch.zeros(num_envs, 13, device=device)
+        root_state_w[:, :3] = root_pos_w
+        root_state_w[:, 3] = 1.0
+        default_root_state = torch.zeros(num_envs, 13, device=device)
+        default_root_state[:, 3] = 1.0
+        self.data = SimpleNamespace(
+            root_state_w=root_state_w, root_pos_w=root_state_w[:, 0:3], default_root_state=default_root_state
+        )
+
+    def write_root_state_to_sim(self, root_state: torch.Tensor, env_ids=None):
+        env_ids = slice(None) if env_ids is None else env_ids
+        self.data.root_state_w[env_ids] = root_state
+
+
+class SyntheticEntityCfg:
+    """Stand-in for ``isaaclab.managers.SceneEntityCfg`` with the same body/joint resolution rules.
+
+    Names are resolved once by :meth:`resolve`; when the names select every body (joint) of the asset in order, the ids
+    collapse to ``slice(None)`` exactly like in Isaac Lab.
+    """
+
+    def __init__(self, name: str, joint_names=None, body_names=None, preserve_order: bool = False):
+        self.name = name
+        self.joint_names = joint_names
+        self.joint_ids = slice(None)
+        self.body_names = body_names
+        self.body_ids = slice(None)
+        self.preserve_order = preserve_order
+
+    def resolve(self, scene: SyntheticScene):
+        if self.name not in scene.keys():
+            raise ValueError(f"The scene entity '{self.name}' does not exist. Available entities: {scene.keys()}.")
+        entity = scene[self.name]
+        if self.joint_names is not None:
+            self.joint_ids, _ = entity.find_joints(self.joint_names, preserve_order=self.preserve_order)
+            if len(self.joint_ids) == entity.num_joints and self.joint_names == entity.joint_names:
+                self.joint_ids = slice(None)
+        if self.body_names is not None:
+            self.body_ids, _ = entity.find_bodies(self.body_names, preserve_order=self.preserve_order)
+            if len(self.body_ids) == entity.num_bodies and self.body_names == entity.body_names:
+                self.body_ids = slice(None)
+
+
+class SyntheticScene:
+    """Stand-in for ``isaaclab.scene.InteractiveScene``: entity lookup by name plus ``env_origins``."""
+
+    def __init__(self, env_origins: torch.Tensor, entities: dict):
+        self.env_origins = env_origins
+        self._entities = entities
+
+    def __getitem__(self, key: str):
+        return self._entities[key]
+
+    def keys(self) -> list[str]:
+        return list(self._entities.keys())
+
+
+class SyntheticRewardManager:
+    """Stand-in for ``isaaclab.managers.RewardManager``: term lookup only (the FirstRL-v0 reward terms)."""
+
+    def __init__(self):
+        rewards = import_task_module("mdp.rewards")
+        task_params = import_task_module("mdp.task_params")
+        self._terms = {
+            "transport_task": SimpleNamespace(
+                func=rewards.cube_transport_linear_reward, weight=task_params.TRANSPORT_REWARD_WEIGHT
+            ),
+        }
+        self.active_terms = list(self._terms)
+
+    def get_term_cfg(self, term_name: str) -> SimpleNamespace:
+        return self._terms[term_name]
+
+
+class SyntheticEnv:
+    """Minimal ``ManagerBasedRLEnv`` stand-in with random scene tensors.
+
+    Only the attributes read by the first_rl MDP terms are provided. :meth:`step` perturbs the scene in place and
+    advances the step counters, mimicking the data refresh between two control steps.
+    """
+
+    def __init__(self, num_envs: int, device: str = "cpu", seed: int = 0):
+        torch.manual_seed(seed)
+        self.num_envs = num_envs
+        self.device = device
+        self.common_step_counter = 0
+        self.max_episode_length = 200
+        self.step_dt = 0.1
+        self.max_episode_length_s = self.max_episode_length * self.step_dt
+
+        env_origins = torch.zeros(num_envs, 3, device=device)
+        env_origins[:, 0] = 2.5 * torch.arange(num_envs, device=device)
+        robot = SyntheticArticulation(num_envs, env_origins, device)
+        cube = SyntheticRigidObject(num_envs, env_origins + torch.tensor([0.0, 0.3, 0.526], device=device), device)
+        self.scene = SyntheticScene(env_origins, {"robot": robot, "cube": cube})
+
+        self.action_manager = SimpleNamespace(
+            action=torch.zeros(num_envs, len(JOINT_NAMES), device=device),
+            prev_action=torch.zeros(num_envs, len(JOINT_NAMES), device=device),
+        )
+        self.reward_manager = SyntheticRewardManager()
+        self.episode_length_buf = torch.zeros(num_envs, dtype=torch.long, device=device)
+        self.reset_buf = torch.zeros(num_envs, dtype=torch.bool, device=device)
+        task_params = import_task_module("mdp.task_params")
+        self.cfg = SimpleNamespace(
+            task_state=SimpleNamespace(
+                robot_cfg=SyntheticEntityCfg("robot", body_names=["finger1", "finger2"], joint_names=list(JOINT_NAMES)),
+                cube_cfg=SyntheticEntityCfg("cube"),
+                table_height=task_params.TABLE_HEIGHT,
+                cube_size=task_params.CUBE_SIZE,
+                timing_bins=task_params.TIMING_BINS,
+            )
+        )
+
+    def step(self):
+        """Perturb the scene tensors in place and advance the counters by one control step."""
+        robot = self.scene["robot"]
+        robot.data.body_pos_w.add_(0.001 * torch.randn_like(robot.data.body_pos_w))
+        robot.data.joint_pos.add_(0.01 * torch.randn_like(robot.data.joint_pos))
+        self.scene["cube"].data.root_pos_w.add_(0.001 * torch.randn_like(self.scene["cube"].data.root_pos_w))
+        self.action_manager.prev_action.copy_(self.action_manager.action)
+        self.action_manager.action.uniform_(-1.0, 1.0)
+        self.episode_length_buf += 1
+        self.common_step_counter += 1
+
+
+"""
+Step allocation check.
+"""
+
+
+def step_terms(env: SyntheticEnv, reward_components: bool = False) -> dict:
+    """Callables of the custom MDP terms of one control step in manager order (terminations, reward, observation).
+
+    The first one also rebuilds the task state of the step.
+    """
+    observations = import_task_module("mdp.observations")
+    rewards = import_task_module("mdp.rewards")
+    terminations = import_task_module("mdp.terminations")
+    return {
+        "task_success": lambda: terminations.task_success(env),
+        "task_fail_drop": lambda: terminations.task_fail_drop(env),
+        "cube_out_of_table": lambda: terminations.cube_out_of_table(env),
+        "task_time_out": lambda: terminations.task_time_out(env),
+        "cube_transport_linear_reward": lambda: rewards.cube_transport_linear_reward(
+            env, **TRANSPORT_REWARD_PARAMS, log_components=reward_components
+        ),
+        "get_custom_scene_obs": lambda: observations.get_custom_scene_obs(env),
+    }
+
+
+def count_step_allocations(env: SyntheticEnv, terms: dict, warmup: int, steps: int) -> tuple[dict[str, int], int]:
+    """Step ``env`` and call ``terms`` every step; count the tensor allocations of the ``steps`` steps after ``warmup``.
+
+    Returns:
+        The ATen-level allocations of each term (:class:`OpCounter`) and, on CUDA, the growth of the caching
+        allocator's allocation count (``allocation.all.allocated``) over the checked steps (0 on the CPU). The scene
+        refresh of the synthetic env itself is not counted.
+    """
+    use_cuda = str(env.device).startswith("cuda")
+    allocations = {name: 0 for name in terms}
+    allocator_growth = 0
+    for i in range(warmup + steps):
+        env.step()
+        checked = i >= warmup
+        if use_cuda:
+            torch.cuda.synchronize()
+            allocated_before = torch.cuda.memory_stats()["allocation.all.allocated"]
+        for name, fn in terms.items():
+            counter = count_ops(fn)
+            if checked:
+                allocations[name] += counter.allocations
+        if use_cuda:
+            torch.cuda.synchronize()
+            if checked:
+                allocator_growth += torch.cuda.memory_stats()["allocation.all.allocated"] - allocated_before
+    return allocations, allocator_growth
@@ -0,0 +1,57 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Check that the custom MDP terms of FirstRL-v0 allocate no tensors in steady state.
+
+The script steps :class:`bench_utils.SyntheticEnv` and calls the terms in the order of the managers of one control step
+(terminations, reward, observation). After ``--warmup`` steps, every term must issue zero fresh tensor allocations per
+call, counted at the ATen level with :class:`bench_utils.OpCounter`. On CUDA the caching allocator's allocation count
+(``allocation.all.allocated`` of :func:`torch.cuda.memory_stats`) must not grow either. The scene refresh of the
+synthetic env itself is not part of the check. ``--reward_components`` checks the reward with component logging enabled.
+
+Exits with status 1 when an allocation is found. ``tests/test_step_allocations.py`` runs the same check on the CPU.
+
+.. code-block:: bash
+
+    python scripts/benchmarks/check_step_allocations.py --num_envs 4096 --device cuda
+
+"""
+
+import argparse
+import sys
+
+from bench_utils import SyntheticEnv, count_step_allocations, step_terms  # isort: skip
+
+parser = argparse.ArgumentParser(description="Check that the custom MDP terms are allocation-free in steady state.")
+parser.add_argument("--num_envs", type=int, default=1024, help="Number of environments.")
+parser.add_argument("--device", type=str, default="cpu", help="Torch device.")
+parser.add_argument("--warmup", type=int, default=3, help="Control steps before the check starts.")
+parser.add_argument("--steps", type=int, default=20, help="Checked control steps.")
+parser.add_argument(
+    "--reward_components", action="store_true", default=False, help="Check the reward with component logging enabled."
+)
+args_cli = parser.parse_args()
+
+
+def main():
+    use_cuda = args_cli.device.startswith("cuda")
+    env = SyntheticEnv(args_cli.num_envs, device=args_cli.device)
+    terms = step_terms(env, reward_components=args_cli.reward_components)
+    allocations, allocator_growth = count_step_allocations(env, terms, args_cli.warmup, args_cli.steps)
+
+    print(f"[INFO] Device: {args_cli.device}, num_envs: {args_cli.num_envs}, checked steps: {args_cli.steps}")
+    for name, count in allocations.items():
+        print(f"{name:>28}: {count / args_cli.steps:.1f} allocations/step")
+    if use_cuda:
+        print(f"{'caching allocator':>28}: {allocator_growth / args_cli.steps:.1f} allocations/step")
+
+    if any(allocations.values()) or allocator_growth:
+        print("[CHECK] FAILED: the step path allocates new tensors.")
+        sys.exit(1)
+    print("[CHECK] OK: no tensor allocations in steady state.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""End-to-end PPO smoke test of FirstRL-v0 on the kinematic stand-in backend (no Isaac Sim, no GPU needed).
+
+The environment runs the task's own MDP terms on SO-101 forward kinematics and is wrapped for RSL-RL with a wrapper that
+behaves like ``RslRlVecEnvWrapper``. Training uses RSL-RL's ``OnPolicyRunner`` with the hyper-parameters of
+``PPORunnerCfg`` (see :data:`AGENT_CFG`).
+
+.. code-block:: bash
+
+    python scripts/benchmarks/kinematic_train.py --num_envs 64 --max_iterations 5
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import torch
+from rsl_rl.runners import OnPolicyRunner
+
+from bench_utils import import_task_module  # isort: skip
+
+# the logging helpers of the RSL-RL scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "rsl_rl"))
+import bc_pretrain  # isort: skip
+import failure_recorder  # isort: skip
+import task_log  # isort: skip
+import trajectory_recorder  # isort: skip
+
+parser = argparse.ArgumentParser(description="PPO smoke test on the kinematic stand-in environment.")
+parser.add_argument("--num_envs", type=int, default=64, help="Number of environments.")
+parser.add_argument("--device", type=str, default="cpu", help="Torch device for the environment and the policy.")
+parser.add_argument("--max_iterations", type=int, default=5, help="PPO iterations.")
+parser.add_argument("--seed", type=int, default=42, help="Seed used for the environment and the policy.")
+parser.add_argument(
+    "--log", action="store_true", default=False, help="Keep TensorBoard logs and checkpoints under logs/rsl_rl."
+)
+parser.add_argument(
+    "--reward_components", action="store_true", default=False, help="Log the components of the transport reward."
+)
+parser.add_argument(
+    "--record_trajectories", type=str, default=None, help="Record the rollouts into memory-mapped shards here."
+)
+parser.add_argument(
+    "--record_failures", type=str, default=None, help="Dump the last steps of the failed episodes here."
+)
+bc_pretrain.add_bc_args(parser)
+args_cli = parser.parse_args()
+
+kinematic = import_task_module("kinematic")
+vec_env = import_task_module("kinematic.vec_env")
+task_state = import_task_module("mdp.task_state")
+
+AGENT_CFG = {
+    "class_name": "OnPolicyRunner",
+    "seed": 42,
+    "num_steps_per_env": 32,
+    "max_iterations": 5000,
+    "save_interval": 50,
+    "experiment_name": "cube_transport_task_kinematic",
+    "run_name": "",
+    "logger": "tensorboard",
+    "obs_groups": {"policy": ["policy"], "critic": ["policy"]},
+    "clip_actions": None,
+    "policy": {
+        "class_name": "ActorCritic",
+        "init_noise_std": 1.0,
+        "noise_std_type": "scalar",
+        "actor_obs_normalization": True,
+        "critic_obs_normalization": True,
+        "actor_hidden_dims": [256, 128, 64],
+        "critic_hidden_dims": [256, 128, 64],
+        "activation": "elu",
+    },
+    "algorithm": {
+        "class_name": "PPO",
+        "value_loss_coef": 1.0,
+        "use_clipped_value_loss": True,
+        "clip_param": 0.2,
+        "entropy_coef": 0.002,
+        "num_learning_epochs": 5,
+        "num_mini_batches": 32,
+        "learning_rate": 5e-4,
+        "schedule": "adaptive",
+        "gamma": 0.98,
+        "lam": 0.95,
+        "desired_kl": 0.01,
+        "max_grad_norm": 1.0,
+        "normalize_advantage_per_mini_batch": False,
+        "rnd_cfg": None,
+        "symmetry_cfg": None,
+    },
+}
+"""Runner configuration mirroring ``agents/rsl_rl_ppo_cfg.py:PPORunnerCfg`` (``PPORunnerCfg().to_dict()``)."""
+
+
+def main():
+    agent_cfg = dict(AGENT_CFG, seed=args_cli.seed, max_iterations=args_cli.max_iterations)
+    # keep at least one sample per mini-batch for tiny smoke-test sizes
+    num_samples = args_cli.num_envs * agent_cfg["num_steps_per_env"]
+    agent_cfg["algorithm"] = dict(
+        agent_cfg["algorithm"], num_mini_batches=min(agent_cfg["algorithm"]["num_mini_batches"], num_samples)
+    )
+
+    env_cfg = kinematic.KinematicEnvCfg(num_envs=args_cli.num_envs, device=args_cli.device, seed=args_cli.seed)
+    env_cfg.rewards["transport_task"].params["log_components"] = args_cli.reward_components
+    env = vec_env.KinematicVecEnvWrapper(kinematic.KinematicRLEnv(env_cfg), clip_actions=agent_cfg["clip_actions"])
+    if args_cli.record_trajectories:
+        env = trajectory_recorder.TrajectoryRecorder(
+            env,
+            args_cli.record_trajectories,
+            reason_names=[reason.name.lower() for reason in task_state.TerminationReason],
+        )
+    if args_cli.record_failures:
+        env = failure_recorder.FailureRecorder(
+            env,
+            args_cli.record_failures,
+            reason_names=[reason.name.lower() for reason in task_state.TerminationReason],
+        )
+
+    # OnPolicyRunner.learn stores the code state into log_dir unconditionally, so a throw-away directory is used
+    # unless the logs are requested
+    tmp_dir = None
+    if args_cli.log:
+        log_root_path = os.path.abspath(os.path.join("logs", "rsl_rl", agent_cfg["experiment_name"]))
+        log_dir = os.path.join(log_root_path, datetime.now().strftime("%Y-%m-%d_%H-%M-%S"))
+    else:
+        tmp_dir = tempfile.TemporaryDirectory(prefix="kinematic_train_")
+        log_dir = tmp_dir.name
+    print(f"[INFO] Logging experiment in directory: {log_dir}")
+
+    runner = OnPolicyRunner(env, agent_cfg, log_dir=log_dir, device=args_cli.device)
+    task_log.attach_task_log(env, runner)
+    if args_cli.bc_demos:
+        policy = runner.alg.policy
+        demo_loader = bc_pretrain.DemoLoader(
+            args_cli.bc_demos,
+            obs_fields=[f"obs_{group}" for group in policy.obs_groups["policy"]],
+            batch_size=args_cli.bc_batch_size,
+            success_only=args_cli.bc_success_only,
+            device=args_cli.device,
+            seed=args_cli.seed,
+        )
+        bc_pretrain.pretrain_actor(
+            policy,
+            demo_loader,
+            args_cli.bc_epochs,
+            learning_rate=args_cli.bc_learning_rate,
+            clip_actions=agent_cfg["clip_actions"],
+            noise_std=args_cli.bc_noise_std,
+        )
+
+    start_time = time.time()
+    runner.learn(num_learning_iterations=agent_cfg["max_iterations"], init_at_random_ep_len=True)
+    elapsed = time.time() - start_time
+
+    steps = agent_cfg["max_iterations"] * num_samples
+    print(f"[INFO] Training time: {elapsed:.2f} s ({steps / elapsed:.0f} env-steps/s incl. PPO updates)")
+    if not torch.isfinite(next(runner.alg.policy.parameters())).all():
+        raise RuntimeError("Policy parameters became non-finite during the smoke test.")
+    env.close()
+    if tmp_dir is not None:
+        tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""NumPy-only runtime of the exported actor MLP (``exported/policy.npz``).
+
+:func:`export_policy_as_npz` has the signature of Isaac Lab's ``export_policy_as_jit`` and writes the weights of the
+actor's linear layers, its activation and the statistics of the observation normalizer to an uncompressed ``.npz``.
+:class:`NumpyActor` evaluates it with NumPy alone: no torch import, and every intermediate result is written into
+work buffers allocated once for ``max_batch`` observations. The normalization is the one of rsl_rl's
+``EmpiricalNormalization``, ``(obs - mean) / (std + eps)``.
+
+.. code-block:: python
+
+    actor = NumpyActor("logs/rsl_rl/cube_transport_task/<run>/exported/policy.npz")
+    actions = actor(obs)  # (n, obs_dim) float32 -> (n, action_dim), a view of a work buffer
+
+"""
+
+import os
+
+import numpy as np
+
+NPZ_FORMAT = 1
+"""Version of the ``.npz`` layout, stored in the file and checked on load."""
+
+ACTIVATIONS = ("elu", "relu", "tanh", "identity")
+"""Activations the runtime implements (lower-case class names of the torch modules)."""
+
+
+def export_policy_as_npz(policy, normalizer=None, path: str = ".", filename: str = "policy.npz"):
+    """Write the actor MLP of ``policy`` and the normalizer statistics to ``path/filename``.
+
+    Args:
+        policy: The actor-critic module; its ``actor`` must be a ``Sequential`` of linear layers and activations.
+        normalizer: The observation normalizer. Only an ``EmpiricalNormalization`` (a module with ``mean`` and ``std``)
+            is stored; None or ``nn.Identity`` (rsl_rl without observation normalization) export no normalization.
+        path: Output directory.
+        filename: Output file name.
+    """
+    if getattr(policy, "is_recurrent", False):
+        raise ValueError("The NumPy runtime only supports feed-forward actors.")
+    arrays = {"format": np.array(NPZ_FORMAT)}
+    activation = "identity"
+    num_layers = 0
+    for module in policy.actor:
+        name = type(module).__name__.lower()
+        if name == "linear":
+            arrays[f"weight_{num_layers}"] = module.weight.detach().cpu().float().numpy()
+            arrays[f"bias_{num_layers}"] = module.bias.detach().cpu().float().numpy()
+            num_layers += 1
+        elif name in ACTIVATIONS:
+            # all hidden layers of an rsl_rl MLP share one activation
+            activation = name
+        else:
+            raise ValueError(f"Unsupported actor layer for the NumPy runtime: {type(module).__name__}")
+    arrays["activation"] = np.array(activation)
+
+    obs_dim = arrays["weight_0"].shape[1]
+    if hasattr(normalizer, "mean"):
+        arrays["obs_mean"] = normalizer.mean.detach().cpu().float().numpy().reshape(obs_dim)
+        arrays["obs_std"] = normalizer.std.detach().cpu().float().numpy().reshape(obs_dim)
+        arrays["obs_eps"] = np.array(normalizer.eps, dtype=np.float32)
+
+    os.makedirs(path, exist_ok=True)
+    np.savez(os.path.join(path, filename), **arrays)
+
+
+class NumpyActor:
+    """Evaluates an actor exported by :func:`export_policy_as_npz` with preallocated NumPy buffers.
+
+    The returned actions are a view of a work buffer and are overwritten by the next call; copy them if they must be
+    kept. Batches larger than ``max_batch`` grow the buffers once.
+
+    Args:
+        path: The ``.npz`` file.
+        max_batch: Number of observations the work buffers are allocated for.
+    """
+
+    def __init__(self, path: str, max_batch: int = 1):
+        with np.load(path) as data:
+            if int(data["format"]) != NPZ_FORMAT:
+                raise ValueError(f"Unsupported policy.npz format {int(data['format'])} (expected {NPZ_FORMAT}): {path}")
+            num_layers = sum(1 for key in data.files if key.startswith("weight_"))
+            # weights stored as (in, out) so that every layer is one matmul into its buffer
+            self.weights = [np.ascontiguousarray(data[f"weight_{i}"].T, dtype=np.float32) for i in range(num_layers)]
+            self.biases = [data[f"bias_{i}"].astype(np.float32) for i in range(num_layers)]
+            self.activation = str(data["activation"])
+            self.obs_dim = self.weights[0].shape[0]
+            self.action_dim = self.weights[-1].shape[1]
+            if "obs_mean" in data.files:
+                self.obs_mean = data["obs_mean"].astype(np.float32)
+                self.obs_denom = (data["obs_std"] + data["obs_eps"]).astype(np.float32)
+            else:
+                self.obs_mean = self.obs_denom = None
+        if self.activation not in ACTIVATIONS:
+            raise ValueError(f"Unsupported activation: {self.activation}")
+        self._allocate(max_batch)
+
+    def __call__(self, obs: np.ndarray) -> np.ndarray:
+        """Actions (n, action_dim) for the observations (n, obs_dim)."""
+        n = obs.shape[0]
+        if n > self.max_batch:
+            self._allocate(n)
+        x = obs
+        if self.obs_mean is not None:
+            x = self._obs[:n]
+            np.subtract(obs, self.obs_mean, out=x)
+            np.divide(x, self.obs_denom, out=x)
+        last = len(self.weights) - 1
+        for i, (weight, bias) in enumerate(zip(self.weights, self.biases)):
+            h = self._hidden[i][:n]
+            np.matmul(x, weight, out=h)
+            np.add(h, bias, out=h)
+            if i < last:
+                self._activate(h, self._neg[i][:n])
+            x = h
+        return x
+
+    """
+    Internal helpers.
+    """
+
+    def _allocate(self, max_batch: int):
+        self.max_batch = max_batch
+        self._obs = np.empty((max_batch, self.obs_dim), dtype=np.float32)
+        self._hidden = [np.empty((max_batch, w.shape[1]), dtype=np.float32) for w in self.weights]
+        # scratch for the negative branch of the ELU
+        self._neg = [np.empty_like(h) if self.activation == "elu" else None for h in self._hidden]
+
+    def _activate(self, h: np.ndarray, neg: np.ndarray | None):
+        if self.activation == "elu":
+            # elu(x) = max(x, 0) + expm1(min(x, 0))
+            np.minimum(h, 0.0, out=neg)
+            np.expm1(neg, out=neg)
+            np.maximum(h, 0.0, out=h)
+            np.add(h, neg, out=h)
+        elif self.activation == "relu":
+            np.maximum(h, 0.0, out=h)
+        elif self.activation == "tanh":
+            np.tanh(h, out=h)
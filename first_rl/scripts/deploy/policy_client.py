@@ -0,0 +1,120 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Client of ``policy_server.py`` and a load generator standing in for the robot controllers.
+
+:class:`PolicyClient` sends observation vectors and returns the actions. Run as a script, ``--clients`` threads each
+open a connection and send ``--requests`` random observations back to back; the round-trip p50/p99 latency and the
+throughput are printed. With ``--check`` the actions are compared against the policy evaluated locally.
+
+.. code-block:: bash
+
+    python scripts/deploy/policy_client.py --port 5555 --clients 8 --requests 2000
+    python scripts/deploy/policy_client.py --port 5555 --check logs/rsl_rl/cube_transport_task/<run>/exported/policy.pt
+
+"""
+
+import argparse
+import socket
+import struct
+import threading
+import time
+
+import numpy as np
+
+HEADER = struct.Struct("<II")
+COUNT = struct.Struct("<I")
+
+
+class PolicyClient:
+    """One connection to the policy server.
+
+    Args:
+        port: TCP port of the server (ignored if ``unix`` is given).
+        host: Address of the server.
+        unix: Path of the server's Unix domain socket.
+    """
+
+    def __init__(self, port: int = 5555, host: str = "127.0.0.1", unix: str | None = None):
+        if unix:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.connect(unix)
+        else:
+            self.sock = socket.create_connection((host, port))
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.obs_dim, self.action_dim = HEADER.unpack(self._recv(HEADER.size))
+
+    def act(self, obs: np.ndarray) -> np.ndarray:
+        """Actions for one observation (obs_dim,) or a batch (n, obs_dim)."""
+        obs = np.ascontiguousarray(obs, dtype=np.float32)
+        batch = obs.reshape(-1, self.obs_dim)
+        self.sock.sendall(COUNT.pack(len(batch)) + batch.tobytes())
+        actions = np.frombuffer(self._recv(len(batch) * self.action_dim * 4), dtype=np.float32)
+        return actions.reshape(len(batch), self.action_dim) if obs.ndim == 2 else actions
+
+    def close(self):
+        self.sock.close()
+
+    def _recv(self, size: int) -> bytes:
+        buf = bytearray(size)
+        view = memoryview(buf)
+        received = 0
+        while received < size:
+            n = self.sock.recv_into(view[received:])
+            if n == 0:
+                raise ConnectionError("The policy server closed the connection.")
+            received += n
+        return bytes(buf)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for the policy server.")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Address of the server.")
+    parser.add_argument("--port", type=int, default=5555, help="TCP port of the server.")
+    parser.add_argument("--unix", type=str, default=None, help="Unix domain socket of the server.")
+    parser.add_argument("--clients", type=int, default=4, help="Concurrent connections.")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per connection.")
+    parser.add_argument("--check", type=str, default=None, help="Exported policy to compare the actions against.")
+    args_cli = parser.parse_args()
+
+    latencies = [[] for _ in range(args_cli.clients)]
+    errors = []
+
+    def run_client(i: int):
+        client = PolicyClient(args_cli.port, args_cli.host, args_cli.unix)
+        rng = np.random.default_rng(i)
+        obs = rng.standard_normal((args_cli.requests, client.obs_dim), dtype=np.float32)
+        actions = np.empty((args_cli.requests, client.action_dim), dtype=np.float32)
+        for j in range(args_cli.requests):
+            start = time.perf_counter()
+            actions[j] = client.act(obs[j])
+            latencies[i].append(time.perf_counter() - start)
+        client.close()
+        if args_cli.check:
+            from policy_server import load_policy
+
+            expected = load_policy(args_cli.check)(obs)
+            errors.append(float(np.abs(actions - expected).max()))
+
+    threads = [threading.Thread(target=run_client, args=(i,)) for i in range(args_cli.clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    all_latencies = np.concatenate([np.array(lat) for lat in latencies])
+    p50, p99 = np.percentile(all_latencies, [50, 99]) * 1e6
+    print(
+        f"[INFO] {len(all_latencies)} requests from {args_cli.clients} clients in {elapsed:.2f} s"
+        f" ({len(all_latencies) / elapsed:.0f} requests/s), round trip p50 {p50:.0f} us, p99 {p99:.0f} us"
+    )
+    if errors:
+        print(f"[INFO] Max action deviation from the local policy: {max(errors):.3e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Standalone CPU inference server for an exported FirstRL-v0 policy.
+
+The server loads ``exported/policy.pt`` (TorchScript, also the ``policy_<int8|fp16|bf16>.pt`` variants),
+``exported/policy.onnx`` (needs ``onnxruntime``) or ``exported/policy.npz`` (NumPy only, see ``numpy_actor.py``) without
+Isaac Lab or Omniverse, listens on a local TCP port or a Unix domain socket, and answers observation vectors with
+actions. Requests arriving within ``--max_wait_us`` of each other (up to ``--max_batch``) are stacked and run as one
+batch. The p50/p99 latency (request received to response sent) is printed every ``--report_interval`` seconds and on
+exit.
+
+Wire protocol (little-endian): on connect, the server sends ``uint32 obs_dim, uint32 action_dim``. A request is
+``uint32 n`` followed by ``n * obs_dim`` float32 values (``n`` observations); the response is ``n * action_dim``
+float32 values. A request with ``n == 0`` or ``n`` above ``--max_request`` is rejected by closing the connection, before
+its payload is read. See ``policy_client.py`` for a client and a load generator.
+
+.. code-block:: bash
+
+    python scripts/deploy/policy_server.py logs/rsl_rl/cube_transport_task/<run>/exported/policy.pt --port 5555
+
+"""
+
+import time
+
+START_TIME = time.perf_counter()
+
+import argparse
+import os
+import queue
+import signal
+import socket
+import struct
+import sys
+import threading
+
+import numpy as np
+
+# local imports
+from numpy_actor import NumpyActor  # isort: skip
+
+parser = argparse.ArgumentParser(description="Serve an exported policy over a local socket.")
+parser.add_argument("policy", type=str, help="Exported policy: policy.pt (TorchScript), policy.onnx or policy.npz.")
+parser.add_argument("--host", type=str, default="127.0.0.1", help="Address to listen on.")
+parser.add_argument("--port", type=int, default=5555, help="TCP port to listen on.")
+parser.add_argument("--unix", type=str, default=None, help="Listen on this Unix domain socket instead of TCP.")
+parser.add_argument("--max_batch", type=int, default=64, help="Maximum number of observations per forward pass.")
+parser.add_argument(
+    "--max_wait_us", type=int, default=200, help="How long the first request of a batch waits for more requests."
+)
+parser.add_argument(
+    "--max_request",
+    type=int,
+    default=None,
+    help="Most observations accepted in one request (default: 16 * --max_batch); larger requests close the connection.",
+)
+parser.add_argument("--threads", type=int, default=1, help="CPU threads of the torch / onnxruntime backends.")
+parser.add_argument("--report_interval", type=float, default=10.0, help="Seconds between latency reports (0: off).")
+
+HEADER = struct.Struct("<II")
+COUNT = struct.Struct("<I")
+
+
+class TorchScriptPolicy:
+    """TorchScript policy exported by ``export_policy_as_jit`` (normalizer + actor)."""
+
+    def __init__(self, path: str, threads: int):
+        import torch
+
+        torch.set_num_threads(threads)
+        self._torch = torch
+        self.module = torch.jit.load(path, map_location="cpu").eval()
+        if hasattr(self.module, "obs_dim"):
+            # reduced-precision variants store their sizes (the int8 weights are not parameters)
+            self.obs_dim, self.action_dim = self.module.obs_dim, self.module.action_dim
+        else:
+            # the first and last weight matrices are those of the first and last linear layers of the actor
+            weights = [p for p in self.module.parameters() if p.dim() == 2]
+            self.obs_dim = weights[0].shape[1]
+            self.action_dim = weights[-1].shape[0]
+
+    def __call__(self, obs: np.ndarray) -> np.ndarray:
+        with self._torch.inference_mode():
+            return self.module(self._torch.from_numpy(obs)).numpy()
+
+
+class OnnxPolicy:
+    """ONNX policy exported by ``export_policy_as_onnx``, run with onnxruntime."""
+
+    def __init__(self, path: str, threads: int):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+        self.obs_dim = self.session.get_inputs()[0].shape[1]
+        self.action_dim = self.session.get_outputs()[0].shape[1]
+
+    def __call__(self, obs: np.ndarray) -> np.ndarray:
+        return self.session.run(None, {self.input_name: obs})[0]
+
+
+def load_policy(path: str, threads: int = 1, max_batch: int = 1):
+    """Load an exported policy by its file extension."""
+    ext = os.path.splitext(path)[1]
+    if ext == ".npz":
+        return NumpyActor(path, max_batch)
+    if ext == ".pt":
+        return TorchScriptPolicy(path, threads)
+    if ext == ".onnx":
+        return OnnxPolicy(path, threads)
+    raise ValueError(f"Unsupported policy file: {path}")
+
+
+class LatencyStats:
+    """Latencies (seconds) of the requests since the last report."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies: list[float] = []
+        self._batches: list[int] = []
+
+    def add(self, latencies: list[float], batch_size: int):
+        with self._lock:
+            self._latencies.extend(latencies)
+            self._batches.append(batch_size)
+
+    def report(self, title: str):
+        with self._lock:
+            latencies, self._latencies = np.array(self._latencies), []
+            batches, self._batches = np.array(self._batches), []
+        if len(latencies) == 0:
+            return
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1e6
+        print(
+            f"[INFO] {title}: {len(latencies)} requests, {len(batches)} batches (mean size {batches.mean():.1f}),"
+            f" latency p50 {p50:.0f} us, p99 {p99:.0f} us"
+        )
+
+
+class MicroBatcher:
+    """Collects concurrent requests and runs them through the policy as one batch."""
+
+    def __init__(self, policy, max_batch: int, max_wait_us: int, stats: LatencyStats):
+        self.policy = policy
+        self.max_batch = max_batch
+        self.max_wait = max_wait_us * 1e-6
+        self.stats = stats
+        self.requests: queue.Queue = queue.Queue()
+        self._obs = np.zeros((max_batch, policy.obs_dim), dtype=np.float32)
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, obs: np.ndarray, received: float) -> np.ndarray:
+        """Run ``obs`` (n, obs_dim) through the policy and wait for the actions."""
+        done = threading.Event()
+        request = [obs, received, done, None]
+        self.requests.put(request)
+        done.wait()
+        return request[3]
+
+    def _run(self):
+        while True:
+            batch = [self.requests.get()]
+            size = len(batch[0][0])
+            deadline = time.perf_counter() + self.max_wait
+            while size < self.max_batch:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self.requests.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                batch.append(request)
+                size += len(request[0])
+            self._process(batch, size)
+
+    def _process(self, batch: list, size: int):
+        # stack into the preallocated input unless a single request already exceeds it
+        obs = self._obs[:size] if size <= self.max_batch else np.empty((size, self.policy.obs_dim), np.float32)
+        start = 0
+        for request in batch:
+            obs[start : start + len(request[0])] = request[0]
+            start += len(request[0])
+        actions = self.policy(obs)
+        start = 0
+        now = time.perf_counter()
+        for request in batch:
+            request[3] = actions[start : start + len(request[0])].copy()
+            start += len(request[0])
+            request[2].set()
+        self.stats.add([now - request[1] for request in batch], size)
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes | None:
+    buf = bytearray(size)
+    view = memoryview(buf)
+    received = 0
+    while received < size:
+        n = conn.recv_into(view[received:])
+        if n == 0:
+            return None
+        received += n
+    return bytes(buf)
+
+
+def serve_connection(conn: socket.socket, batcher: MicroBatcher, max_request: int):
+    """Answer the requests of one client until it disconnects or sends an invalid observation count."""
+    policy = batcher.policy
+    with conn:
+        conn.sendall(HEADER.pack(policy.obs_dim, policy.action_dim))
+        while True:
+            header = _recv_exact(conn, COUNT.size)
+            if header is None:
+                return
+            (n,) = COUNT.unpack(header)
+            if n == 0 or n > max_request:
+                print(f"[WARN] Closing a connection that requested {n} observations (1 to {max_request} allowed).")
+                return
+            payload = _recv_exact(conn, n * policy.obs_dim * 4)
+            if payload is None:
+                return
+            received = time.perf_counter()
+            obs = np.frombuffer(payload, dtype=np.float32).reshape(n, policy.obs_dim)
+            conn.sendall(batcher.submit(obs, received).astype(np.float32, copy=False).tobytes())
+
+
+def main():
+    args_cli = parser.parse_args()
+    policy = load_policy(args_cli.policy, args_cli.threads, args_cli.max_batch)
+    # first call outside the measurements (lazy initialization of the backend)
+    policy(np.zeros((1, policy.obs_dim), dtype=np.float32))
+    stats = LatencyStats()
+    batcher = MicroBatcher(policy, args_cli.max_batch, args_cli.max_wait_us, stats)
+    max_request = args_cli.max_request or 16 * args_cli.max_batch
+
+    if args_cli.unix:
+        if os.path.exists(args_cli.unix):
+            os.remove(args_cli.unix)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(args_cli.unix)
+        address = args_cli.unix
+    else:
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind((args_cli.host, args_cli.port))
+        address = f"{args_cli.host}:{args_cli.port}"
+    server.listen()
+    print(
+        f"[INFO] Serving {args_cli.policy} (obs {policy.obs_dim}, actions {policy.action_dim}) on {address},"
+        f" ready after {time.perf_counter() - START_TIME:.3f} s",
+        flush=True,
+    )
+
+    if args_cli.report_interval > 0:
+
+        def report_loop():
+            while True:
+                time.sleep(args_cli.report_interval)
+                stats.report("Last interval")
+
+        threading.Thread(target=report_loop, daemon=True).start()
+
+    # stop on SIGTERM as on Ctrl-C (the final latency report is printed in both cases)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        while True:
+            conn, _ = server.accept()
+            if conn.family == socket.AF_INET:
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=serve_connection, args=(conn, batcher, max_request), daemon=True).start()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stats.report("Since the last report")
+        server.close()
+        if args_cli.unix and os.path.exists(args_cli.unix):
+            os.remove(args_cli.unix)
+
+
+if __name__ == "__main__":
+    main()
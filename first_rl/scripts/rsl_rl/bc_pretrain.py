@@ -0,0 +1,220 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Behavior-cloning warm start of the PPO actor from recorded demonstrations.
+
+The demonstrations are trajectory datasets in the layout of ``trajectory_recorder.py`` (``train.py`` / ``play.py
+--record_trajectories``, teleoperation sessions of ``test.py``, scripted runs). :class:`DemoLoader` never loads a
+dataset as a whole: the shards are split into chunks of about ``chunk_size`` transitions, visited in random order
+every epoch. A background thread reads the next chunks from the read-only memory maps into (pinned) host memory
+while the current one is trained on, so datasets larger than the RAM work and the disk reads overlap the updates.
+Transitions are shuffled within a chunk.
+
+:func:`pretrain_actor` regresses the mean action of the actor on the demonstrated actions (MSE). With actor
+observation normalization, the normalizer statistics are fitted on the demonstrations during the first epoch, as
+PPO does on its rollouts. The critic is left untouched; PPO fits it from the first iteration on.
+"""
+
+from __future__ import annotations
+
+import argparse
+import queue
+import random
+import threading
+import time
+
+import numpy as np
+import torch
+
+from trajectory_recorder import TrajectoryDataset  # isort: skip
+
+
+def add_bc_args(parser: argparse.ArgumentParser):
+    """Add the behavior-cloning arguments to the parser."""
+    arg_group = parser.add_argument_group("bc", description="Behavior-cloning warm start of the actor.")
+    arg_group.add_argument(
+        "--bc_demos", type=str, nargs="+", default=None, help="Trajectory datasets to pretrain the actor on."
+    )
+    arg_group.add_argument("--bc_epochs", type=int, default=10, help="Passes over the demonstrations.")
+    arg_group.add_argument("--bc_batch_size", type=int, default=4096, help="Transitions per gradient step.")
+    arg_group.add_argument("--bc_learning_rate", type=float, default=1e-3, help="Adam learning rate of the actor.")
+    arg_group.add_argument(
+        "--bc_success_only",
+        action="store_true",
+        default=False,
+        help="Only clone the transitions of episodes that end with success.",
+    )
+    arg_group.add_argument(
+        "--bc_noise_std", type=float, default=None, help="Action noise std of the policy after the pretraining."
+    )
+
+
+def episode_end_reasons(dataset: TrajectoryDataset) -> list[np.ndarray]:
+    """Per shard, the termination reason of the episode each transition belongs to (0 while not terminated).
+
+    Scans the ``dones`` and ``reasons`` fields backwards; episodes still running at the end of the recording keep 0.
+    """
+    if "reasons" not in dataset.fields:
+        raise ValueError(f"The dataset has no termination reasons: {dataset.path}")
+    outcome = np.zeros(dataset.num_envs, dtype=np.int8)
+    per_shard = [None] * dataset.num_shards
+    for index in reversed(range(dataset.num_shards)):
+        shard = dataset.shard(index)
+        dones, reasons = np.asarray(shard["dones"]).astype(bool), np.asarray(shard["reasons"])
+        out = np.empty_like(reasons)
+        for t in reversed(range(len(dones))):
+            np.copyto(outcome, reasons[t], where=dones[t])
+            out[t] = outcome
+        per_shard[index] = out
+    return per_shard
+
+
+class DemoLoader:
+    """Shuffled mini-batches of ``(obs, actions)`` streamed from trajectory datasets.
+
+    Args:
+        paths: Dataset directories.
+        obs_fields: Observation fields concatenated into the actor input (``obs_<group>`` of the actor groups).
+        batch_size: Transitions per batch.
+        chunk_size: Transitions read from disk at once (rounded to whole steps).
+        prefetch: Chunks read ahead by the background thread.
+        success_only: Only keep the transitions of episodes that end with ``success``.
+        device: Device of the batches.
+        seed: Seed of the chunk order and the shuffling.
+    """
+
+    def __init__(
+        self,
+        paths: list[str],
+        obs_fields: list[str],
+        batch_size: int = 4096,
+        chunk_size: int = 262144,
+        prefetch: int = 2,
+        success_only: bool = False,
+        device: str = "cpu",
+        seed: int = 0,
+    ):
+        self.obs_fields = obs_fields
+        self.batch_size = batch_size
+        self.prefetch = prefetch
+        self.device = device
+        self._pin = torch.device(device).type == "cuda"
+        self._rng = random.Random(seed)
+        self._generator = torch.Generator(device=device).manual_seed(seed)
+        self.datasets = [TrajectoryDataset(path) for path in paths]
+        # (dataset, shard, first step, last step) of every chunk
+        self._chunks: list[tuple[int, int, int, int]] = []
+        self._masks: list[list[np.ndarray] | None] = []
+        self.num_transitions = 0
+        for d, dataset in enumerate(self.datasets):
+            missing = [name for name in obs_fields + ["actions"] if name not in dataset.fields]
+            if missing:
+                raise ValueError(f"The dataset {dataset.path} has no fields {missing}.")
+            if success_only:
+                success = dataset.manifest["reason_names"].index("success")
+                masks = [reasons == success for reasons in episode_end_reasons(dataset)]
+                self.num_transitions += sum(int(mask.sum()) for mask in masks)
+            else:
+                masks = None
+                self.num_transitions += len(dataset) * dataset.num_envs
+            self._masks.append(masks)
+            chunk_steps = max(1, chunk_size // dataset.num_envs)
+            for s, info in enumerate(dataset.manifest["shards"]):
+                for start in range(0, info["steps"], chunk_steps):
+                    self._chunks.append((d, s, start, min(start + chunk_steps, info["steps"])))
+        if self.num_transitions == 0:
+            raise ValueError(f"No demonstration transitions in: {paths}")
+
+    def __iter__(self):
+        """One epoch: the chunks in random order, the batches of each chunk shuffled."""
+        order = list(self._chunks)
+        self._rng.shuffle(order)
+        chunks: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        reader = threading.Thread(target=self._read_loop, args=(order, chunks), daemon=True)
+        reader.start()
+        while True:
+            item = chunks.get()
+            if item is None:
+                break
+            if isinstance(item, BaseException):
+                raise RuntimeError("The demonstration reader thread failed.") from item
+            obs, actions = (x.to(self.device, non_blocking=True) for x in item)
+            perm = torch.randperm(len(obs), device=self.device, generator=self._generator)
+            for start in range(0, len(obs), self.batch_size):
+                index = perm[start : start + self.batch_size]
+                yield obs[index], actions[index]
+        reader.join()
+
+    def _read_loop(self, order: list[tuple[int, int, int, int]], chunks: queue.Queue):
+        try:
+            for d, s, start, stop in order:
+                shard = self.datasets[d].shard(s)
+                obs = np.concatenate([shard[name][start:stop] for name in self.obs_fields], axis=-1)
+                actions = np.array(shard["actions"][start:stop])
+                # (steps, envs, dim) -> transitions
+                obs, actions = obs.reshape(-1, obs.shape[-1]), actions.reshape(-1, actions.shape[-1])
+                if self._masks[d] is not None:
+                    keep = self._masks[d][s][start:stop].reshape(-1)
+                    obs, actions = obs[keep], actions[keep]
+                if len(obs) == 0:
+                    continue
+                obs, actions = torch.from_numpy(obs), torch.from_numpy(actions)
+                if self._pin:
+                    obs, actions = obs.pin_memory(), actions.pin_memory()
+                chunks.put((obs, actions))
+            chunks.put(None)
+        except BaseException as e:
+            chunks.put(e)
+
+
+def pretrain_actor(
+    policy,
+    loader: DemoLoader,
+    epochs: int,
+    learning_rate: float = 1e-3,
+    clip_actions: float | None = None,
+    noise_std: float | None = None,
+) -> list[float]:
+    """Fit the actor mean of an RSL-RL ``ActorCritic`` to the demonstrations; returns the mean loss per epoch.
+
+    Args:
+        policy: The policy of the runner (``runner.alg.policy``).
+        loader: The demonstrations.
+        epochs: Passes over the demonstrations.
+        learning_rate: Adam learning rate.
+        clip_actions: Clip the demonstrated actions to this bound (the ``clip_actions`` of the runner cfg).
+        noise_std: Set the action noise std to this value afterwards (keeps the configured one if None).
+    """
+    print(
+        f"[INFO] Behavior cloning on {loader.num_transitions} transitions from {len(loader.datasets)} dataset(s),"
+        f" {epochs} epochs"
+    )
+    normalizer = policy.actor_obs_normalizer
+    optimizer = torch.optim.Adam(policy.actor.parameters(), lr=learning_rate)
+    policy.train()
+    losses = []
+    for epoch in range(epochs):
+        start_time = time.time()
+        total, num_batches = torch.zeros((), device=loader.device), 0
+        for obs, actions in loader:
+            if epoch == 0 and policy.actor_obs_normalization:
+                normalizer.update(obs)
+            if clip_actions is not None:
+                actions = actions.clamp(-clip_actions, clip_actions)
+            loss = torch.nn.functional.mse_loss(policy.actor(normalizer(obs)), actions)
+            optimizer.zero_grad()
+            loss.backward()
+            optimizer.step()
+            total += loss.detach()
+            num_batches += 1
+        losses.append(total.item() / max(num_batches, 1))
+        print(f"[INFO] BC epoch {epoch + 1}/{epochs}: loss {losses[-1]:.5f} ({time.time() - start_time:.2f} s)")
+    if noise_std is not None:
+        with torch.no_grad():
+            if policy.noise_std_type == "log":
+                policy.log_std.fill_(float(np.log(noise_std)))
+            else:
+                policy.std.fill_(noise_std)
+    return losses
@@ -0,0 +1,418 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Batched headless evaluation of an RSL-RL policy on FirstRL-v0.
+
+Every environment runs a fixed number of episodes (``episodes_per_env``); episodes an environment finishes beyond its
+quota are not recorded, so short episodes are not over-represented and a run is reproducible for a given seed and
+number of environments. The rollout keeps the per-episode records on the device: finished episodes are scattered into
+a staging buffer without host syncs, and the buffer is copied to the host every ``flush_every`` steps.
+
+The records are streamed to a directory of columnar chunks (``chunk_<i>.npz``, one array per column) plus a
+``meta.json`` holding the column names, the termination reason names and the aggregate statistics. Columns:
+
+* ``env_id``, ``episode``: environment index and episode index within the environment.
+* ``reason``: termination reason code (index into ``meta["reason_names"]``), ``success``: whether it is ``success``.
+* ``length``: episode length in control steps, ``return``: undiscounted sum of the rewards.
+* ``init_cube_pos`` (3), ``init_cube_quat`` (4, w-x-y-z): cube pose right after the reset, in the environment frame.
+
+Use :func:`load_episode_records` to read the chunks back as one array per column.
+
+Several checkpoints can be evaluated in one simulator instance: :class:`StackedActor` stacks the MLP actors of the
+checkpoints and drives consecutive, equally sized groups of environments with one batched forward pass (``bmm`` per
+layer). The evaluator then also summarizes every group (``meta["groups"]``), see :func:`print_group_table`.
+"""
+
+from __future__ import annotations
+
+import copy
+import glob
+import json
+import math
+import os
+import re
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+
+class EpisodeRecordWriter:
+    """Buffers episode records on the host and writes them in chunks of ``chunk_size`` records."""
+
+    def __init__(self, output_dir: str, chunk_size: int = 65536):
+        self.output_dir = output_dir
+        self.chunk_size = chunk_size
+        self.num_records = 0
+        self.num_chunks = 0
+        self._pending: dict[str, list[np.ndarray]] = {}
+        self._num_pending = 0
+        os.makedirs(output_dir, exist_ok=True)
+        # start from an empty directory: chunks of an earlier run would be read back by load_episode_records
+        for path in glob.glob(os.path.join(output_dir, "chunk_*.npz")):
+            os.remove(path)
+
+    def append(self, columns: dict[str, np.ndarray]):
+        """Add a batch of records (one array per column, all with the same length)."""
+        size = len(next(iter(columns.values())))
+        if size == 0:
+            return
+        for name, values in columns.items():
+            self._pending.setdefault(name, []).append(values)
+        self._num_pending += size
+        while self._num_pending >= self.chunk_size:
+            self._write(self.chunk_size)
+
+    def flush(self):
+        """Write the buffered records as a (possibly smaller) chunk."""
+        if self._num_pending > 0:
+            self._write(self._num_pending)
+
+    def close(self, meta: dict):
+        """Write the remaining records and ``meta.json``."""
+        self.flush()
+        meta = dict(meta, num_records=self.num_records, num_chunks=self.num_chunks)
+        with open(os.path.join(self.output_dir, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+
+    def _write(self, size: int):
+        columns = {name: np.concatenate(parts) for name, parts in self._pending.items()}
+        path = os.path.join(self.output_dir, f"chunk_{self.num_chunks:05d}.npz")
+        np.savez(path, **{name: values[:size] for name, values in columns.items()})
+        self._pending = {name: [values[size:]] for name, values in columns.items()}
+        self._num_pending -= size
+        self.num_records += size
+        self.num_chunks += 1
+
+
+def load_episode_records(output_dir: str) -> dict[str, np.ndarray]:
+    """Read all chunks written by :class:`EpisodeRecordWriter` as one array per column."""
+    parts: dict[str, list[np.ndarray]] = {}
+    for path in sorted(glob.glob(os.path.join(output_dir, "chunk_*.npz"))):
+        with np.load(path) as chunk:
+            for name in chunk.files:
+                parts.setdefault(name, []).append(chunk[name])
+    return {name: np.concatenate(values) for name, values in parts.items()}
+
+
+class BatchedEvaluator:
+    """Runs ``episodes_per_env`` episodes in every environment and streams one record per episode.
+
+    Args:
+        env: The environment wrapped for RSL-RL (its ``unwrapped`` env holds the task state and the scene).
+        episodes_per_env: Recorded episodes per environment.
+        writer: Destination of the records.
+        reason_names: Names of the termination reason codes (index = code).
+        flush_every: Control steps between two copies of the staging buffer to the host.
+        group_names: Names of the environment groups driven by different policies (see :class:`StackedActor`);
+            the environments are split into ``len(group_names)`` consecutive groups of equal size.
+    """
+
+    def __init__(
+        self,
+        env,
+        episodes_per_env: int,
+        writer: EpisodeRecordWriter,
+        reason_names: list[str],
+        flush_every: int = 16,
+        group_names: list[str] | None = None,
+    ):
+        self.env = env
+        self.unwrapped = env.unwrapped
+        self.episodes_per_env = episodes_per_env
+        self.writer = writer
+        self.reason_names = list(reason_names)
+        self.flush_every = flush_every
+        self.group_names = None if group_names is None else list(group_names)
+        self.task_state = self.unwrapped.task_state
+        self.cube = self.unwrapped.scene[self.task_state.cfg.cube_cfg.name]
+
+        n, device = env.num_envs, env.device
+        self.num_envs = n
+        self.device = device
+        if self.group_names is not None:
+            if n % len(self.group_names) != 0:
+                raise ValueError(f"{n} environments cannot be split into {len(self.group_names)} equal groups.")
+            self.group_size = n // len(self.group_names)
+        self.env_ids = torch.arange(n, device=device)
+        # per-environment state of the running episode
+        self.episode_return = torch.zeros(n, device=device)
+        self.episode_length = torch.zeros(n, dtype=torch.long, device=device)
+        self.episodes_done = torch.zeros(n, dtype=torch.long, device=device)
+        self.init_pose = torch.zeros(n, 7, device=device)
+        # staging buffer: an environment finishes at most one episode per step, the last row takes the discarded ones
+        self.capacity = n * flush_every
+        self.staging = {
+            "env_id": torch.zeros(self.capacity + 1, dtype=torch.long, device=device),
+            "episode": torch.zeros(self.capacity + 1, dtype=torch.long, device=device),
+            "reason": torch.zeros(self.capacity + 1, dtype=torch.int8, device=device),
+            "length": torch.zeros(self.capacity + 1, dtype=torch.long, device=device),
+            "return": torch.zeros(self.capacity + 1, device=device),
+            "init_cube_pose": torch.zeros(self.capacity + 1, 7, device=device),
+        }
+        self.num_staged = torch.zeros((), dtype=torch.long, device=device)
+
+    def run(self, policy, policy_nn=None) -> dict:
+        """Roll out ``policy`` until every environment has finished its episodes and return the summary.
+
+        Args:
+            policy: Inference policy mapping the observations to actions.
+            policy_nn: The policy module, whose recurrent state is reset on episode ends (optional).
+        """
+        obs = self.env.get_observations()
+        self._read_init_pose(torch.ones(self.num_envs, dtype=torch.bool, device=self.device))
+        step = 0
+        with torch.inference_mode():
+            while True:
+                actions = policy(obs)
+                obs, rewards, dones, _ = self.env.step(actions)
+                done = dones.bool()
+                self._record(rewards, done)
+                if policy_nn is not None:
+                    policy_nn.reset(dones)
+                step += 1
+                if step % self.flush_every == 0:
+                    self._flush()
+                    if bool((self.episodes_done >= self.episodes_per_env).all()):
+                        break
+        self._flush()
+        self.writer.flush()
+        summary = self.summarize()
+        meta = {"reason_names": self.reason_names, "steps": step, "summary": summary}
+        if self.group_names is not None:
+            meta.update(group_names=self.group_names, group_size=self.group_size)
+        self.writer.close(meta)
+        return summary
+
+    def summarize(self) -> dict:
+        """Aggregate statistics of all records written so far (read back from the chunks), per group if any."""
+        records = load_episode_records(self.writer.output_dir)
+        summary = summarize_records(records, self.reason_names)
+        if self.group_names is not None and records:
+            group_ids = records["env_id"] // self.group_size
+            summary["groups"] = {
+                name: summarize_records({k: v[group_ids == g] for k, v in records.items()}, self.reason_names)
+                for g, name in enumerate(self.group_names)
+            }
+        return summary
+
+    """
+    Internal helpers.
+    """
+
+    def _read_init_pose(self, mask: torch.Tensor):
+        """Store the current cube pose (environment frame) as the initial pose of the environments in ``mask``."""
+        pose = torch.cat((self.cube.data.root_pos_w - self.unwrapped.scene.env_origins, self.cube.data.root_quat_w), 1)
+        torch.where(mask.unsqueeze(1), pose, self.init_pose, out=self.init_pose)
+
+    def _record(self, rewards: torch.Tensor, done: torch.Tensor):
+        self.episode_return += rewards
+        self.episode_length += 1
+        # finished episodes within the quota get consecutive rows after the staged ones, the others the last row
+        valid = done & (self.episodes_done < self.episodes_per_env)
+        rows = torch.cumsum(valid, dim=0).add_(self.num_staged - 1)
+        rows.masked_fill_(~valid, self.capacity)
+        values = {
+            "env_id": self.env_ids,
+            "episode": self.episodes_done,
+            # the terminations of this step were evaluated before the reset, the codes are still in the buffer
+            "reason": self.task_state.termination_reason,
+            "length": self.episode_length,
+            "return": self.episode_return,
+            "init_cube_pose": self.init_pose,
+        }
+        for name, column in self.staging.items():
+            column.index_copy_(0, rows, values[name])
+        self.num_staged += valid.sum()
+        # start the next episodes: the finished environments were reset inside the step
+        self.episodes_done += done
+        self.episode_return.masked_fill_(done, 0.0)
+        self.episode_length.masked_fill_(done, 0)
+        self._read_init_pose(done)
+
+    def _flush(self):
+        num = int(self.num_staged)
+        if num == 0:
+            return
+        staged = {name: column[:num].cpu().numpy() for name, column in self.staging.items()}
+        self.num_staged.zero_()
+        success_code = self.reason_names.index("success")
+        pose = staged.pop("init_cube_pose")
+        self.writer.append({
+            **staged,
+            "success": staged["reason"] == success_code,
+            "init_cube_pos": pose[:, :3],
+            "init_cube_quat": pose[:, 3:],
+        })
+
+
+def summarize_records(records: dict[str, np.ndarray], reason_names: list[str]) -> dict:
+    """Success rate (with a 95% interval), mean length and return, and the rate of every termination reason."""
+    num_episodes = len(records.get("reason", []))
+    if num_episodes == 0:
+        return {"episodes": 0}
+    success_rate = float(records["success"].mean())
+    summary = {
+        "episodes": num_episodes,
+        "success_rate": success_rate,
+        # normal approximation of the 95% confidence interval of the success rate
+        "success_rate_ci95": 1.96 * math.sqrt(success_rate * (1.0 - success_rate) / num_episodes),
+        "mean_length": float(records["length"].mean()),
+        "mean_return": float(records["return"].mean()),
+    }
+    counts = np.bincount(records["reason"].astype(np.int64), minlength=len(reason_names))
+    for code, name in enumerate(reason_names):
+        if name == "none":
+            continue
+        summary[f"{name}_rate"] = float(counts[code] / num_episodes)
+    return summary
+
+
+def print_summary(summary: dict, title: str = "Evaluation"):
+    """Print the aggregate statistics returned by :meth:`BatchedEvaluator.run`."""
+    print(f"[INFO] {title}: {summary.get('episodes', 0)} episodes")
+    for key, value in summary.items():
+        if key in ("episodes", "groups"):
+            continue
+        print(f"{key:>24}: {value:.4f}")
+
+
+def print_group_table(groups: dict[str, dict]):
+    """Print one row per group, ranked by success rate."""
+    header = f"{'rank':>4} | {'checkpoint':>40} | {'episodes':>8} | {'success':>15} | {'length':>7} | {'return':>8}"
+    print(header)
+    print("-" * len(header))
+    ranked = sorted(groups.items(), key=lambda item: item[1].get("success_rate", 0.0), reverse=True)
+    for rank, (name, summary) in enumerate(ranked, start=1):
+        if summary["episodes"] == 0:
+            print(f"{rank:>4} | {name[-40:]:>40} | {0:>8} |")
+            continue
+        success = f"{summary['success_rate']:.3f} +- {summary['success_rate_ci95']:.3f}"
+        print(
+            f"{rank:>4} | {name[-40:]:>40} | {summary['episodes']:>8} | {success:>15} |"
+            f" {summary['mean_length']:>7.1f} | {summary['mean_return']:>8.2f}"
+        )
+
+
+def find_checkpoints(paths: list[str]) -> list[str]:
+    """Expand run directories to their ``model_<iteration>.pt`` files (in iteration order); files are kept as is."""
+    checkpoints = []
+    for path in paths:
+        if os.path.isdir(path):
+            files = glob.glob(os.path.join(path, "model_*.pt"))
+            checkpoints += sorted(files, key=lambda f: int(re.findall(r"\d+", os.path.basename(f))[0]))
+        else:
+            checkpoints.append(path)
+    return checkpoints
+
+
+class StackedActor(nn.Module):
+    """The MLP actors of several checkpoints evaluated together, one group of environments per actor.
+
+    The observations of ``num_envs`` environments are viewed as ``(num_groups, num_envs / num_groups, obs_dim)``; each
+    group is normalized with the normalizer of its checkpoint, and every linear layer is one batched matrix product
+    with the stacked weights of all actors. The activations are shared, so the actors must have the same architecture.
+
+    Args:
+        actors: The actor MLPs (``nn.Sequential`` of linear layers and activations), one per group.
+        normalizers: The actor observation normalizers (``nn.Identity`` if not used), one per group.
+    """
+
+    def __init__(self, actors: list[nn.Sequential], normalizers: list[nn.Module]):
+        super().__init__()
+        reference = [(type(m), tuple(p.shape for p in m.parameters())) for m in actors[0]]
+        for actor in actors[1:]:
+            if [(type(m), tuple(p.shape for p in m.parameters())) for m in actor] != reference:
+                raise ValueError("All actors must have the same architecture to be stacked.")
+        self.num_groups = len(actors)
+        self.normalizers = nn.ModuleList(copy.deepcopy(n) for n in normalizers)
+        self.layers = []
+        for i, module in enumerate(actors[0]):
+            if isinstance(module, nn.Linear):
+                # (num_groups, in, out) for x @ W^T, biases as (num_groups, 1, out)
+                weight = torch.stack([actor[i].weight.detach().t() for actor in actors])
+                bias = torch.stack([actor[i].bias.detach() for actor in actors]).unsqueeze(1)
+                self.register_buffer(f"weight_{i}", weight)
+                self.register_buffer(f"bias_{i}", bias)
+                self.layers.append(("linear", i))
+            elif len(list(module.parameters())) == 0:
+                self.layers.append(("activation", copy.deepcopy(module)))
+            else:
+                raise ValueError(f"Cannot stack actor layer of type {type(module).__name__}.")
+
+    def forward(self, obs: torch.Tensor) -> torch.Tensor:
+        num_envs = obs.shape[0]
+        x = obs.view(self.num_groups, num_envs // self.num_groups, -1)
+        x = torch.stack([normalizer(x[g]) for g, normalizer in enumerate(self.normalizers)])
+        for kind, layer in self.layers:
+            if kind == "linear":
+                x = torch.baddbmm(getattr(self, f"bias_{layer}"), x, getattr(self, f"weight_{layer}"))
+            else:
+                x = layer(x)
+        return x.reshape(num_envs, -1)
+
+
+def evaluate_policy(
+    env,
+    runner,
+    policy,
+    policy_nn: nn.Module,
+    normalizer: nn.Module | None,
+    args_cli,
+    resume_path: str,
+    checkpoints: list[str] | None,
+    log_root_path: str,
+    reason_names: list[str],
+) -> str:
+    """Run the ``--eval_episodes`` evaluation of ``play.py`` and print its summary.
+
+    Without ``checkpoints`` the loaded policy is evaluated on all environments. Otherwise the runner loads every
+    checkpoint in turn and their actors are stacked (:class:`StackedActor`), one group of environments per checkpoint;
+    the environments must already be split into equally sized groups.
+
+    Args:
+        env: The wrapped environment (``RslRlVecEnvWrapper``).
+        runner: The runner holding the policy of ``resume_path``.
+        policy: The inference policy of ``resume_path``.
+        policy_nn: The policy module of the runner (reset on episode ends, actor of every stacked checkpoint).
+        normalizer: The actor observation normalizer of the policy module, or None.
+        args_cli: The parsed arguments of ``play.py`` (``eval_episodes``, ``eval_output``, ``eval_chunk_size``).
+        resume_path: The loaded checkpoint; its directory holds the default output directory.
+        checkpoints: The checkpoints evaluated together, or None to evaluate ``resume_path`` only.
+        log_root_path: Directory the checkpoint group names are relative to.
+        reason_names: Termination reason names, indexed by reason code.
+
+    Returns:
+        The directory of the episode records.
+    """
+    log_dir = os.path.dirname(resume_path)
+    if checkpoints is None:
+        checkpoint_name = os.path.splitext(os.path.basename(resume_path))[0]
+        output_dir = args_cli.eval_output or os.path.join(log_dir, "eval", checkpoint_name)
+        writer = EpisodeRecordWriter(output_dir, chunk_size=args_cli.eval_chunk_size)
+        evaluator = BatchedEvaluator(env, args_cli.eval_episodes, writer, reason_names)
+        summary = evaluator.run(policy, policy_nn)
+        print_summary(summary, title=f"Evaluation of {resume_path}")
+        return output_dir
+
+    # stack the actors of all checkpoints: one batched forward pass drives every group
+    actors, normalizers = [], []
+    for checkpoint in checkpoints:
+        runner.load(checkpoint, load_optimizer=False)
+        actors.append(copy.deepcopy(policy_nn.actor))
+        normalizers.append(copy.deepcopy(normalizer if normalizer is not None else nn.Identity()))
+    stacked_actor = StackedActor(actors, normalizers).to(env.unwrapped.device).eval()
+
+    def stacked_policy(obs):
+        return stacked_actor(policy_nn.get_actor_obs(obs))
+
+    output_dir = args_cli.eval_output or os.path.join(log_dir, "eval", "checkpoints")
+    writer = EpisodeRecordWriter(output_dir, chunk_size=args_cli.eval_chunk_size)
+    group_names = [os.path.relpath(checkpoint, log_root_path) for checkpoint in checkpoints]
+    evaluator = BatchedEvaluator(env, args_cli.eval_episodes, writer, reason_names, group_names=group_names)
+    summary = evaluator.run(stacked_policy)
+    print_summary(summary, title=f"Evaluation of {len(checkpoints)} checkpoints")
+    print_group_table(summary["groups"])
+    return output_dir
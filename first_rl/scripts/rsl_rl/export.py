@@ -0,0 +1,129 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Export RSL-RL checkpoints (JIT, ONNX, NumPy ``.npz``) without launching Isaac Sim or building an environment.
+
+The policy is rebuilt from the agent configuration of the run (``<run>/params/agent.yaml``, written by ``train.py``)
+and the tensor shapes stored in the checkpoint, then exported through the content-addressed cache of
+:mod:`export_cache` (``<run>/exported/cache/<key>``), so checkpoints that were already exported are skipped.
+
+.. code-block:: bash
+
+    # every model_*.pt of a run
+    python scripts/rsl_rl/export.py logs/rsl_rl/cube_transport_task/<run>
+
+    # selected checkpoints, and make the last one the active export (<run>/exported/policy.pt)
+    python scripts/rsl_rl/export.py <run>/model_1000.pt <run>/model_2000.pt --activate
+
+    # with int8 / fp16 / bf16 variants, validated on <run>/exported/obs_replay.npy (play.py --record_obs)
+    python scripts/rsl_rl/export.py <run>/model_2000.pt --precisions int8 fp16 bf16 --activate
+
+"""
+
+import argparse
+import os
+import re
+
+import rsl_rl.modules
+import torch
+import yaml
+from tensordict import TensorDict
+
+# local imports
+import evaluation  # isort: skip
+import export_cache  # isort: skip
+import policy_variants  # isort: skip
+
+parser = argparse.ArgumentParser(description="Export RSL-RL checkpoints to JIT/ONNX without building an environment.")
+parser.add_argument("paths", type=str, nargs="+", help="Checkpoint files or run directories (all model_*.pt).")
+parser.add_argument(
+    "--agent_yaml", type=str, default=None, help="Agent configuration (default: <run>/params/agent.yaml)."
+)
+parser.add_argument(
+    "--activate", action="store_true", default=False, help="Copy the last checkpoint's export to <run>/exported."
+)
+parser.add_argument(
+    "--precisions",
+    type=str,
+    nargs="+",
+    default=[],
+    choices=policy_variants.PRECISIONS,
+    help="Also export reduced-precision variants of the actor (policy_<precision>.pt).",
+)
+parser.add_argument(
+    "--replay_obs",
+    type=str,
+    default=None,
+    help="Observations to validate the variants on (default: <run>/exported/obs_replay.npy).",
+)
+args_cli = parser.parse_args()
+
+
+def load_agent_cfg(run_dir: str) -> dict:
+    """Agent configuration dumped by ``train.py`` into the run directory."""
+    path = args_cli.agent_yaml or os.path.join(run_dir, "params", "agent.yaml")
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"Agent configuration not found: {path} (pass --agent_yaml).")
+    with open(path) as f:
+        # same loader as isaaclab.utils.io.load_yaml
+        return yaml.full_load(f)
+
+
+def _num_outputs(state_dict: dict, module: str) -> int:
+    """Output size of the last linear layer of the MLP ``module`` (``<module>.<i>.weight``)."""
+    indices = [int(m.group(1)) for key in state_dict if (m := re.fullmatch(rf"{module}\.(\d+)\.weight", key))]
+    return state_dict[f"{module}.{max(indices)}.weight"].shape[0]
+
+
+def build_policy(agent_cfg: dict, state_dict: dict) -> torch.nn.Module:
+    """Rebuild the actor-critic of ``agent_cfg["policy"]`` with the observation and action sizes of the checkpoint."""
+    policy_cfg = dict(agent_cfg["policy"])
+    class_name = policy_cfg.pop("class_name")
+    if class_name != "ActorCritic":
+        raise ValueError(f"Only MLP ActorCritic policies can be rebuilt without an environment, got: {class_name}")
+    # the sizes of the observation groups only matter through the first layers of the actor and the critic
+    obs = TensorDict(
+        {
+            "policy": torch.zeros(1, state_dict["actor.0.weight"].shape[1]),
+            "critic": torch.zeros(1, state_dict["critic.0.weight"].shape[1]),
+        },
+        batch_size=[1],
+    )
+    obs_groups = {"policy": ["policy"], "critic": ["critic"]}
+    policy_class = getattr(rsl_rl.modules, class_name)
+    policy = policy_class(obs, obs_groups, _num_outputs(state_dict, "actor"), **policy_cfg)
+    policy.load_state_dict(state_dict)
+    return policy.eval()
+
+
+def main():
+    exporters = {**export_cache.load_isaaclab_exporters(), "policy.npz": export_cache.load_numpy_exporter()}
+    exporters.update(policy_variants.variant_exporters(args_cli.precisions))
+    checkpoints = evaluation.find_checkpoints(args_cli.paths)
+    if not checkpoints:
+        raise ValueError(f"No checkpoints found in: {args_cli.paths}")
+
+    agent_cfgs = {}
+    for i, checkpoint in enumerate(checkpoints):
+        run_dir = os.path.dirname(os.path.abspath(checkpoint))
+        if run_dir not in agent_cfgs:
+            agent_cfgs[run_dir] = load_agent_cfg(run_dir)
+        state_dict = torch.load(checkpoint, map_location="cpu", weights_only=False)["model_state_dict"]
+        policy = build_policy(agent_cfgs[run_dir], state_dict)
+        # same normalizer lookup as play.py, so both produce the same cache key
+        normalizer = getattr(policy, "actor_obs_normalizer", None)
+
+        exports = export_cache.ExportCache(os.path.join(run_dir, "exported"), exporters)
+        activate = args_cli.activate and i == len(checkpoints) - 1
+        key, hit = exports.export(policy, normalizer, checkpoint, activate=activate)
+        print(f"[INFO] {checkpoint}: {key} ({'cached' if hit else 'exported'})")
+        if args_cli.precisions:
+            # accuracy of the variants against the float32 policy of the same checkpoint
+            obs_path = args_cli.replay_obs or os.path.join(exports.export_dir, policy_variants.OBS_REPLAY_FILE)
+            policy_variants.report_deviation(exports.cache_dir(key), args_cli.precisions, obs_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Content-addressed cache of the JIT/ONNX exports of RSL-RL checkpoints.
+
+An export is keyed by the SHA-256 of the checkpoint file and of the state of the observation normalizer that is baked
+into the exported policy. The artifacts of a key are stored once in ``<run>/exported/cache/<key>`` and recorded in
+``<run>/exported/manifest.json``; exporting an unchanged checkpoint again only copies the cached files to
+``<run>/exported`` (the location ``play.py`` has always written to), or does nothing if they are already there.
+
+The exporters are passed in as callables with the signature of ``isaaclab_rl.rsl_rl.export_policy_as_jit``.
+:func:`load_isaaclab_exporters` loads Isaac Lab's exporters without importing ``isaaclab_rl.rsl_rl`` (whose package
+init imports the simulator), so exports can be produced without launching Isaac Sim. :func:`load_numpy_exporter` loads
+the ``.npz`` exporter of the NumPy runtime in ``scripts/deploy/numpy_actor.py``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+from collections.abc import Callable
+from datetime import datetime
+
+import torch
+
+EXPORT_FORMAT = 1
+"""Version of the export layout, part of the cache key (bump it when the exported artifacts change)."""
+
+
+def export_key(checkpoint_path: str, normalizer: torch.nn.Module | None) -> str:
+    """SHA-256 (first 16 hex digits) of the checkpoint file and of the normalizer state."""
+    digest = hashlib.sha256(f"export-format-{EXPORT_FORMAT}".encode())
+    with open(checkpoint_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    if normalizer is not None:
+        for name, tensor in sorted(normalizer.state_dict().items()):
+            digest.update(name.encode())
+            digest.update(tensor.detach().cpu().contiguous().numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+class ExportCache:
+    """Exports of the checkpoints of one run directory, stored under ``<export_dir>/cache/<key>``.
+
+    Args:
+        export_dir: The ``exported`` directory of the run.
+        exporters: Output file name -> exporter called as ``exporter(policy, normalizer, path=..., filename=...)``.
+    """
+
+    def __init__(self, export_dir: str, exporters: dict[str, Callable]):
+        self.export_dir = export_dir
+        self.exporters = exporters
+        self.manifest_path = os.path.join(export_dir, "manifest.json")
+        self.manifest = {"format": EXPORT_FORMAT, "current": None, "entries": {}}
+        if os.path.isfile(self.manifest_path):
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+            if manifest.get("format") == EXPORT_FORMAT:
+                self.manifest = manifest
+
+    def cache_dir(self, key: str) -> str:
+        return os.path.join(self.export_dir, "cache", key)
+
+    def is_cached(self, key: str) -> bool:
+        """Whether all artifacts of ``key`` are in the cache."""
+        if key not in self.manifest["entries"]:
+            return False
+        return all(os.path.isfile(os.path.join(self.cache_dir(key), name)) for name in self.exporters)
+
+    def export(self, policy, normalizer, checkpoint_path: str, activate: bool = True) -> tuple[str, bool]:
+        """Export ``policy`` unless its key is cached; with ``activate``, also place the artifacts in ``export_dir``.
+
+        Args:
+            policy: The actor-critic module passed to the exporters.
+            normalizer: The observation normalizer passed to the exporters (or None).
+            checkpoint_path: The checkpoint the policy was loaded from.
+            activate: Copy the artifacts to ``export_dir`` (the files read by the deployment tools).
+
+        Returns:
+            The cache key and whether it was a cache hit.
+        """
+        key = export_key(checkpoint_path, normalizer)
+        hit = self.is_cached(key)
+        if not hit:
+            cache_dir = self.cache_dir(key)
+            entry = self.manifest["entries"].get(key, {"files": []})
+            # only the artifacts missing from the cache (e.g. a variant requested for the first time)
+            for filename, exporter in self.exporters.items():
+                if not os.path.isfile(os.path.join(cache_dir, filename)):
+                    exporter(policy, normalizer, path=cache_dir, filename=filename)
+            self.manifest["entries"][key] = {
+                "checkpoint": os.path.abspath(checkpoint_path),
+                "files": sorted(set(entry["files"]) | set(self.exporters)),
+                "created": datetime.now().isoformat(timespec="seconds"),
+            }
+        if activate and (not hit or self.manifest["current"] != key or not self._active_files_exist()):
+            for filename in self.exporters:
+                shutil.copyfile(os.path.join(self.cache_dir(key), filename), os.path.join(self.export_dir, filename))
+            self.manifest["current"] = key
+        self._save()
+        return key, hit
+
+    """
+    Internal helpers.
+    """
+
+    def _active_files_exist(self) -> bool:
+        return all(os.path.isfile(os.path.join(self.export_dir, name)) for name in self.exporters)
+
+    def _save(self):
+        os.makedirs(self.export_dir, exist_ok=True)
+        with open(self.manifest_path, "w") as f:
+            json.dump(self.manifest, f, indent=2)
+
+
+def load_isaaclab_exporters() -> dict[str, Callable]:
+    """Isaac Lab's JIT and ONNX exporters, loaded from ``isaaclab_rl/rsl_rl/exporter.py`` without the package init."""
+    spec = importlib.util.find_spec("isaaclab_rl")
+    if spec is None or not spec.submodule_search_locations:
+        raise ModuleNotFoundError("isaaclab_rl is required to export policies.")
+    path = os.path.join(spec.submodule_search_locations[0], "rsl_rl", "exporter.py")
+    module_spec = importlib.util.spec_from_file_location("_isaaclab_rl_exporter", path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return {"policy.pt": module.export_policy_as_jit, "policy.onnx": module.export_policy_as_onnx}
+
+
+def load_numpy_exporter() -> Callable:
+    """The ``policy.npz`` exporter of the NumPy runtime, loaded from ``scripts/deploy/numpy_actor.py``."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "deploy", "numpy_actor.py")
+    module_spec = importlib.util.spec_from_file_location("_numpy_actor", path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return module.export_policy_as_npz
@@ -0,0 +1,291 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Failure forensics: the last steps of the episodes that end with selected termination reasons.
+
+:class:`FailureRecorder` wraps the RSL-RL vector environment and keeps, on the device, a ring buffer of the last
+steps of every environment: the policy observations, the actions and the cube pose (position in the environment
+frame, orientation w-x-y-z) the actions were taken from. When an episode ends with one of the selected reasons
+(``fail_drop`` and ``out_of_table`` by default), the environment is marked; every ``flush_every`` steps the windows
+of up to ``max_per_flush`` marked environments (the ``window`` steps up to the terminating one) are gathered in one
+fixed-size batch and copied to pinned host buffers (non-blocking); a background thread waits for the copy and writes
+the windows to ``failures_<i>.npz``. Neither stepping nor the flush syncs with the host; the stepping thread only
+waits when all host buffers are still held by the writer. The ring holds ``window + flush_every`` steps, so a window
+is still complete when it is flushed; failures beyond ``max_per_flush`` in one flush are counted as lost.
+
+Each file holds one record per failed episode: ``env_id``, ``reason`` (code, see ``meta.json``), ``episode_length``
+(the environment's ``episode_length_buf`` at the terminating step, so it includes a randomized start such as
+``init_at_random_ep_len``), ``end_step`` (recorder step of the terminating step), ``obs`` (window, obs_dim),
+``actions``, ``cube_pos``, ``cube_quat`` and ``valid`` (False for the window steps before the episode or the recording
+started). Read them back with :func:`load_failures`.
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+import queue
+import threading
+
+import numpy as np
+import torch
+from rsl_rl.env import VecEnv
+from tensordict import TensorDict
+
+
+class FailureRecorder(VecEnv):
+    """Keeps the last ``window`` steps of every environment and dumps those of failed episodes.
+
+    Args:
+        env: The wrapped environment (``RslRlVecEnvWrapper`` or an equivalent ``VecEnv``); its task needs a
+            ``task_state`` (termination reasons).
+        output_dir: Directory of the dumps.
+        reason_names: Names of the termination reason codes.
+        reasons: Names of the reasons whose episodes are dumped.
+        window: Steps kept per environment.
+        flush_every: Steps between two checks for failed episodes.
+        max_per_flush: Failed episodes dumped per flush at most (the size of the host buffers).
+        num_buffers: Pinned host buffers (each holding one flush) shared with the writer thread.
+        obs_group: Observation group that is recorded.
+    """
+
+    def __init__(
+        self,
+        env: VecEnv,
+        output_dir: str,
+        reason_names: list[str],
+        reasons: tuple[str, ...] = ("fail_drop", "out_of_table"),
+        window: int = 64,
+        flush_every: int = 16,
+        max_per_flush: int = 256,
+        num_buffers: int = 2,
+        obs_group: str = "policy",
+    ):
+        self.env = env
+        self.num_envs = env.num_envs
+        self.num_actions = env.num_actions
+        self.device = env.device
+        self.max_episode_length = env.max_episode_length
+        self.output_dir = output_dir
+        self.window = window
+        self.flush_every = flush_every
+        self.obs_group = obs_group
+        self.reason_names = list(reason_names)
+        unknown = set(reasons) - set(self.reason_names)
+        if unknown:
+            raise ValueError(f"Unknown termination reasons: {sorted(unknown)} (known: {self.reason_names})")
+        if os.path.isfile(os.path.join(output_dir, "meta.json")):
+            raise FileExistsError(f"A failure recording already exists in: {output_dir}")
+        os.makedirs(output_dir, exist_ok=True)
+        self._task_state = env.unwrapped.task_state
+        scene = env.unwrapped.scene
+        self._cube = scene[self._task_state.cfg.cube_cfg.name]
+        self._env_origins = scene.env_origins
+
+        n, device = self.num_envs, self.device
+        self._obs = env.get_observations()
+        obs_dim = self._obs[obs_group].shape[-1]
+        size = window + flush_every
+        self._ring_obs = torch.zeros(size, n, obs_dim, device=device)
+        self._ring_actions = torch.zeros(size, n, self.num_actions, device=device)
+        self._ring_cube = torch.zeros(size, n, 7, device=device)
+        # reason code -> dumped
+        self._selected = torch.zeros(len(self.reason_names), dtype=torch.bool, device=device)
+        self._selected[[self.reason_names.index(name) for name in reasons]] = True
+        self._step_length = torch.zeros(n, dtype=torch.long, device=device)
+        self._pending = torch.zeros(n, dtype=torch.bool, device=device)
+        self._end_step = torch.zeros(n, dtype=torch.long, device=device)
+        self._end_length = torch.zeros(n, dtype=torch.long, device=device)
+        self._end_reason = torch.zeros(n, dtype=torch.long, device=device)
+        # failed episodes whose window was replaced by a later failure of the same env before the flush, or that
+        # exceeded max_per_flush
+        self._num_lost = torch.zeros((), dtype=torch.long, device=device)
+        self._offsets = torch.arange(window, device=device)
+        self._step = 0
+        self.num_dumped = 0
+
+        # pinned host buffers of one flush each; "taken" marks the rows that hold a failed episode
+        self.max_per_flush = min(max_per_flush, n)
+        k, pin = self.max_per_flush, torch.device(device).type == "cuda"
+        shapes = {
+            "taken": ((k,), torch.bool),
+            "env_id": ((k,), torch.long),
+            "reason": ((k,), torch.long),
+            "episode_length": ((k,), torch.long),
+            "end_step": ((k,), torch.long),
+            "obs": ((k, window, obs_dim), torch.float),
+            "actions": ((k, window, self.num_actions), torch.float),
+            "cube_pos": ((k, window, 3), torch.float),
+            "cube_quat": ((k, window, 4), torch.float),
+            "valid": ((k, window), torch.bool),
+        }
+        self._free: queue.Queue = queue.Queue()
+        for _ in range(num_buffers):
+            self._free.put({
+                name: torch.zeros(shape, dtype=dtype, pin_memory=pin) for name, (shape, dtype) in shapes.items()
+            })
+
+        with open(os.path.join(output_dir, "meta.json"), "w") as f:
+            json.dump(
+                {"reason_names": self.reason_names, "reasons": list(reasons), "window": window, "obs_group": obs_group},
+                f,
+                indent=2,
+            )
+        self._num_files = 0
+        self._filled: queue.Queue = queue.Queue()
+        self._error: BaseException | None = None
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    """
+    VecEnv interface.
+    """
+
+    @property
+    def cfg(self):
+        return self.env.cfg
+
+    @property
+    def unwrapped(self):
+        return self.env.unwrapped
+
+    @property
+    def episode_length_buf(self) -> torch.Tensor:
+        return self.env.episode_length_buf
+
+    @episode_length_buf.setter
+    def episode_length_buf(self, value: torch.Tensor):
+        self.env.episode_length_buf = value
+
+    def seed(self, seed: int = -1) -> int:
+        return self.env.seed(seed)
+
+    def reset(self) -> tuple[TensorDict, dict]:
+        obs, extras = self.env.reset()
+        self._obs = obs
+        return obs, extras
+
+    def get_observations(self) -> TensorDict:
+        self._obs = self.env.get_observations()
+        return self._obs
+
+    def step(self, actions: torch.Tensor) -> tuple[TensorDict, torch.Tensor, torch.Tensor, dict]:
+        # the state the actions are taken from (read before the step resets the finished episodes)
+        slot = self._step % self._ring_obs.shape[0]
+        self._ring_obs[slot].copy_(self._obs[self.obs_group])
+        self._ring_actions[slot].copy_(actions)
+        torch.sub(self._cube.data.root_pos_w, self._env_origins, out=self._ring_cube[slot, :, :3])
+        self._ring_cube[slot, :, 3:].copy_(self._cube.data.root_quat_w)
+        # episode length including this step (the step resets the counter of the finished episodes)
+        torch.add(self.env.episode_length_buf, 1, out=self._step_length)
+
+        obs, rewards, dones, extras = self.env.step(actions)
+        reason = self._task_state.termination_reason.long()
+        failed = self._selected[reason]
+        self._num_lost += (failed & self._pending).sum()
+        self._pending |= failed
+        self._end_step.masked_fill_(failed, self._step)
+        torch.where(failed, self._step_length, self._end_length, out=self._end_length)
+        torch.where(failed, reason, self._end_reason, out=self._end_reason)
+
+        self._obs = obs
+        self._step += 1
+        if self._step % self.flush_every == 0:
+            self._flush()
+        return obs, rewards, dones, extras
+
+    def close(self):
+        """Dump the pending windows, wait for the writer, then close the environment."""
+        if self._writer.is_alive():
+            self._flush()
+            self._filled.put(None)
+            self._writer.join()
+        self._raise_writer_error()
+        print(
+            f"[INFO] Dumped {self.num_dumped} failed episodes to: {self.output_dir}"
+            f" ({int(self._num_lost)} lost to a second failure before the flush or beyond max_per_flush)"
+        )
+        return self.env.close()
+
+    """
+    Internal helpers.
+    """
+
+    def _flush(self):
+        self._raise_writer_error()
+        # the first max_per_flush marked envs (fixed size, no nonzero); the rows of unmarked envs are dropped by
+        # the writer
+        env_ids = torch.sort(self._pending.to(torch.int8), descending=True, stable=True).indices[: self.max_per_flush]
+        taken = self._pending[env_ids]
+        self._num_lost += self._pending.sum() - taken.sum()
+        end_step = self._end_step[env_ids]
+        # ring slots of the window steps, oldest first (the terminating step last)
+        slots = (end_step.unsqueeze(-1) - self.window + 1 + self._offsets) % self._ring_obs.shape[0]
+        cols = env_ids.unsqueeze(-1)
+        length = self._end_length[env_ids]
+        # window steps of the episode that were recorded
+        num_valid = torch.minimum(length, end_step + 1).clamp(max=self.window)
+        record = {
+            "taken": taken,
+            "env_id": env_ids,
+            "reason": self._end_reason[env_ids],
+            "episode_length": length,
+            "end_step": end_step,
+            "obs": self._ring_obs[slots, cols],
+            "actions": self._ring_actions[slots, cols],
+            "cube_pos": self._ring_cube[slots, cols, :3],
+            "cube_quat": self._ring_cube[slots, cols, 3:],
+            "valid": self._offsets >= self.window - num_valid.unsqueeze(-1),
+        }
+        self._pending.zero_()
+        buffers = self._free.get()
+        if buffers is None:
+            self._raise_writer_error()
+        for name, value in record.items():
+            buffers[name].copy_(value, non_blocking=True)
+        event = None
+        if torch.device(self.device).type == "cuda":
+            event = torch.cuda.Event()
+            event.record()
+        self._filled.put((buffers, event))
+
+    def _raise_writer_error(self):
+        if self._error is not None:
+            raise RuntimeError("The failure writer thread failed.") from self._error
+
+    def _write_loop(self):
+        try:
+            while True:
+                item = self._filled.get()
+                if item is None:
+                    return
+                buffers, event = item
+                if event is not None:
+                    event.synchronize()
+                taken = buffers["taken"].numpy()
+                if taken.any():
+                    # boolean indexing copies, so the buffers can be reused right after
+                    record = {name: buffer.numpy()[taken] for name, buffer in buffers.items() if name != "taken"}
+                    np.savez(os.path.join(self.output_dir, f"failures_{self._num_files:06d}.npz"), **record)
+                    self._num_files += 1
+                    self.num_dumped += len(record["env_id"])
+                self._free.put(buffers)
+        except BaseException as e:
+            self._error = e
+            # unblock the stepping thread, which raises the error
+            self._free.put(None)
+
+
+def load_failures(output_dir: str) -> tuple[dict[str, np.ndarray], dict]:
+    """All dumped windows of ``output_dir`` (one array per field) and the ``meta.json`` of the recording."""
+    with open(os.path.join(output_dir, "meta.json")) as f:
+        meta = json.load(f)
+    columns: dict[str, list[np.ndarray]] = {}
+    for path in sorted(glob.glob(os.path.join(output_dir, "failures_*.npz"))):
+        with np.load(path) as data:
+            for name in data.files:
+                columns.setdefault(name, []).append(data[name])
+    return {name: np.concatenate(values) for name, values in columns.items()}, meta
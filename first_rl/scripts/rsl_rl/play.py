@@ -14,6 +14,11 @@ from isaaclab.app import AppLauncher
 
 # local imports
 import cli_args  # isort: skip
+import evaluation  # isort: skip
+import export_cache  # isort: skip
+import policy_variants  # isort: skip
+import realtime  # isort: skip
+import trajectory_recorder  # isort: skip
 
 # add argparse arguments
 parser = argparse.ArgumentParser(description="Train an RL agent with RSL-RL.")
@@ -34,6 +39,69 @@ parser.add_argument(
     help="Use the pre-trained checkpoint from Nucleus.",
 )
 parser.add_argument("--real-time", action="store_true", default=False, help="Run in real-time, if possible.")
+parser.add_argument(
+    "--real_time_max_lag",
+    type=int,
+    default=5,
+    help="Missed real-time deadlines (in steps) that are caught up by running steps back to back; more are skipped.",
+)
+parser.add_argument(
+    "--eval_episodes",
+    type=int,
+    default=0,
+    help="Headless batched evaluation: episodes to record per environment (0 plays the policy interactively).",
+)
+parser.add_argument(
+    "--eval_output",
+    type=str,
+    default=None,
+    help="Directory of the evaluation records (default: <run>/eval/<checkpoint name>).",
+)
+parser.add_argument(
+    "--eval_chunk_size", type=int, default=65536, help="Episode records per chunk file of the evaluation."
+)
+parser.add_argument(
+    "--eval_checkpoints",
+    type=str,
+    nargs="+",
+    default=None,
+    help="Evaluate several checkpoints (files or run directories with model_*.pt) in one simulator instance.",
+)
+parser.add_argument(
+    "--export_precisions",
+    type=str,
+    nargs="+",
+    default=[],
+    choices=policy_variants.PRECISIONS,
+    help="Also export reduced-precision variants of the actor (exported/policy_<precision>.pt).",
+)
+parser.add_argument(
+    "--record_obs",
+    type=int,
+    default=0,
+    help="Record the policy observations of the first N play steps to exported/obs_replay.npy.",
+)
+parser.add_argument(
+    "--record_trajectories",
+    type=str,
+    default=None,
+    help="Record the played rollouts into memory-mapped shards in this directory.",
+)
+parser.add_argument("--record_shard_steps", type=int, default=256, help="Steps per shard of the recorded rollouts.")
+parser.add_argument(
+    "--record_failures",
+    type=str,
+    default=None,
+    help="Dump the last steps of the failed episodes to this directory.",
+)
+parser.add_argument(
+    "--failure_reasons",
+    type=str,
+    nargs="+",
+    default=["fail_drop", "out_of_table"],
+    help="Termination reasons whose episodes are dumped.",
+)
+parser.add_argument("--failure_window", type=int, default=64, help="Steps dumped per failed episode.")
 # append RSL-RL cli arguments
 cli_args.add_rsl_rl_args(parser)
 # append AppLauncher cli args
@@ -53,10 +121,11 @@ simulation_app = app_launcher.app
 
 """Rest everything follows."""
 
+import json
 import os
-import time
 
 import gymnasium as gym
+import numpy as np
 import torch
 from rsl_rl.runners import DistillationRunner, OnPolicyRunner
 
@@ -78,6 +147,8 @@ from isaaclab_tasks.utils import get_checkpoint_path
 from isaaclab_tasks.utils.hydra import hydra_task_config
 
 import first_rl.tasks  # noqa: F401
+from first_rl.tasks.manager_based.first_rl.mdp.observation_layout import group_obs_layout
+from first_rl.tasks.manager_based.first_rl.mdp.task_state import TerminationReason
 
 
 @hydra_task_config(args_cli.task, args_cli.agent)
@@ -100,7 +171,22 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     log_root_path = os.path.join("logs", "rsl_rl", agent_cfg.experiment_name)
     log_root_path = os.path.abspath(log_root_path)
     print(f"[INFO] Loading experiment from directory: {log_root_path}")
-    if args_cli.use_pretrained_checkpoint:
+    # multi-checkpoint evaluation: one group of environments per checkpoint
+    checkpoints = None
+    if args_cli.eval_checkpoints:
+        checkpoints = evaluation.find_checkpoints([retrieve_file_path(p) for p in args_cli.eval_checkpoints])
+        if not checkpoints:
+            raise ValueError(f"No checkpoints found in: {args_cli.eval_checkpoints}")
+        if args_cli.eval_episodes <= 0:
+            raise ValueError("--eval_checkpoints requires --eval_episodes.")
+        num_groups = len(checkpoints)
+        group_size = env_cfg.scene.num_envs // num_groups
+        if group_size == 0:
+            raise ValueError(f"{env_cfg.scene.num_envs} environments cannot be split into {num_groups} groups.")
+        env_cfg.scene.num_envs = group_size * num_groups
+        print(f"[INFO] Evaluating {num_groups} checkpoints with {group_size} environments each.")
+        resume_path = checkpoints[-1]
+    elif args_cli.use_pretrained_checkpoint:
         resume_path = get_published_pretrained_checkpoint("rsl_rl", train_task_name)
         if not resume_path:
             print("[INFO] Unfortunately a pre-trained checkpoint is currently unavailable for this task.")
@@ -136,6 +222,8 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
 
     # wrap around environment for rsl-rl
     env = RslRlVecEnvWrapper(env, clip_actions=agent_cfg.clip_actions)
+    # stream the played rollouts to disk and dump the last steps of the failed episodes
+    env = trajectory_recorder.wrap_recorders(env, args_cli, [reason.name.lower() for reason in TerminationReason])
 
     print(f"[INFO]: Loading model checkpoint from: {resume_path}")
     # load previously trained model
@@ -167,37 +255,89 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     else:
         normalizer = None
 
-    # export policy to onnx/jit
+    # export policy to onnx/jit/npz (skipped when the checkpoint and normalizer were already exported)
     export_model_dir = os.path.join(os.path.dirname(resume_path), "exported")
-    export_policy_as_jit(policy_nn, normalizer=normalizer, path=export_model_dir, filename="policy.pt")
-    export_policy_as_onnx(policy_nn, normalizer=normalizer, path=export_model_dir, filename="policy.onnx")
+    exporters = {
+        "policy.pt": export_policy_as_jit,
+        "policy.onnx": export_policy_as_onnx,
+        "policy.npz": export_cache.load_numpy_exporter(),
+        **policy_variants.variant_exporters(args_cli.export_precisions),
+    }
+    exports = export_cache.ExportCache(export_model_dir, exporters)
+    export_key, cache_hit = exports.export(policy_nn, normalizer, resume_path)
+    print(f"[INFO] Exported policy {export_key} ({'cached' if cache_hit else 'new'}) in: {export_model_dir}")
+    if args_cli.export_precisions:
+        policy_variants.report_deviation(export_model_dir, args_cli.export_precisions)
+    # export the named column ranges of the policy input next to the policy
+    task_state = getattr(env.unwrapped, "task_state", None)
+    if task_state is not None:
+        obs_layout = group_obs_layout(
+            env.unwrapped.observation_manager, "policy", {"full_scene": task_state.obs_layout}
+        )
+        with open(os.path.join(export_model_dir, "obs_layout.json"), "w") as f:
+            json.dump(obs_layout, f, indent=2)
+
+    # headless batched evaluation: fixed number of episodes per environment, records streamed to disk
+    if args_cli.eval_episodes > 0:
+        reason_names = [reason.name.lower() for reason in TerminationReason]
+        output_dir = evaluation.evaluate_policy(
+            env, runner, policy, policy_nn, normalizer, args_cli, resume_path, checkpoints, log_root_path, reason_names
+        )
+        print(f"[INFO] Episode records written to: {output_dir}")
+        env.close()
+        return
 
     dt = env.unwrapped.step_dt
 
     # reset environment
     obs = env.get_observations()
     timestep = 0
+    # policy observations replayed to validate the reduced-precision exports
+    if args_cli.record_obs > 0:
+        obs_record = torch.zeros(
+            args_cli.record_obs, env.num_envs, policy_nn.get_actor_obs(obs).shape[-1], device=env.unwrapped.device
+        )
+    record_step = 0
+    # per-stage timing of the loop with --real-time (synchronized on CUDA so that each stage is charged for its own
+    # kernels); without it the stages are not timed and the loop never syncs
+    sync = torch.cuda.synchronize if torch.device(env.unwrapped.device).type == "cuda" else None
+    loop_stats = realtime.LoopStats(["inference", "env_step"], sync=sync, enabled=args_cli.real_time)
+    # with --real-time, steps are released on absolute deadlines every step_dt
+    scheduler = realtime.FixedRateScheduler(dt, max_lag=args_cli.real_time_max_lag) if args_cli.real_time else None
     # simulate environment
-    while simulation_app.is_running():
-        start_time = time.time()
-        # run everything in inference mode
-        with torch.inference_mode():
-            # agent stepping
-            actions = policy(obs)
-            # env stepping
-            obs, _, dones, _ = env.step(actions)
-            # reset recurrent states for episodes that have terminated
-            policy_nn.reset(dones)
-        if args_cli.video:
-            timestep += 1
-            # Exit the play loop after recording one video
-            if timestep == args_cli.video_length:
-                break
-
-        # time delay for real-time evaluation
-        sleep_time = dt - (time.time() - start_time)
-        if args_cli.real_time and sleep_time > 0:
-            time.sleep(sleep_time)
+    try:
+        while simulation_app.is_running():
+            # run everything in inference mode
+            with torch.inference_mode():
+                if record_step < args_cli.record_obs:
+                    obs_record[record_step] = policy_nn.get_actor_obs(obs)
+                # agent stepping
+                with loop_stats.stage("inference"):
+                    actions = policy(obs)
+                # env stepping
+                with loop_stats.stage("env_step"):
+                    obs, _, dones, _ = env.step(actions)
+                # reset recurrent states for episodes that have terminated
+                policy_nn.reset(dones)
+            if record_step < args_cli.record_obs:
+                record_step += 1
+                if record_step == args_cli.record_obs:
+                    obs_path = os.path.join(export_model_dir, policy_variants.OBS_REPLAY_FILE)
+                    np.save(obs_path, obs_record.flatten(0, 1).cpu().numpy())
+                    print(f"[INFO] Recorded {obs_record.shape[0] * obs_record.shape[1]} observations to: {obs_path}")
+                    if args_cli.export_precisions:
+                        policy_variants.report_deviation(export_model_dir, args_cli.export_precisions)
+            if args_cli.video:
+                timestep += 1
+                # Exit the play loop after recording one video
+                if timestep == args_cli.video_length:
+                    break
+
+            # wait for the next deadline of the real-time schedule
+            if scheduler is not None:
+                scheduler.wait()
+    finally:
+        loop_stats.print_summary(scheduler)
 
     # close the simulator
     env.close()
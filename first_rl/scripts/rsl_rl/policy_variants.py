@@ -0,0 +1,110 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Reduced-precision TorchScript exports of the actor (``policy_int8.pt``, ``policy_fp16.pt``, ``policy_bf16.pt``).
+
+Each variant keeps the float32 interface of ``policy.pt``: float32 observations in, float32 actions out. The
+observation normalizer always runs in float32; only the actor MLP changes:
+
+* ``int8``: dynamic quantization of the linear layers (int8 weights, activations quantized per call).
+* ``fp16`` / ``bf16``: the actor weights and activations are cast to half / bfloat16.
+
+:func:`variant_exporters` returns exporters with the signature of ``isaaclab_rl.rsl_rl.export_policy_as_jit``, so the
+variants go through the export cache like the other artifacts. :func:`action_deviation` replays recorded
+observations (``exported/obs_replay.npy``, written by ``play.py --record_obs``) through the float32 policy and a
+variant.
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import os
+from collections.abc import Callable
+
+import numpy as np
+import torch
+
+PRECISIONS = ("int8", "fp16", "bf16")
+"""Reduced-precision variants of the actor."""
+
+OBS_REPLAY_FILE = "obs_replay.npy"
+"""Recorded policy observations (float32, (n, obs_dim)) in the export directory."""
+
+
+def variant_filename(precision: str) -> str:
+    return f"policy_{precision}.pt"
+
+
+class _ReducedPrecisionPolicy(torch.nn.Module):
+    """Float32 normalizer followed by the actor in ``dtype`` (int8 actors run on float32 inputs)."""
+
+    def __init__(self, actor: torch.nn.Module, normalizer: torch.nn.Module, dtype: torch.dtype, obs_dim: int):
+        super().__init__()
+        self.actor = actor
+        self.normalizer = normalizer
+        self.dtype = dtype
+        # the packed int8 weights are not parameters, so the sizes are stored for the deployment tools
+        self.obs_dim = obs_dim
+        self.action_dim = [m for m in actor.modules() if hasattr(m, "out_features")][-1].out_features
+
+    def forward(self, x):
+        return self.actor(self.normalizer(x).to(self.dtype)).float()
+
+
+def make_variant(policy, normalizer, precision: str) -> torch.nn.Module:
+    """The actor of ``policy`` with its normalizer, in the given precision, on the CPU."""
+    actor = copy.deepcopy(policy.actor).cpu().float().eval()
+    normalizer = copy.deepcopy(normalizer).cpu().eval() if normalizer is not None else torch.nn.Identity()
+    obs_dim = [m for m in actor.modules() if isinstance(m, torch.nn.Linear)][0].in_features
+    if precision == "int8":
+        actor = torch.ao.quantization.quantize_dynamic(actor, {torch.nn.Linear}, dtype=torch.qint8)
+        dtype = torch.float32
+    elif precision in ("fp16", "bf16"):
+        dtype = torch.float16 if precision == "fp16" else torch.bfloat16
+        actor = actor.to(dtype)
+    else:
+        raise ValueError(f"Unknown precision: {precision} (expected one of {PRECISIONS})")
+    return _ReducedPrecisionPolicy(actor, normalizer, dtype, obs_dim).eval()
+
+
+def export_policy_variant(policy, normalizer, path: str, filename: str, precision: str):
+    """Script the ``precision`` variant of ``policy`` and save it to ``path/filename``."""
+    os.makedirs(path, exist_ok=True)
+    torch.jit.script(make_variant(policy, normalizer, precision)).save(os.path.join(path, filename))
+
+
+def variant_exporters(precisions: list[str]) -> dict[str, Callable]:
+    """Output file name -> exporter for the export cache, one per precision."""
+    return {variant_filename(p): functools.partial(export_policy_variant, precision=p) for p in precisions or []}
+
+
+def action_deviation(reference: Callable, variant: Callable, obs: np.ndarray, batch_size: int = 4096) -> dict:
+    """Maximum and mean absolute action difference between two policies over the observations ``obs``."""
+    max_error, sum_error = 0.0, 0.0
+    with torch.inference_mode():
+        for start in range(0, len(obs), batch_size):
+            batch = torch.from_numpy(np.ascontiguousarray(obs[start : start + batch_size], dtype=np.float32))
+            error = (variant(batch) - reference(batch)).abs()
+            max_error = max(max_error, error.max().item())
+            sum_error += error.mean(dim=-1).sum().item()
+    return {"max": max_error, "mean": sum_error / len(obs)}
+
+
+def report_deviation(export_dir: str, precisions: list[str], obs_path: str | None = None):
+    """Print the action deviation of the exported variants from ``policy.pt`` on the recorded observations."""
+    obs_path = obs_path or os.path.join(export_dir, OBS_REPLAY_FILE)
+    if not os.path.isfile(obs_path):
+        print(f"[INFO] No recorded observations at {obs_path}; record them with play.py --record_obs.")
+        return
+    obs = np.load(obs_path)
+    reference = torch.jit.load(os.path.join(export_dir, "policy.pt"), map_location="cpu").eval()
+    for precision in precisions:
+        variant = torch.jit.load(os.path.join(export_dir, variant_filename(precision)), map_location="cpu").eval()
+        deviation = action_deviation(reference, variant, obs)
+        print(
+            f"[INFO] {variant_filename(precision)}: max action deviation {deviation['max']:.3e}"
+            f" (mean {deviation['mean']:.3e}) over {len(obs)} recorded observations"
+        )
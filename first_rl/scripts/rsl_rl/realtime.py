@@ -0,0 +1,188 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Fixed-rate control loop for ``play.py --real-time`` with latency and jitter instrumentation.
+
+:class:`FixedRateScheduler` releases the loop at ``t0 + k * period`` on the monotonic clock. Deadlines are absolute,
+so the time spent in a step never accumulates into drift. The wait sleeps until shortly before the deadline and spins
+for the rest, which bounds the wake-up lateness by the spin margin instead of by the OS sleep granularity. A step
+that overruns its period is counted as a missed deadline; the following steps then run back to back until the loop
+is on schedule again, unless it is more than ``max_lag`` periods behind, in which case the missed deadlines are
+skipped and the loop continues at the next deadline of the original schedule.
+
+:class:`LoopStats` records the duration of each named stage of a step (e.g. policy inference and environment
+stepping) in a log-spaced :class:`LatencyHistogram`, together with the stage's jitter (difference to the duration
+of the previous step), and prints a summary with the scheduler's deadline statistics on exit.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+
+
+class LatencyHistogram:
+    """Log-spaced histogram of durations in seconds (``bins_per_decade`` bins between ``min_s`` and ``max_s``)."""
+
+    def __init__(self, min_s: float = 1e-6, max_s: float = 10.0, bins_per_decade: int = 20):
+        num_bins = int(round(math.log10(max_s / min_s) * bins_per_decade))
+        self.edges = [min_s * 10 ** (i / bins_per_decade) for i in range(num_bins + 1)]
+        # one underflow and one overflow bin
+        self.counts = [0] * (num_bins + 2)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float):
+        self.counts[bisect.bisect_right(self.edges, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        """Upper edge of the bin holding the ``q``-th percentile (resolution of one bin)."""
+        if self.count == 0:
+            return 0.0
+        target = q / 100.0 * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target and count > 0:
+                return self.edges[i] if i < len(self.edges) else self.max
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class FixedRateScheduler:
+    """Releases a loop every ``period`` seconds on absolute deadlines.
+
+    Args:
+        period: Loop period in seconds (``env.unwrapped.step_dt``).
+        max_lag: Maximum lag, in periods, that is caught up after an overrun; beyond it the missed deadlines are
+            skipped (0: never catch up).
+        spin: Seconds before the deadline at which the sleep switches to busy waiting.
+        clock: Monotonic clock in seconds.
+    """
+
+    def __init__(
+        self,
+        period: float,
+        max_lag: int = 5,
+        spin: float = 5e-4,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.period = period
+        self.max_lag = max_lag
+        self.spin = spin
+        self.clock = clock
+        self.lateness = LatencyHistogram()
+        self.num_steps = 0
+        self.num_missed = 0
+        self.num_skipped = 0
+        self.start()
+
+    def start(self):
+        """Anchor the schedule at the current time (the first step is due now)."""
+        self._start = self.clock()
+        self._deadline = self._start + self.period
+
+    def wait(self):
+        """Block until the next deadline; return immediately if it has already passed."""
+        self.num_steps += 1
+        now = self.clock()
+        if now < self._deadline:
+            remaining = self._deadline - now - self.spin
+            if remaining > 0:
+                time.sleep(remaining)
+            while self.clock() < self._deadline:
+                pass
+            self.lateness.add(self.clock() - self._deadline)
+            self._deadline += self.period
+            return
+        # the step overran its period
+        self.num_missed += 1
+        lag = now - self._deadline
+        self.lateness.add(lag)
+        if lag <= self.max_lag * self.period:
+            self._deadline += self.period
+        else:
+            skipped = int(lag // self.period)
+            self.num_skipped += skipped
+            self._deadline += (skipped + 1) * self.period
+
+    @property
+    def elapsed(self) -> float:
+        return self.clock() - self._start
+
+
+class LoopStats:
+    """Per-stage durations and jitter of a control loop.
+
+    Args:
+        stages: Names of the timed stages.
+        sync: Called before a stage is stopped (e.g. ``torch.cuda.synchronize``), so that asynchronous work is
+            attributed to the stage that launched it.
+        clock: Monotonic clock in seconds.
+        enabled: If False, :meth:`stage` and :meth:`print_summary` do nothing (no clock reads, no syncs).
+    """
+
+    def __init__(
+        self,
+        stages: list[str],
+        sync: Callable[[], None] | None = None,
+        clock=time.perf_counter,
+        enabled: bool = True,
+    ):
+        self.enabled = enabled
+        self.sync = sync
+        self.clock = clock
+        self.latency = {name: LatencyHistogram() for name in stages}
+        self.jitter = {name: LatencyHistogram() for name in stages}
+        self._last: dict[str, float | None] = {name: None for name in stages}
+
+    @contextmanager
+    def stage(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        start = self.clock()
+        yield
+        if self.sync is not None:
+            self.sync()
+        self.add(name, self.clock() - start)
+
+    def add(self, name: str, duration: float):
+        self.latency[name].add(duration)
+        if self._last[name] is not None:
+            self.jitter[name].add(abs(duration - self._last[name]))
+        self._last[name] = duration
+
+    def print_summary(self, scheduler: FixedRateScheduler | None = None):
+        if not self.enabled:
+            return
+        print("[INFO] Control loop timing (ms):")
+        print(f"{'stage':<12}{'steps':>8}{'mean':>9}{'p50':>9}{'p99':>9}{'max':>9}{'jitter p50':>12}{'jitter p99':>12}")
+        for name, hist in self.latency.items():
+            jitter = self.jitter[name]
+            print(
+                f"{name:<12}{hist.count:>8}{hist.mean * 1e3:>9.3f}{hist.percentile(50) * 1e3:>9.3f}"
+                f"{hist.percentile(99) * 1e3:>9.3f}{hist.max * 1e3:>9.3f}"
+                f"{jitter.percentile(50) * 1e3:>12.3f}{jitter.percentile(99) * 1e3:>12.3f}"
+            )
+        if scheduler is not None and scheduler.num_steps > 0:
+            rate = scheduler.num_steps / scheduler.elapsed
+            lateness = scheduler.lateness
+            print(
+                f"[INFO] Scheduler: {scheduler.num_steps} steps at {rate:.2f} Hz (target {1.0 / scheduler.period:.2f}"
+                f" Hz), {scheduler.num_missed} missed deadlines, {scheduler.num_skipped} skipped, wake-up lateness"
+                f" p50 {lateness.percentile(50) * 1e3:.3f} ms, p99 {lateness.percentile(99) * 1e3:.3f} ms,"
+                f" max {lateness.max * 1e3:.3f} ms"
+            )
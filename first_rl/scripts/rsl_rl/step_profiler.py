@@ -0,0 +1,137 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Opt-in per-manager step-time profiler for RSL-RL training.
+
+The profiler wraps the manager calls of the unwrapped environment (action, physics, observation, reward, termination,
+event, reset) and the policy inference and PPO update of the runner with timers. On CUDA the timers are pairs of CUDA
+events recorded on the current stream, so timing a step issues no host sync; all events of an iteration are resolved
+once, right after the PPO update (which synchronizes anyway). On CPU :func:`time.perf_counter` is used.
+
+The totals of each iteration (in milliseconds) are added to the episode infos of ``OnPolicyRunner.log`` under
+``Profile/<section>_ms``, so they are printed with the iteration summary and written to the logger selected by
+``--logger`` (tensorboard, wandb or neptune).
+"""
+
+from __future__ import annotations
+
+import time
+
+import torch
+
+ENV_SECTIONS = {
+    "action": (("action_manager", "process_action"), ("action_manager", "apply_action")),
+    # ManagerBasedRLEnv: write_data_to_sim + sim.step + scene.update; kinematic stand-in: scene.step
+    "physics": (("scene", "write_data_to_sim"), ("sim", "step"), ("scene", "update"), ("scene", "step")),
+    "observation": (("observation_manager", "compute"),),
+    "reward": (("reward_manager", "compute"),),
+    "termination": (("termination_manager", "compute"),),
+    "event": (("event_manager", "apply"),),
+    "reset": ((None, "_reset_idx"),),
+    "env_step": ((None, "step"),),
+}
+"""Timed sections of the environment: section name -> (attribute of the unwrapped env or None, method name).
+
+Sections can be nested: ``reset`` contains the reset-mode ``event`` calls and ``env_step`` contains all the others.
+Methods that do not exist on the environment are skipped.
+"""
+
+
+class StepProfiler:
+    """Accumulates the time spent in named sections during one training iteration."""
+
+    def __init__(self, device: str):
+        self.use_cuda = torch.device(device).type == "cuda"
+        self._pending: dict[str, list] = {}
+        self._event_pool: list[tuple[torch.cuda.Event, torch.cuda.Event]] = []
+        self._cpu_totals: dict[str, float] = {}
+        self.last_timings: dict[str, float] = {}
+
+    def wrap(self, obj, method_name: str, section: str):
+        """Replace ``obj.method_name`` by a timed version that accounts to ``section``."""
+        method = getattr(obj, method_name)
+
+        def timed(*args, **kwargs):
+            token = self._start()
+            out = method(*args, **kwargs)
+            self._stop(section, token)
+            return out
+
+        setattr(obj, method_name, timed)
+
+    def attach(self, env, runner):
+        """Wrap the environment managers and the runner, and log the timings with each iteration summary.
+
+        Args:
+            env: The wrapped environment passed to the runner (its ``unwrapped`` env is instrumented).
+            runner: The RSL-RL runner.
+        """
+        unwrapped = env.unwrapped
+        for section, targets in ENV_SECTIONS.items():
+            for attr_name, method_name in targets:
+                obj = unwrapped if attr_name is None else getattr(unwrapped, attr_name, None)
+                if obj is not None and callable(getattr(obj, method_name, None)):
+                    self.wrap(obj, method_name, section)
+        self.wrap(runner.alg, "act", "policy")
+
+        # resolve the events right after the update: its loss values are read back on the host anyway
+        update = runner.alg.update
+
+        def timed_update(*args, **kwargs):
+            token = self._start()
+            out = update(*args, **kwargs)
+            self._stop("learn", token)
+            self.last_timings = self.collect()
+            return out
+
+        runner.alg.update = timed_update
+
+        log = runner.log
+
+        def log_with_profile(locs: dict, *args, **kwargs):
+            timings = {f"Profile/{name}_ms": value for name, value in self.last_timings.items()}
+            ep_infos = locs["ep_infos"]
+            # the runner only logs the keys of the first episode info
+            first = ep_infos[0] if ep_infos else {}
+            locs = dict(locs, ep_infos=[{**first, **timings}, *ep_infos[1:]])
+            return log(locs, *args, **kwargs)
+
+        runner.log = log_with_profile
+
+    def collect(self) -> dict[str, float]:
+        """Return the milliseconds spent per section since the last call and start a new accumulation."""
+        if self.use_cuda:
+            torch.cuda.synchronize()
+            timings = {}
+            for section, pairs in self._pending.items():
+                timings[section] = sum(start.elapsed_time(end) for start, end in pairs)
+                self._event_pool.extend(pairs)
+                pairs.clear()
+        else:
+            timings = {section: total * 1e3 for section, total in self._cpu_totals.items()}
+            self._cpu_totals.clear()
+        return timings
+
+    """
+    Internal helpers.
+    """
+
+    def _start(self):
+        if self.use_cuda:
+            pair = self._event_pool.pop() if self._event_pool else self._new_event_pair()
+            pair[0].record()
+            return pair
+        return time.perf_counter()
+
+    def _stop(self, section: str, token):
+        if self.use_cuda:
+            token[1].record()
+            self._pending.setdefault(section, []).append(token)
+        else:
+            self._cpu_totals[section] = self._cpu_totals.get(section, 0.0) + time.perf_counter() - token
+
+    @staticmethod
+    def _new_event_pair() -> tuple[torch.cuda.Event, torch.cuda.Event]:
+        return torch.cuda.Event(enable_timing=True), torch.cuda.Event(enable_timing=True)
@@ -0,0 +1,39 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Log the on-device task statistics of FirstRL-v0 once per training iteration.
+
+The task state of the environment (``env.unwrapped.task_state``) accumulates its statistics on the device during the
+rollout, without host syncs. The statistics are popped when the runner logs the iteration and added to the episode
+infos of ``OnPolicyRunner.log``, so they are printed with the iteration summary and written to the logger selected by
+``--logger``. The only host transfer is the one the runner does when it logs the episode infos.
+"""
+
+from __future__ import annotations
+
+
+def attach_task_log(env, runner):
+    """Add the statistics of the task state to the episode infos of every ``runner.log`` call.
+
+    Args:
+        env: The wrapped environment passed to the runner (its ``unwrapped`` env holds the task state).
+        runner: The RSL-RL runner.
+    """
+    unwrapped = env.unwrapped
+    log = runner.log
+
+    def log_with_task_stats(locs: dict, *args, **kwargs):
+        # the task state is created by the first term call, i.e. already when the managers are set up
+        task_state = getattr(unwrapped, "task_state", None)
+        if task_state is None:
+            return log(locs, *args, **kwargs)
+        stats = task_state.pop_log()
+        ep_infos = locs["ep_infos"]
+        # the runner only logs the keys of the first episode info
+        first = ep_infos[0] if ep_infos else {}
+        locs = dict(locs, ep_infos=[{**first, **stats}, *ep_infos[1:]])
+        return log(locs, *args, **kwargs)
+
+    runner.log = log_with_task_stats
@@ -0,0 +1,91 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Capture a :mod:`torch.profiler` trace of full RSL-RL training iterations.
+
+The profiler is stepped after each PPO update, so one profiler step is one iteration (rollout collection, return
+computation and update). The first ``warmup`` iterations are skipped (the last of them serves as the profiler's own
+warm-up), then ``iterations`` iterations are recorded. The environment steps and the PPO updates are labelled with
+:func:`torch.profiler.record_function` ranges (``env_step``, ``ppo_update``).
+
+When the recording is done, the following files are written to ``<log_dir>/profiler``:
+
+* ``trace.json``: Chrome trace, viewable in ``chrome://tracing`` or https://ui.perfetto.dev.
+* ``summary.txt``: operators sorted by self time (device time on CUDA, CPU time otherwise).
+"""
+
+from __future__ import annotations
+
+import os
+
+import torch
+from torch.profiler import ProfilerActivity, profile, record_function, schedule
+
+
+class TraceProfiler:
+    """Records ``iterations`` training iterations after ``warmup`` skipped ones."""
+
+    def __init__(self, log_dir: str, device: str, iterations: int, warmup: int = 5, row_limit: int = 30):
+        self.output_dir = os.path.join(log_dir, "profiler")
+        self.use_cuda = torch.device(device).type == "cuda"
+        self.row_limit = row_limit
+        activities = [ProfilerActivity.CPU] + ([ProfilerActivity.CUDA] if self.use_cuda else [])
+        self.profiler = profile(
+            activities=activities,
+            schedule=schedule(
+                skip_first=max(warmup - 1, 0), wait=0, warmup=min(warmup, 1), active=iterations, repeat=1
+            ),
+            on_trace_ready=self._write_results,
+        )
+        self._recording = False
+
+    def attach(self, env, runner):
+        """Label the env steps and PPO updates and step the profiler after every update.
+
+        Args:
+            env: The wrapped environment passed to the runner.
+            runner: The RSL-RL runner.
+        """
+        env_step = env.step
+
+        def labelled_step(*args, **kwargs):
+            with record_function("env_step"):
+                return env_step(*args, **kwargs)
+
+        env.step = labelled_step
+
+        update = runner.alg.update
+
+        def profiled_update(*args, **kwargs):
+            with record_function("ppo_update"):
+                out = update(*args, **kwargs)
+            self.profiler.step()
+            return out
+
+        runner.alg.update = profiled_update
+
+    def start(self):
+        """Start the profiler (call right before ``runner.learn``)."""
+        self.profiler.start()
+        self._recording = True
+
+    def stop(self):
+        """Stop the profiler; writes the results if training ended while recording."""
+        if self._recording:
+            self.profiler.stop()
+            self._recording = False
+
+    def _write_results(self, prof: profile):
+        os.makedirs(self.output_dir, exist_ok=True)
+        trace_path = os.path.join(self.output_dir, "trace.json")
+        prof.export_chrome_trace(trace_path)
+
+        sort_by = "self_device_time_total" if self.use_cuda else "self_cpu_time_total"
+        table = prof.key_averages().table(sort_by=sort_by, row_limit=self.row_limit)
+        summary_path = os.path.join(self.output_dir, "summary.txt")
+        with open(summary_path, "w") as f:
+            f.write(table)
+        print(f"[INFO] Top operators by {sort_by}:\n{table}")
+        print(f"[INFO] Profiler trace written to: {trace_path}")
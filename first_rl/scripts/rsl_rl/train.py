@@ -13,7 +13,12 @@ import sys
 from isaaclab.app import AppLauncher
 
 # local imports
+import bc_pretrain  # isort: skip
 import cli_args  # isort: skip
+import step_profiler  # isort: skip
+import task_log  # isort: skip
+import trace_profiler  # isort: skip
+import trajectory_recorder  # isort: skip
 
 # add argparse arguments
 parser = argparse.ArgumentParser(description="Train an RL agent with RSL-RL.")
@@ -31,11 +36,48 @@ parser.add_argument(
     "--distributed", action="store_true", default=False, help="Run training with multiple GPUs or nodes."
 )
 parser.add_argument("--export_io_descriptors", action="store_true", default=False, help="Export IO descriptors.")
+parser.add_argument(
+    "--step_profile",
+    action="store_true",
+    default=False,
+    help="Time the env managers, policy inference and PPO update, and log the totals every iteration.",
+)
+parser.add_argument(
+    "--profile_iterations",
+    type=int,
+    default=0,
+    help="Record a torch.profiler trace of this many training iterations into <log_dir>/profiler (0 disables it).",
+)
+parser.add_argument(
+    "--profile_warmup", type=int, default=5, help="Training iterations to skip before the torch.profiler recording."
+)
+parser.add_argument(
+    "--record_trajectories",
+    action="store_true",
+    default=False,
+    help="Record the training rollouts into memory-mapped shards in <log_dir>/trajectories.",
+)
+parser.add_argument("--record_shard_steps", type=int, default=256, help="Steps per shard of the recorded rollouts.")
+parser.add_argument(
+    "--record_failures",
+    action="store_true",
+    default=False,
+    help="Dump the last steps of the failed episodes to <log_dir>/failures.",
+)
+parser.add_argument(
+    "--failure_reasons",
+    type=str,
+    nargs="+",
+    default=["fail_drop", "out_of_table"],
+    help="Termination reasons whose episodes are dumped.",
+)
+parser.add_argument("--failure_window", type=int, default=64, help="Steps dumped per failed episode.")
 parser.add_argument(
     "--ray-proc-id", "-rid", type=int, default=None, help="Automatically configured by Ray integration, otherwise None."
 )
 # append RSL-RL cli arguments
 cli_args.add_rsl_rl_args(parser)
+bc_pretrain.add_bc_args(parser)
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
 args_cli, hydra_args = parser.parse_known_args()
@@ -104,6 +146,7 @@ from isaaclab_tasks.utils.hydra import hydra_task_config
 logger = logging.getLogger(__name__)
 
 import first_rl.tasks  # noqa: F401
+from first_rl.tasks.manager_based.first_rl.mdp.task_state import TerminationReason
 
 torch.backends.cuda.matmul.allow_tf32 = True
 torch.backends.cudnn.allow_tf32 = True
@@ -192,6 +235,10 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
 
     # wrap around environment for rsl-rl
     env = RslRlVecEnvWrapper(env, clip_actions=agent_cfg.clip_actions)
+    # stream the rollouts to disk and dump the last steps of the failed episodes
+    env = trajectory_recorder.wrap_recorders(
+        env, args_cli, [reason.name.lower() for reason in TerminationReason], log_dir=log_dir
+    )
     
     # create runner from rsl-rl
     if agent_cfg.class_name == "OnPolicyRunner":
@@ -202,18 +249,55 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
         raise ValueError(f"Unsupported runner class: {agent_cfg.class_name}")
     # write git state to logs
     runner.add_git_repo_to_log(__file__)
+    # log the on-device task statistics (termination reasons, ...) once per iteration
+    task_log.attach_task_log(env, runner)
+    # instrument the env managers and the PPO update
+    if args_cli.step_profile:
+        step_profiler.StepProfiler(agent_cfg.device).attach(env, runner)
+    # record a torch.profiler trace of full iterations
+    profiler = None
+    if args_cli.profile_iterations > 0:
+        profiler = trace_profiler.TraceProfiler(
+            log_dir, agent_cfg.device, iterations=args_cli.profile_iterations, warmup=args_cli.profile_warmup
+        )
+        profiler.attach(env, runner)
     # load the checkpoint
     if agent_cfg.resume or agent_cfg.algorithm.class_name == "Distillation":
         print(f"[INFO]: Loading model checkpoint from: {resume_path}")
         # load previously trained model
         runner.load(resume_path)
+    # warm-start the actor on recorded demonstrations
+    if args_cli.bc_demos:
+        if agent_cfg.class_name != "OnPolicyRunner":
+            raise ValueError("Behavior-cloning pretraining requires the OnPolicyRunner.")
+        policy = runner.alg.policy
+        demo_loader = bc_pretrain.DemoLoader(
+            args_cli.bc_demos,
+            obs_fields=[f"obs_{group}" for group in policy.obs_groups["policy"]],
+            batch_size=args_cli.bc_batch_size,
+            success_only=args_cli.bc_success_only,
+            device=agent_cfg.device,
+            seed=agent_cfg.seed,
+        )
+        bc_pretrain.pretrain_actor(
+            policy,
+            demo_loader,
+            args_cli.bc_epochs,
+            learning_rate=args_cli.bc_learning_rate,
+            clip_actions=agent_cfg.clip_actions,
+            noise_std=args_cli.bc_noise_std,
+        )
 
     # dump the configuration into log-directory
     dump_yaml(os.path.join(log_dir, "params", "env.yaml"), env_cfg)
     dump_yaml(os.path.join(log_dir, "params", "agent.yaml"), agent_cfg)
 
     # run training
+    if profiler is not None:
+        profiler.start()
     runner.learn(num_learning_iterations=agent_cfg.max_iterations, init_at_random_ep_len=True)
+    if profiler is not None:
+        profiler.stop()
 
     print(f"Training time: {round(time.time() - start_time, 2)} seconds")
 
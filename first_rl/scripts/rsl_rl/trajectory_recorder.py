@@ -0,0 +1,343 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Opt-in recorder of the rollouts of ``train.py`` and ``play.py`` into memory-mapped ``.npy`` shards.
+
+:class:`TrajectoryRecorder` wraps the RSL-RL vector environment (``RslRlVecEnvWrapper``) and records, for every
+step, the observations the actions were computed from, the actions, rewards, dones and, for tasks with a
+``task_state``, the termination reasons. Steps are staged on the device and copied in blocks of ``block_steps``
+steps to pinned host buffers (non-blocking); a background thread writes the blocks into fixed-size shards, so the
+stepping thread never waits for the disk. The number of host buffers is bounded: if the writer falls behind, the
+stepping thread waits for a free buffer (the wait time is reported on close) instead of growing the memory.
+
+Layout of the output directory::
+
+    manifest.json                  # fields (dtype, per-env shape), num_envs, shards and their number of steps
+    shard_00000/<field>.npy        # (shard_steps, num_envs, *shape), the last shard is only partially filled
+    ...
+
+Fields: ``obs_<group>`` for every observation group, ``actions``, ``rewards``, ``dones`` (uint8) and ``reasons``
+(int8 termination reason codes, ``manifest["reason_names"]``). The manifest is rewritten after every completed
+shard, so a dataset can be read while the recording is still running. :class:`TrajectoryDataset` reopens it lazily
+(one read-only memory map per shard and field).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+import torch
+from rsl_rl.env import VecEnv
+from tensordict import TensorDict
+
+from failure_recorder import FailureRecorder  # isort: skip
+
+DATASET_FORMAT = 1
+"""Version of the shard layout, stored in the manifest."""
+
+
+class TrajectoryRecorder(VecEnv):
+    """Records the rollouts of an RSL-RL vector environment while forwarding it unchanged.
+
+    Args:
+        env: The wrapped environment (``RslRlVecEnvWrapper`` or an equivalent ``VecEnv``).
+        output_dir: Directory of the dataset (created, must not contain a dataset already).
+        shard_steps: Steps per shard.
+        block_steps: Steps staged on the device before one copy to the host.
+        num_buffers: Pinned host buffers (each holding one block) shared with the writer thread.
+        reason_names: Names of the termination reason codes (recorded when the task has a ``task_state``).
+    """
+
+    def __init__(
+        self,
+        env: VecEnv,
+        output_dir: str,
+        shard_steps: int = 256,
+        block_steps: int = 16,
+        num_buffers: int = 4,
+        reason_names: list[str] | None = None,
+    ):
+        self.env = env
+        self.num_envs = env.num_envs
+        self.num_actions = env.num_actions
+        self.device = env.device
+        self.max_episode_length = env.max_episode_length
+        self.output_dir = output_dir
+        self.shard_steps = shard_steps
+        self.block_steps = block_steps
+        if os.path.isfile(os.path.join(output_dir, "manifest.json")):
+            raise FileExistsError(f"A trajectory dataset already exists in: {output_dir}")
+        os.makedirs(output_dir, exist_ok=True)
+
+        self._obs = env.get_observations()
+        self._task_state = getattr(env.unwrapped, "task_state", None)
+        fields = {f"obs_{group}": (torch.float32, tuple(value.shape[1:])) for group, value in self._obs.items()}
+        fields["actions"] = (torch.float32, (self.num_actions,))
+        fields["rewards"] = (torch.float32, ())
+        fields["dones"] = (torch.uint8, ())
+        if self._task_state is not None:
+            fields["reasons"] = (torch.int8, ())
+        self.fields = fields
+
+        # device staging block and the host buffers it is copied to
+        pin = torch.device(self.device).type == "cuda"
+        self._stage = {
+            name: torch.zeros(block_steps, self.num_envs, *shape, dtype=dtype, device=self.device)
+            for name, (dtype, shape) in fields.items()
+        }
+        self._free: queue.Queue = queue.Queue()
+        for _ in range(num_buffers):
+            self._free.put(
+                {
+                    name: torch.zeros(block_steps, self.num_envs, *shape, dtype=dtype, pin_memory=pin)
+                    for name, (dtype, shape) in fields.items()
+                }
+            )
+        self._filled: queue.Queue = queue.Queue()
+        self._step_in_block = 0
+        self.wait_time = 0.0
+
+        self.manifest = {
+            "format": DATASET_FORMAT,
+            "num_envs": self.num_envs,
+            "shard_steps": shard_steps,
+            "fields": {
+                name: {"dtype": str(dtype).replace("torch.", ""), "shape": list(shape)}
+                for name, (dtype, shape) in fields.items()
+            },
+            "reason_names": reason_names,
+            "shards": [],
+            "num_steps": 0,
+            "complete": False,
+        }
+        self._shard: dict[str, np.memmap] | None = None
+        self._shard_fill = 0
+        self._error: BaseException | None = None
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    """
+    VecEnv interface.
+    """
+
+    @property
+    def cfg(self):
+        return self.env.cfg
+
+    @property
+    def unwrapped(self):
+        return self.env.unwrapped
+
+    @property
+    def episode_length_buf(self) -> torch.Tensor:
+        return self.env.episode_length_buf
+
+    @episode_length_buf.setter
+    def episode_length_buf(self, value: torch.Tensor):
+        self.env.episode_length_buf = value
+
+    def seed(self, seed: int = -1) -> int:
+        return self.env.seed(seed)
+
+    def reset(self) -> tuple[TensorDict, dict]:
+        obs, extras = self.env.reset()
+        self._obs = obs
+        return obs, extras
+
+    def get_observations(self) -> TensorDict:
+        self._obs = self.env.get_observations()
+        return self._obs
+
+    def step(self, actions: torch.Tensor) -> tuple[TensorDict, torch.Tensor, torch.Tensor, dict]:
+        obs, rewards, dones, extras = self.env.step(actions)
+        t = self._step_in_block
+        for group, value in self._obs.items():
+            self._stage[f"obs_{group}"][t].copy_(value)
+        self._stage["actions"][t].copy_(actions)
+        self._stage["rewards"][t].copy_(rewards)
+        self._stage["dones"][t].copy_(dones)
+        if self._task_state is not None:
+            self._stage["reasons"][t].copy_(self._task_state.termination_reason)
+        self._obs = obs
+        self._step_in_block += 1
+        if self._step_in_block == self.block_steps:
+            self._send_block()
+        return obs, rewards, dones, extras
+
+    def close(self):
+        """Write the staged steps, wait for the writer and finalize the manifest, then close the environment."""
+        if self._writer.is_alive():
+            if self._step_in_block > 0:
+                self._send_block()
+            self._filled.put(None)
+            self._writer.join()
+        self._raise_writer_error()
+        print(
+            f"[INFO] Recorded {self.manifest['num_steps']} steps x {self.num_envs} envs to: {self.output_dir}"
+            f" (stepping waited {self.wait_time:.2f} s for the writer)"
+        )
+        return self.env.close()
+
+    """
+    Internal helpers.
+    """
+
+    def _send_block(self):
+        self._raise_writer_error()
+        start = time.perf_counter()
+        buffers = self._free.get()
+        self.wait_time += time.perf_counter() - start
+        if buffers is None:
+            self._raise_writer_error()
+        num_steps = self._step_in_block
+        for name, stage in self._stage.items():
+            buffers[name][:num_steps].copy_(stage[:num_steps], non_blocking=True)
+        event = None
+        if torch.device(self.device).type == "cuda":
+            event = torch.cuda.Event()
+            event.record()
+        self._filled.put((buffers, num_steps, event))
+        self._step_in_block = 0
+
+    def _raise_writer_error(self):
+        if self._error is not None:
+            raise RuntimeError("The trajectory writer thread failed.") from self._error
+
+    def _write_loop(self):
+        try:
+            while True:
+                item = self._filled.get()
+                if item is None:
+                    break
+                buffers, num_steps, event = item
+                if event is not None:
+                    event.synchronize()
+                arrays = {name: buffer[:num_steps].numpy() for name, buffer in buffers.items()}
+                start = 0
+                while start < num_steps:
+                    if self._shard is None:
+                        self._open_shard()
+                    count = min(num_steps - start, self.shard_steps - self._shard_fill)
+                    for name, array in arrays.items():
+                        self._shard[name][self._shard_fill : self._shard_fill + count] = array[start : start + count]
+                    self._shard_fill += count
+                    start += count
+                    if self._shard_fill == self.shard_steps:
+                        self._close_shard()
+                self._free.put(buffers)
+            if self._shard is not None:
+                self._close_shard()
+            self.manifest["complete"] = True
+            self._save_manifest()
+        except BaseException as e:
+            self._error = e
+            # unblock the stepping thread, which raises the error
+            self._free.put(None)
+
+    def _open_shard(self):
+        shard_dir = os.path.join(self.output_dir, f"shard_{len(self.manifest['shards']):05d}")
+        os.makedirs(shard_dir, exist_ok=True)
+        self._shard = {
+            name: np.lib.format.open_memmap(
+                os.path.join(shard_dir, f"{name}.npy"),
+                mode="w+",
+                dtype=np.dtype(spec["dtype"]),
+                shape=(self.shard_steps, self.num_envs, *spec["shape"]),
+            )
+            for name, spec in self.manifest["fields"].items()
+        }
+        self._shard_fill = 0
+
+    def _close_shard(self):
+        for array in self._shard.values():
+            array.flush()
+        index = len(self.manifest["shards"])
+        self.manifest["shards"].append({"dir": f"shard_{index:05d}", "steps": self._shard_fill})
+        self.manifest["num_steps"] += self._shard_fill
+        self._shard = None
+        self._save_manifest()
+
+    def _save_manifest(self):
+        path = os.path.join(self.output_dir, "manifest.json")
+        with open(path + ".tmp", "w") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+
+class TrajectoryDataset:
+    """Lazy reader of a dataset written by :class:`TrajectoryRecorder`.
+
+    Shards are memory-mapped read-only on first access; ``dataset.shard(i)["actions"]`` has the shape
+    ``(steps, num_envs, num_actions)``, with ``steps`` the number of recorded steps of the shard.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "manifest.json")) as f:
+            self.manifest = json.load(f)
+        if self.manifest["format"] != DATASET_FORMAT:
+            raise ValueError(f"Unsupported trajectory dataset format: {self.manifest['format']}")
+        self.num_envs = self.manifest["num_envs"]
+        self.fields = self.manifest["fields"]
+        self._shards: dict[int, dict[str, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        """Number of recorded steps (each with ``num_envs`` transitions)."""
+        return self.manifest["num_steps"]
+
+    @property
+    def num_shards(self) -> int:
+        return len(self.manifest["shards"])
+
+    def shard(self, index: int) -> dict[str, np.ndarray]:
+        """Read-only memory maps of the fields of shard ``index``, cut to its recorded steps."""
+        if index not in self._shards:
+            info = self.manifest["shards"][index]
+            shard_dir = os.path.join(self.path, info["dir"])
+            self._shards[index] = {
+                name: np.load(os.path.join(shard_dir, f"{name}.npy"), mmap_mode="r")[: info["steps"]]
+                for name in self.fields
+            }
+        return self._shards[index]
+
+    def iter_shards(self, fields: list[str] | None = None):
+        """Yield the shards in order, optionally only some of the fields."""
+        for index in range(self.num_shards):
+            shard = self.shard(index)
+            yield {name: shard[name] for name in fields} if fields else shard
+
+
+def wrap_recorders(
+    env: VecEnv, args_cli: argparse.Namespace, reason_names: list[str], log_dir: str | None = None
+) -> VecEnv:
+    """Wrap ``env`` in the recorders enabled on the command line (``--record_trajectories``, ``--record_failures``).
+
+    Each flag is either the output directory (``play.py``) or a switch that records into ``<log_dir>/trajectories``
+    and ``<log_dir>/failures`` (``train.py``).
+    """
+    if args_cli.record_trajectories:
+        output_dir = args_cli.record_trajectories
+        if not isinstance(output_dir, str):
+            output_dir = os.path.join(log_dir, "trajectories")
+        env = TrajectoryRecorder(env, output_dir, shard_steps=args_cli.record_shard_steps, reason_names=reason_names)
+    # keep the last steps of every env and dump those of the failed episodes
+    if args_cli.record_failures:
+        output_dir = args_cli.record_failures
+        if not isinstance(output_dir, str):
+            output_dir = os.path.join(log_dir, "failures")
+        env = FailureRecorder(
+            env,
+            output_dir,
+            reason_names=reason_names,
+            reasons=tuple(args_cli.failure_reasons),
+            window=args_cli.failure_window,
+        )
+    return env
@@ -0,0 +1,125 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to run the FirstRL-v0 environment with the batched scripted expert.
+
+The expert (``mdp/scripted_expert.py``) computes the actions of all environments at once from the policy
+observations. The script prints the outcome of the finished episodes (termination reasons, i.e. the success-rate
+baseline of the task) and the step throughput every ``--report_every`` steps, and can record the rollouts as a
+trajectory dataset for the behavior-cloning warm start of ``train.py --bc_demos``.
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+import os
+import sys
+
+from isaaclab.app import AppLauncher
+
+# the trajectory recorder of the RSL-RL scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "rsl_rl"))
+import trajectory_recorder  # isort: skip
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Scripted expert agent for the FirstRL-v0 environment.")
+parser.add_argument(
+    "--disable_fabric", action="store_true", default=False, help="Disable fabric and use USD I/O operations."
+)
+parser.add_argument("--num_envs", type=int, default=None, help="Number of environments to simulate.")
+parser.add_argument("--task", type=str, default="FirstRL-v0", help="Name of the task.")
+parser.add_argument("--max_steps", type=int, default=None, help="Stop after this many control steps.")
+parser.add_argument("--report_every", type=int, default=500, help="Control steps between two outcome reports.")
+parser.add_argument(
+    "--record_trajectories", type=str, default=None, help="Record the rollouts into memory-mapped shards here."
+)
+parser.add_argument("--record_shard_steps", type=int, default=256, help="Steps per shard of the recorded rollouts.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import time
+
+import gymnasium as gym
+import torch
+
+from isaaclab_rl.rsl_rl import RslRlVecEnvWrapper
+
+import isaaclab_tasks  # noqa: F401
+from isaaclab_tasks.utils import parse_env_cfg
+
+import first_rl.tasks  # noqa: F401
+from first_rl.tasks.manager_based.first_rl.mdp.scripted_expert import ScriptedExpert
+from first_rl.tasks.manager_based.first_rl.mdp.task_state import TerminationReason
+
+
+def main():
+    """Scripted expert agent with Isaac Lab environment."""
+    # parse configuration
+    env_cfg = parse_env_cfg(
+        args_cli.task, device=args_cli.device, num_envs=args_cli.num_envs, use_fabric=not args_cli.disable_fabric
+    )
+    # create environment
+    env = RslRlVecEnvWrapper(gym.make(args_cli.task, cfg=env_cfg))
+    # stream the rollouts to disk
+    if args_cli.record_trajectories:
+        env = trajectory_recorder.TrajectoryRecorder(
+            env,
+            args_cli.record_trajectories,
+            shard_steps=args_cli.record_shard_steps,
+            reason_names=[reason.name.lower() for reason in TerminationReason],
+        )
+    state = env.unwrapped.task_state
+    expert = ScriptedExpert(
+        state.obs_layout,
+        device=env.unwrapped.device,
+        arm_scale=env_cfg.actions.arm_pos.scale,
+        gripper_scale=env_cfg.actions.gripper_pos.scale,
+        table_height=env_cfg.task_state.table_height,
+        cube_size=env_cfg.task_state.cube_size,
+        lift_height=env_cfg.rewards.transport_task.params["target_lift_height"],
+    )
+
+    # termination reasons of the finished episodes, accumulated on the device
+    counts = torch.zeros(len(TerminationReason), dtype=torch.long, device=env.unwrapped.device)
+    obs = env.get_observations()
+    step = 0
+    start_time = time.perf_counter()
+    # simulate environment
+    while simulation_app.is_running():
+        # run everything in inference mode
+        with torch.inference_mode():
+            obs, _, _, _ = env.step(expert.act(obs["policy"]))
+            counts += torch.bincount(state.termination_reason.long(), minlength=len(counts))
+        step += 1
+        if step % args_cli.report_every == 0 or step == args_cli.max_steps:
+            values = counts.tolist()
+            num_episodes = sum(values[1:])
+            outcome = ", ".join(
+                f"{reason.name.lower()} {values[reason] / max(num_episodes, 1):.1%}"
+                for reason in TerminationReason
+                if reason != TerminationReason.NONE
+            )
+            rate = step * env.num_envs / (time.perf_counter() - start_time)
+            print(f"[INFO] Step {step}: {num_episodes} episodes ({outcome}), {rate:.0f} env-steps/s")
+        if step == args_cli.max_steps:
+            break
+
+    # close the simulator
+    env.close()
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
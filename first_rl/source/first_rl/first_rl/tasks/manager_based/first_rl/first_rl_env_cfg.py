@@ -1,5 +1,6 @@
 from isaaclab.utils import configclass
 from isaaclab.envs import ManagerBasedRLEnvCfg
+from isaaclab.sim import SimulationCfg
 
 # ------------------------------------------------------------
 # 导入所有模块（资产、MDP、事件、重置、终止）
@@ -14,6 +15,10 @@ from .mdp.observations_cfg import ObservationsCfg
 from .mdp.rewards_cfg import RewardsCfg
 from .mdp.events_cfg import EventsCfg
 from .mdp.terminations_cfg import TerminationsCfg
+from .mdp.task_state_cfg import TaskStateCfg
+
+# 仿真 / 回合 / 场景参数与运动学替身环境共用
+from .mdp.task_params import DECIMATION, ENV_SPACING, EPISODE_LENGTH_S, NUM_ENVS, SIM_DT
 
 
 @configclass
@@ -26,16 +31,19 @@ class FirstRLEnvCfg(ManagerBasedRLEnvCfg):
     # ------------------------------------------------------------
     # 仿真步长倍率：Isaac Sim 默认物理步长是 60Hz (0.016s)
     # decimation=2 意味着策略网络的控制频率是 30Hz
-    decimation = 6
+    decimation = DECIMATION
     
     # 每个回合的最大时长 (秒)
-    episode_length_s = 20
+    episode_length_s = EPISODE_LENGTH_S
+
+    # 物理步长显式取共用的 SIM_DT（与 Isaac Sim 的默认值 1/60 s 相同）
+    sim: SimulationCfg = SimulationCfg(dt=SIM_DT)
 
     # ------------------------------------------------------------
     # 2. 场景资产（机器人、物体、传感器）
     # ------------------------------------------------------------
     # [关键修复] 在这里必须指定环境数量和间距
-    scene: SceneAssetsCfg = SceneAssetsCfg(num_envs=1024, env_spacing=2.5)
+    scene: SceneAssetsCfg = SceneAssetsCfg(num_envs=NUM_ENVS, env_spacing=ENV_SPACING)
 
     # ------------------------------------------------------------
     # 3. 动作空间（MDP）
@@ -57,7 +65,12 @@ class FirstRLEnvCfg(ManagerBasedRLEnvCfg):
     # ------------------------------------------------------------
     events: EventsCfg = EventsCfg()
 
+    # ------------------------------------------------------------
+    # 7. 任务状态缓存（观测 / 奖励 / 终止共用的每步几何量）
+    # ------------------------------------------------------------
+    task_state: TaskStateCfg = TaskStateCfg()
+
     # ------------------------------------------------------------
     # 8. 终止条件（RL 层）
     # ------------------------------------------------------------
-    terminations: TerminationsCfg = TerminationsCfg()
\ No newline at end of file
+    terminations: TerminationsCfg = TerminationsCfg()
@@ -0,0 +1,7 @@
+# kinematic/__init__.py
+# 运动学替身后端：不依赖 Isaac Sim / Isaac Lab，只依赖 torch（RSL-RL 包装另需 rsl_rl 与 tensordict）
+
+from .env import KinematicRLEnv
+from .env_cfg import KinematicEnvCfg
+from .scene import KinematicScene, SceneEntityCfg
+from .so101 import BODY_NAMES, JOINT_NAMES, SO101Kinematics
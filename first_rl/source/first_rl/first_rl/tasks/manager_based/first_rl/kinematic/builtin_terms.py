@@ -0,0 +1,73 @@
+# ================================================================
+#  builtin_terms.py
+#  FirstRLEnvCfg 中用到的 isaaclab.envs.mdp 内置函数（运动学替身环境中的同名实现）
+# ================================================================
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from .scene import SceneEntityCfg
+
+if TYPE_CHECKING:
+    from .env import KinematicRLEnv
+
+
+##
+# 观测 / 奖励
+##
+
+
+def last_action(env: KinematicRLEnv) -> torch.Tensor:
+    """上一步的原始动作（同 mdp.last_action）。"""
+    return env.action_manager.action
+
+
+def action_rate_l2(env: KinematicRLEnv) -> torch.Tensor:
+    """动作变化率的 L2 惩罚（同 mdp.action_rate_l2）。"""
+    return torch.sum(torch.square(env.action_manager.action - env.action_manager.prev_action), dim=1)
+
+
+##
+# 重置事件
+##
+
+
+def reset_scene_to_default(env: KinematicRLEnv, env_ids: torch.Tensor):
+    """把所有刚体与机器人恢复到默认状态（同 mdp.reset_scene_to_default）。"""
+    for rigid_object in env.scene.rigid_objects.values():
+        default_root_state = rigid_object.data.default_root_state[env_ids].clone()
+        default_root_state[:, 0:3] += env.scene.env_origins[env_ids]
+        rigid_object.write_root_state_to_sim(default_root_state, env_ids=env_ids)
+    for articulation in env.scene.articulations.values():
+        default_root_state = articulation.data.default_root_state[env_ids].clone()
+        default_root_state[:, 0:3] += env.scene.env_origins[env_ids]
+        articulation.write_root_state_to_sim(default_root_state, env_ids=env_ids)
+        default_joint_pos = articulation.data.default_joint_pos[env_ids].clone()
+        default_joint_vel = articulation.data.default_joint_vel[env_ids].clone()
+        articulation.write_joint_state_to_sim(default_joint_pos, default_joint_vel, env_ids=env_ids)
+
+
+def reset_joints_by_offset(
+    env: KinematicRLEnv,
+    env_ids: torch.Tensor,
+    position_range: tuple[float, float],
+    velocity_range: tuple[float, float],
+    asset_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
+):
+    """在默认关节状态上加均匀噪声，并裁剪到软限位内（同 mdp.reset_joints_by_offset）。"""
+    asset = env.scene[asset_cfg.name]
+    joint_ids = asset_cfg.joint_ids
+
+    joint_pos = asset.data.default_joint_pos[env_ids][:, joint_ids].clone()
+    joint_vel = asset.data.default_joint_vel[env_ids][:, joint_ids].clone()
+    joint_pos += torch.empty_like(joint_pos).uniform_(*position_range)
+    joint_vel += torch.empty_like(joint_vel).uniform_(*velocity_range)
+
+    joint_pos_limits = asset.data.soft_joint_pos_limits[env_ids][:, joint_ids]
+    joint_pos = joint_pos.clamp_(joint_pos_limits[..., 0], joint_pos_limits[..., 1])
+    joint_vel_limits = asset.data.soft_joint_vel_limits[env_ids][:, joint_ids]
+    joint_vel = joint_vel.clamp_(-joint_vel_limits, joint_vel_limits)
+
+    asset.write_joint_state_to_sim(joint_pos, joint_vel, joint_ids=joint_ids, env_ids=env_ids)
@@ -0,0 +1,110 @@
+# ================================================================
+#  env.py
+#  运动学替身环境：不启动 Isaac Sim，按 ManagerBasedRLEnv 的顺序执行 MDP
+# ================================================================
+
+from __future__ import annotations
+
+import math
+
+import torch
+
+from .env_cfg import KinematicEnvCfg
+from .managers import ActionManager, EventManager, ObservationManager, RewardManager, TerminationManager
+from .scene import KinematicScene
+
+
+class KinematicRLEnv:
+    """
+    📌 运动学替身环境（纯 torch，可在 CPU 上运行）
+    ------------------------------------------------
+    对 MDP 函数而言，它与 ManagerBasedRLEnv 提供同样的属性：
+    scene（robot / cube 数据、env_origins）、action_manager、episode_length_buf、common_step_counter、
+    max_episode_length、reset_buf 等，因此观测、奖励、终止、事件函数可以不加修改地直接运行。
+
+    step() 的顺序与 ManagerBasedRLEnv.step 相同：
+    处理动作 -> decimation 个物理步 -> 回合计数 +1 -> 终止 -> 奖励 -> 重置已结束的环境 -> 观测。
+    用途：在没有 GPU / Isaac Sim 的机器上跑通训练流程、测量我们自己代码（MDP + TaskState）的开销。
+    """
+
+    def __init__(self, cfg: KinematicEnvCfg):
+        self.cfg = cfg
+        self.num_envs = cfg.num_envs
+        self.device = cfg.device
+        if cfg.seed is not None:
+            torch.manual_seed(cfg.seed)
+
+        self.physics_dt = cfg.sim_dt
+        self.step_dt = cfg.sim_dt * cfg.decimation
+        self.max_episode_length_s = cfg.episode_length_s
+        self.max_episode_length = math.ceil(self.max_episode_length_s / self.step_dt)
+
+        self.scene = KinematicScene(cfg.num_envs, cfg.env_spacing, cfg.device)
+
+        # 回合缓冲
+        self.common_step_counter = 0
+        self.episode_length_buf = torch.zeros(self.num_envs, dtype=torch.long, device=self.device)
+        self.reset_buf = torch.zeros(self.num_envs, dtype=torch.bool, device=self.device)
+        self.reset_terminated = torch.zeros_like(self.reset_buf)
+        self.reset_time_outs = torch.zeros_like(self.reset_buf)
+        self.extras = {}
+
+        # 管理器加载顺序与 ManagerBasedRLEnv.load_managers 一致（观测管理器初始化时会调用一次观测函数）
+        self.event_manager = EventManager(cfg.events, self)
+        self.action_manager = ActionManager(cfg.actions, self)
+        self.observation_manager = ObservationManager(cfg.observations, self)
+        self.termination_manager = TerminationManager(cfg.terminations, self)
+        self.reward_manager = RewardManager(cfg.rewards, self)
+
+    @property
+    def unwrapped(self) -> KinematicRLEnv:
+        return self
+
+    def reset(self) -> tuple[dict[str, torch.Tensor], dict]:
+        """重置全部环境，返回 (观测, extras)。"""
+        env_ids = torch.arange(self.num_envs, dtype=torch.long, device=self.device)
+        self._reset_idx(env_ids)
+        self.obs_buf = self.observation_manager.compute()
+        return self.obs_buf, self.extras
+
+    def step(self, action: torch.Tensor):
+        """执行一个控制步，返回 (观测, 奖励, terminated, time_outs, extras)。"""
+        # --- 1. 动作 + 物理步 ---
+        self.action_manager.process_action(action.to(self.device))
+        for _ in range(self.cfg.decimation):
+            self.action_manager.apply_action()
+            self.scene.step(self.physics_dt)
+
+        # --- 2. 回合计数 ---
+        self.episode_length_buf += 1
+        self.common_step_counter += 1
+
+        # --- 3. 终止与奖励 ---
+        self.reset_buf = self.termination_manager.compute()
+        self.reset_terminated = self.termination_manager.terminated
+        self.reset_time_outs = self.termination_manager.time_outs
+        self.reward_buf = self.reward_manager.compute(dt=self.step_dt)
+
+        # --- 4. 重置已结束的环境 ---
+        reset_env_ids = self.reset_buf.nonzero(as_tuple=False).squeeze(-1)
+        if len(reset_env_ids) > 0:
+            self._reset_idx(reset_env_ids)
+
+        # --- 5. 观测（在重置之后计算）---
+        self.obs_buf = self.observation_manager.compute()
+        return self.obs_buf, self.reward_buf, self.reset_terminated, self.reset_time_outs, self.extras
+
+    def _reset_idx(self, env_ids: torch.Tensor):
+        self.scene.reset(env_ids)
+        self.event_manager.apply(mode="reset", env_ids=env_ids)
+
+        self.extras["log"] = dict()
+        self.extras["log"].update(self.observation_manager.reset(env_ids))
+        self.extras["log"].update(self.action_manager.reset(env_ids))
+        self.extras["log"].update(self.reward_manager.reset(env_ids))
+        self.extras["log"].update(self.termination_manager.reset(env_ids))
+
+        self.episode_length_buf[env_ids] = 0
+
+    def close(self):
+        pass
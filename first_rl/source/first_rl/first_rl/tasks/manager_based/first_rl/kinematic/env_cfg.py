@@ -0,0 +1,146 @@
+# ================================================================
+#  env_cfg.py
+#  运动学替身环境的配置：逐项对应 FirstRLEnvCfg，数值与名字都取自 mdp/task_params.py
+# ================================================================
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from ..mdp import task_params
+from ..mdp.events import reset_cube_to_left_table
+from ..mdp.observations import get_custom_scene_obs
+from ..mdp.rewards import cube_transport_linear_reward
+from ..mdp.task_state import reset_task_state
+from ..mdp.terminations import cube_out_of_table, task_fail_drop, task_success, task_time_out
+from . import builtin_terms
+from .scene import SceneEntityCfg
+
+
+@dataclass
+class TermCfg:
+    """通用 MDP 项配置（对应 ObsTerm / RewardTermCfg / TerminationTermCfg / EventTermCfg）。"""
+
+    func: Callable
+    params: dict = field(default_factory=dict)
+    weight: float = 1.0        # 仅奖励项使用
+    time_out: bool = False     # 仅终止项使用
+
+
+@dataclass
+class RelativeJointPositionActionCfg:
+    """对应 mdp.RelativeJointPositionActionCfg：目标 = 当前关节角 + 动作 * scale。"""
+
+    asset_name: str
+    joint_names: list[str]
+    scale: float = 1.0
+
+
+@dataclass
+class TaskStateCfg:
+    """对应 mdp/task_state_cfg.py 中的 TaskStateCfg。"""
+
+    robot_cfg: SceneEntityCfg = field(
+        default_factory=lambda: SceneEntityCfg(
+            task_params.ROBOT_NAME,
+            body_names=list(task_params.FINGER_BODY_NAMES),
+            joint_names=list(task_params.ROBOT_JOINT_NAMES),
+        )
+    )
+    cube_cfg: SceneEntityCfg = field(default_factory=lambda: SceneEntityCfg(task_params.CUBE_NAME))
+    table_height: float = task_params.TABLE_HEIGHT
+    cube_size: float = task_params.CUBE_SIZE
+    timing_bins: int = task_params.TIMING_BINS
+
+
+def _default_actions() -> dict[str, RelativeJointPositionActionCfg]:
+    # mdp/actions_cfg.py: ActionsCfg
+    return {
+        "arm_pos": RelativeJointPositionActionCfg(
+            asset_name=task_params.ROBOT_NAME,
+            joint_names=list(task_params.ARM_JOINT_NAMES),
+            scale=task_params.ARM_ACTION_SCALE,
+        ),
+        "gripper_pos": RelativeJointPositionActionCfg(
+            asset_name=task_params.ROBOT_NAME,
+            joint_names=list(task_params.GRIPPER_JOINT_NAMES),
+            scale=task_params.GRIPPER_ACTION_SCALE,
+        ),
+    }
+
+
+def _default_observations() -> dict[str, dict[str, TermCfg]]:
+    # mdp/observations_cfg.py: ObservationsCfg（policy 组，拼接，无噪声）
+    return {
+        "policy": {
+            "full_scene": TermCfg(func=get_custom_scene_obs),
+            "last_action": TermCfg(func=builtin_terms.last_action),
+        }
+    }
+
+
+def _default_rewards() -> dict[str, TermCfg]:
+    # mdp/rewards_cfg.py: RewardsCfg
+    return {
+        "transport_task": TermCfg(
+            func=cube_transport_linear_reward,
+            weight=task_params.TRANSPORT_REWARD_WEIGHT,
+            params={**task_params.TRANSPORT_REWARD_PARAMS, "use_compile": False, "log_components": False},
+        ),
+        "action_rate": TermCfg(func=builtin_terms.action_rate_l2, weight=task_params.ACTION_RATE_WEIGHT),
+    }
+
+
+def _default_terminations() -> dict[str, TermCfg]:
+    # mdp/terminations_cfg.py: TerminationsCfg
+    return {
+        "time_out": TermCfg(func=task_time_out, time_out=True),
+        "success": TermCfg(func=task_success),
+        "fail_drop": TermCfg(func=task_fail_drop),
+        "cube_out": TermCfg(func=cube_out_of_table),
+    }
+
+
+def _default_events() -> dict[str, TermCfg]:
+    # mdp/events_cfg.py: EventsCfg（全部为 reset 模式，按声明顺序执行）
+    return {
+        "reset_state": TermCfg(func=reset_task_state),
+        "reset_robot": TermCfg(func=builtin_terms.reset_scene_to_default),
+        "reset_cube": TermCfg(func=reset_cube_to_left_table, params={"cube_name": task_params.CUBE_NAME}),
+        "reset_robot_joints_sample": TermCfg(
+            func=builtin_terms.reset_joints_by_offset,
+            params={
+                "position_range": task_params.JOINT_RESET_POSITION_RANGE,
+                "velocity_range": task_params.JOINT_RESET_VELOCITY_RANGE,
+            },
+        ),
+    }
+
+
+@dataclass
+class KinematicEnvCfg:
+    """
+    📌 运动学替身环境配置
+    ------------------------------------------------
+    仿真参数、动作、观测、奖励、终止、事件与 FirstRLEnvCfg 一一对应，
+    MDP 函数直接复用 mdp/ 下不依赖 Isaac Lab 的模块，只有 isaaclab.envs.mdp 的内置函数换成 builtin_terms 中的同名实现。
+    所有数值（仿真参数、动作缩放、奖励权重与参数、任务几何、重置随机化范围）与资产 / 关节名都取自 mdp/task_params.py，
+    与 Isaac Lab 侧的配置是同一份；这里只镜像各项表的结构（项名与函数），tests/test_task_params.py 检查两边一致。
+    """
+
+    num_envs: int = task_params.NUM_ENVS
+    env_spacing: float = task_params.ENV_SPACING
+    device: str = "cpu"
+    seed: int | None = None
+
+    decimation: int = task_params.DECIMATION
+    sim_dt: float = task_params.SIM_DT
+    episode_length_s: float = task_params.EPISODE_LENGTH_S
+
+    actions: dict[str, RelativeJointPositionActionCfg] = field(default_factory=_default_actions)
+    observations: dict[str, dict[str, TermCfg]] = field(default_factory=_default_observations)
+    rewards: dict[str, TermCfg] = field(default_factory=_default_rewards)
+    terminations: dict[str, TermCfg] = field(default_factory=_default_terminations)
+    events: dict[str, TermCfg] = field(default_factory=_default_events)
+    task_state: TaskStateCfg = field(default_factory=TaskStateCfg)
@@ -0,0 +1,184 @@
+# ================================================================
+#  managers.py
+#  运动学替身环境的精简管理器：接口与计算顺序和 Isaac Lab 的同名管理器一致
+# ================================================================
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from .scene import SceneEntityCfg
+
+if TYPE_CHECKING:
+    from .env import KinematicRLEnv
+    from .env_cfg import RelativeJointPositionActionCfg, TermCfg
+
+
+def _resolve_params(env: KinematicRLEnv, term_cfg: TermCfg):
+    """与 Isaac Lab 管理器相同：初始化时解析参数中的 SceneEntityCfg。"""
+    for value in term_cfg.params.values():
+        if isinstance(value, SceneEntityCfg):
+            value.resolve(env.scene)
+
+
+class ActionManager:
+    """动作管理器：保存原始动作与上一步动作，并在每个物理步把相对关节目标写给机器人。"""
+
+    def __init__(self, cfg: dict[str, RelativeJointPositionActionCfg], env: KinematicRLEnv):
+        self._env = env
+        self._terms = []
+        start = 0
+        for term_cfg in cfg.values():
+            asset = env.scene[term_cfg.asset_name]
+            joint_ids, _ = asset.find_joints(term_cfg.joint_names, preserve_order=True)
+            self._terms.append((asset, joint_ids, slice(start, start + len(joint_ids)), term_cfg.scale))
+            start += len(joint_ids)
+        self.total_action_dim = start
+        self._action = torch.zeros(env.num_envs, start, device=env.device)
+        self._prev_action = torch.zeros_like(self._action)
+        self._processed_actions = torch.zeros_like(self._action)
+
+    @property
+    def action(self) -> torch.Tensor:
+        return self._action
+
+    @property
+    def prev_action(self) -> torch.Tensor:
+        return self._prev_action
+
+    def process_action(self, action: torch.Tensor):
+        self._prev_action[:] = self._action
+        self._action[:] = action.to(self._env.device)
+        for _, _, action_slice, scale in self._terms:
+            torch.mul(self._action[:, action_slice], scale, out=self._processed_actions[:, action_slice])
+
+    def apply_action(self):
+        # RelativeJointPositionAction：目标 = 当前关节角 + 处理后的动作（每个物理步重新计算）
+        for asset, joint_ids, action_slice, _ in self._terms:
+            target = self._processed_actions[:, action_slice] + asset.data.joint_pos[:, joint_ids]
+            asset.set_joint_position_target(target, joint_ids=joint_ids)
+
+    def reset(self, env_ids: torch.Tensor) -> dict:
+        self._prev_action[env_ids] = 0.0
+        self._action[env_ids] = 0.0
+        return {}
+
+
+class ObservationManager:
+    """观测管理器：按组计算并拼接各观测项。"""
+
+    def __init__(self, cfg: dict[str, dict[str, TermCfg]], env: KinematicRLEnv):
+        self._env = env
+        self._groups = cfg
+        for terms in cfg.values():
+            for term_cfg in terms.values():
+                _resolve_params(env, term_cfg)
+        # 与 Isaac Lab 一样先计算一次，推断各组 / 各观测项的维度
+        self.active_terms = {group: list(terms) for group, terms in cfg.items()}
+        self.group_obs_term_dim = {
+            group: [tuple(term.func(env, **term.params).shape[1:]) for term in terms.values()]
+            for group, terms in cfg.items()
+        }
+        self.group_obs_dim = {name: tuple(obs.shape[1:]) for name, obs in self.compute().items()}
+
+    def compute(self) -> dict[str, torch.Tensor]:
+        return {
+            group: torch.cat([term.func(self._env, **term.params) for term in terms.values()], dim=-1)
+            for group, terms in self._groups.items()
+        }
+
+    def reset(self, env_ids: torch.Tensor) -> dict:
+        return {}
+
+
+class RewardManager:
+    """奖励管理器：value * weight * dt 逐项累加，并记录每个回合的分项总和。"""
+
+    def __init__(self, cfg: dict[str, TermCfg], env: KinematicRLEnv):
+        self._env = env
+        self._terms = cfg
+        for term_cfg in cfg.values():
+            _resolve_params(env, term_cfg)
+        self._reward_buf = torch.zeros(env.num_envs, device=env.device)
+        self._episode_sums = {name: torch.zeros(env.num_envs, device=env.device) for name in cfg}
+        self.active_terms = list(cfg)
+
+    def get_term_cfg(self, term_name: str) -> TermCfg:
+        return self._terms[term_name]
+
+    def compute(self, dt: float) -> torch.Tensor:
+        self._reward_buf[:] = 0.0
+        for name, term_cfg in self._terms.items():
+            if term_cfg.weight == 0.0:
+                continue
+            value = term_cfg.func(self._env, **term_cfg.params) * term_cfg.weight * dt
+            self._reward_buf += value
+            self._episode_sums[name] += value
+        return self._reward_buf
+
+    def reset(self, env_ids: torch.Tensor) -> dict:
+        extras = {}
+        for name, episode_sum in self._episode_sums.items():
+            extras["Episode_Reward/" + name] = torch.mean(episode_sum[env_ids]) / self._env.max_episode_length_s
+            episode_sum[env_ids] = 0.0
+        return extras
+
+
+class TerminationManager:
+    """终止管理器：区分超时 (time_out) 与真正的终止，并记录每个终止项的触发次数。"""
+
+    def __init__(self, cfg: dict[str, TermCfg], env: KinematicRLEnv):
+        self._env = env
+        self._terms = cfg
+        for term_cfg in cfg.values():
+            _resolve_params(env, term_cfg)
+        self._term_dones = {name: torch.zeros(env.num_envs, dtype=torch.bool, device=env.device) for name in cfg}
+        self._truncated_buf = torch.zeros(env.num_envs, dtype=torch.bool, device=env.device)
+        self._terminated_buf = torch.zeros_like(self._truncated_buf)
+
+    @property
+    def dones(self) -> torch.Tensor:
+        return self._truncated_buf | self._terminated_buf
+
+    @property
+    def time_outs(self) -> torch.Tensor:
+        return self._truncated_buf
+
+    @property
+    def terminated(self) -> torch.Tensor:
+        return self._terminated_buf
+
+    def compute(self) -> torch.Tensor:
+        self._truncated_buf[:] = False
+        self._terminated_buf[:] = False
+        for name, term_cfg in self._terms.items():
+            value = term_cfg.func(self._env, **term_cfg.params)
+            if term_cfg.time_out:
+                self._truncated_buf |= value
+            else:
+                self._terminated_buf |= value
+            self._term_dones[name][:] = value
+        return self.dones
+
+    def reset(self, env_ids: torch.Tensor) -> dict:
+        return {
+            "Episode_Termination/" + name: torch.count_nonzero(term_dones[env_ids]).item()
+            for name, term_dones in self._term_dones.items()
+        }
+
+
+class EventManager:
+    """事件管理器：只支持 reset 模式，按声明顺序调用。"""
+
+    def __init__(self, cfg: dict[str, TermCfg], env: KinematicRLEnv):
+        self._env = env
+        self._terms = cfg
+        for term_cfg in cfg.values():
+            _resolve_params(env, term_cfg)
+
+    def apply(self, mode: str, env_ids: torch.Tensor):
+        if mode != "reset":
+            return
+        for term_cfg in self._terms.values():
+            term_cfg.func(self._env, env_ids, **term_cfg.params)
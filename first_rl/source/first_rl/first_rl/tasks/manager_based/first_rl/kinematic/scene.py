@@ -0,0 +1,334 @@
+# ================================================================
+#  scene.py
+#  运动学替身场景：模仿 env.scene["robot"] / env.scene["cube"] 中被 MDP 函数读取的数据
+# ================================================================
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+
+import torch
+
+from .so101 import BODY_NAMES, JOINT_NAMES, SO101Kinematics
+
+
+##
+# 场景实体配置 (与 isaaclab.managers.SceneEntityCfg 的解析规则一致)
+##
+
+
+@dataclass
+class SceneEntityCfg:
+    """
+    📌 场景实体配置（不依赖 Isaac Lab 的同名替身）
+    ------------------------------------------------
+    resolve() 按名字（正则）解析一次 joint_ids / body_ids；
+    当名字按顺序覆盖了资产的全部关节（刚体）时，解析结果为 slice(None)，与 Isaac Lab 相同。
+    """
+
+    name: str
+    joint_names: list[str] | None = None
+    joint_ids: list[int] | slice = field(default_factory=lambda: slice(None))
+    body_names: list[str] | None = None
+    body_ids: list[int] | slice = field(default_factory=lambda: slice(None))
+    preserve_order: bool = False
+
+    def resolve(self, scene: KinematicScene):
+        if self.name not in scene.keys():
+            raise ValueError(f"The scene entity '{self.name}' does not exist. Available entities: {scene.keys()}.")
+        entity = scene[self.name]
+        if self.joint_names is not None:
+            self.joint_ids, _ = entity.find_joints(self.joint_names, preserve_order=self.preserve_order)
+            if len(self.joint_ids) == entity.num_joints and self.joint_names == entity.joint_names:
+                self.joint_ids = slice(None)
+        if self.body_names is not None:
+            self.body_ids, _ = entity.find_bodies(self.body_names, preserve_order=self.preserve_order)
+            if len(self.body_ids) == entity.num_bodies and self.body_names == entity.body_names:
+                self.body_ids = slice(None)
+
+
+def find_matching_names(keys: str | list[str], names: list[str], preserve_order: bool = False):
+    """与 isaaclab.utils.string.resolve_matching_names 相同的正则全匹配规则，返回 (索引列表, 名字列表)。"""
+    keys = [keys] if isinstance(keys, str) else list(keys)
+    matches = []
+    for key_idx, key in enumerate(keys):
+        for idx, name in enumerate(names):
+            if re.fullmatch(key, name):
+                matches.append((key_idx if preserve_order else idx, idx, name))
+    missing = [key for key in keys if not any(re.fullmatch(key, name) for name in names)]
+    if missing:
+        raise ValueError(f"Not all regular expressions are matched! Unmatched: {missing}. Available: {names}.")
+    matches.sort()
+    return [m[1] for m in matches], [m[2] for m in matches]
+
+
+##
+# 资产
+##
+
+
+class ArticulationData:
+    """机器人数据缓冲（字段名与 isaaclab.assets.ArticulationData 一致）。"""
+
+    def __init__(self, num_envs: int, num_joints: int, num_bodies: int, device: torch.device):
+        self.joint_pos = torch.zeros(num_envs, num_joints, device=device)
+        self.joint_vel = torch.zeros(num_envs, num_joints, device=device)
+        self.joint_pos_target = torch.zeros(num_envs, num_joints, device=device)
+        self.default_joint_pos = torch.zeros(num_envs, num_joints, device=device)
+        self.default_joint_vel = torch.zeros(num_envs, num_joints, device=device)
+        self.soft_joint_pos_limits = torch.zeros(num_envs, num_joints, 2, device=device)
+        self.soft_joint_vel_limits = torch.zeros(num_envs, num_joints, device=device)
+        self.body_pos_w = torch.zeros(num_envs, num_bodies, 3, device=device)
+        self.root_pos_w = torch.zeros(num_envs, 3, device=device)
+        self.default_root_state = torch.zeros(num_envs, 13, device=device)
+
+
+def _joint_index(env_ids, joint_ids) -> tuple:
+    """(env_ids, joint_ids) -> 可直接用于 (num_envs, num_joints) 张量的下标。"""
+    if env_ids is None:
+        env_ids = slice(None)
+    if joint_ids is None or isinstance(joint_ids, slice):
+        return env_ids, slice(None) if joint_ids is None else joint_ids
+    if isinstance(env_ids, slice):
+        return env_ids, joint_ids
+    return torch.as_tensor(env_ids)[:, None], joint_ids
+
+
+class KinematicArticulation:
+    """
+    📌 SO-101 运动学替身
+    ------------------------------------------------
+    关节没有动力学：每个物理步关节角按一阶系统追踪 PD 目标（时间常数 = damping / stiffness），
+    并受执行器速度上限与关节限位约束；刚体位置由 SO101Kinematics 正运动学得到。
+    参数取自 assets_cfg.py 中的 ArticulationCfg（初始关节角、执行器刚度/阻尼/速度上限）。
+    """
+
+    # assets_cfg.py: init_state.joint_pos
+    DEFAULT_JOINT_POS = {
+        "shoulder_pan": 0.0, "shoulder_lift": -0.5, "elbow_flex": 0.5,
+        "wrist_flex": 0.0, "wrist_roll": 0.5, "gripper": 0.08,
+    }
+    # assets_cfg.py: actuators (so101_arm: 前 5 个关节, so101_hand: gripper)
+    STIFFNESS = (800.0,) * 5 + (400.0,)
+    DAMPING = (50.0,) * 5 + (10.0,)
+    VELOCITY_LIMIT = (2.175,) * 5 + (2.0,)
+
+    def __init__(self, num_envs: int, env_origins: torch.Tensor, device: torch.device):
+        self.num_envs = num_envs
+        self.device = device
+        self.body_names = list(BODY_NAMES)
+        self.joint_names = list(JOINT_NAMES)
+        self.num_bodies = len(BODY_NAMES)
+        self.num_joints = len(JOINT_NAMES)
+        self.kinematics = SO101Kinematics(device)
+
+        self._tau = torch.tensor([d / k for d, k in zip(self.DAMPING, self.STIFFNESS)], device=device)
+        self._velocity_limit = torch.tensor(self.VELOCITY_LIMIT, device=device)
+
+        self.data = ArticulationData(num_envs, self.num_joints, self.num_bodies, device)
+        self.data.default_joint_pos[:] = torch.tensor([self.DEFAULT_JOINT_POS[n] for n in JOINT_NAMES], device=device)
+        self.data.soft_joint_pos_limits[:] = self.kinematics.joint_limits
+        self.data.soft_joint_vel_limits[:] = self._velocity_limit
+        self.data.default_root_state[:, :3] = self.kinematics.root_pos
+        self.data.default_root_state[:, 3:7] = torch.tensor([0.707, 0.0, 0.0, 0.707], device=device)
+        self.data.root_pos_w[:] = env_origins + self.kinematics.root_pos
+        self.data.joint_pos[:] = self.data.default_joint_pos
+        self.data.joint_pos_target[:] = self.data.default_joint_pos
+        self.update_kinematics()
+
+    def find_bodies(self, name_keys: str | list[str], preserve_order: bool = False):
+        return find_matching_names(name_keys, self.body_names, preserve_order)
+
+    def find_joints(self, name_keys: str | list[str], preserve_order: bool = False):
+        return find_matching_names(name_keys, self.joint_names, preserve_order)
+
+    def set_joint_position_target(self, target: torch.Tensor, joint_ids=None, env_ids=None):
+        self.data.joint_pos_target[_joint_index(env_ids, joint_ids)] = target
+
+    def write_joint_state_to_sim(self, position: torch.Tensor, velocity: torch.Tensor, joint_ids=None, env_ids=None):
+        index = _joint_index(env_ids, joint_ids)
+        self.data.joint_pos[index] = position
+        self.data.joint_vel[index] = velocity
+        # 写入关节状态后 PD 目标也随之重置，避免下一步被拉回旧目标
+        self.data.joint_pos_target[index] = position
+        self.update_kinematics()
+
+    def write_root_state_to_sim(self, root_state: torch.Tensor, env_ids=None):
+        # 机器人底座固定，只记录根节点位置（姿态固定为资产配置中的朝向）
+        env_ids = slice(None) if env_ids is None else env_ids
+        self.data.root_pos_w[env_ids] = root_state[:, :3]
+        self.update_kinematics()
+
+    def integrate(self, dt: float):
+        """一个物理步：关节角追踪 PD 目标（一阶近似 + 速度上限 + 关节限位）。"""
+        data = self.data
+        alpha = 1.0 - torch.exp(-dt / self._tau)
+        max_step = self._velocity_limit * dt
+        delta = torch.clamp((data.joint_pos_target - data.joint_pos) * alpha, -max_step, max_step)
+        new_pos = torch.clamp(data.joint_pos + delta, data.soft_joint_pos_limits[..., 0], data.soft_joint_pos_limits[..., 1])
+        torch.div(new_pos - data.joint_pos, dt, out=data.joint_vel)
+        data.joint_pos.copy_(new_pos)
+
+    def update_kinematics(self):
+        self.data.body_pos_w.copy_(self.kinematics.forward(self.data.joint_pos, self.data.root_pos_w))
+
+
+class RigidObjectData:
+    """物块数据缓冲（字段名与 isaaclab.assets.RigidObjectData 一致）。"""
+
+    def __init__(self, num_envs: int, device: torch.device):
+        self.root_state_w = torch.zeros(num_envs, 13, device=device)
+        self.default_root_state = torch.zeros(num_envs, 13, device=device)
+
+    @property
+    def root_pos_w(self) -> torch.Tensor:
+        return self.root_state_w[:, 0:3]
+
+    @property
+    def root_quat_w(self) -> torch.Tensor:
+        return self.root_state_w[:, 3:7]
+
+    @property
+    def root_lin_vel_w(self) -> torch.Tensor:
+        return self.root_state_w[:, 7:10]
+
+    @property
+    def root_ang_vel_w(self) -> torch.Tensor:
+        return self.root_state_w[:, 10:13]
+
+
+class KinematicRigidObject:
+    """物块替身：只保存根状态，运动由 KinematicScene 中的夹持/重力模型更新。"""
+
+    def __init__(self, num_envs: int, env_origins: torch.Tensor, default_pos: tuple, device: torch.device):
+        self.num_envs = num_envs
+        self.device = device
+        self.data = RigidObjectData(num_envs, device)
+        self.data.default_root_state[:, :3] = torch.tensor(default_pos, device=device)
+        self.data.default_root_state[:, 3] = 1.0
+        self.data.root_state_w.copy_(self.data.default_root_state)
+        self.data.root_state_w[:, :3] += env_origins
+        # 由场景设置：写入根状态时解除夹持
+        self.on_write = None
+
+    def write_root_state_to_sim(self, root_state: torch.Tensor, env_ids=None):
+        env_ids = slice(None) if env_ids is None else env_ids
+        self.data.root_state_w[env_ids] = root_state
+        if self.on_write is not None:
+            self.on_write(env_ids)
+
+
+##
+# 场景
+##
+
+
+class KinematicScene:
+    """
+    📌 运动学替身场景（对应 SceneAssetsCfg：机器人 + 桌子 + 物块）
+    ------------------------------------------------
+    物块模型（夹住即附着）：
+    1. 物块中心落在两指尖连线之间、且离连线的距离小于半个边长时，视为处在夹爪中间；
+    2. 此时指距一旦缩到物块边长（加少量容差）以内，夹爪关节被物块挡住（继续闭合时保持上一物理步的角度），
+       指距不再变化，TaskState 的"夹紧"判定与真实仿真一样由"指距静止"触发；
+    3. 被夹住的物块随 TCP 平移（保持夹住时的相对位移，不考虑转动）；
+    4. 没有被夹住时物块受重力下落，落在桌面（或桌外地面）上静止。
+    没有接触力、摩擦和指尖与桌面的碰撞，只用于在没有 Isaac Sim 时跑通 MDP 与训练流程、测量我们自己代码的开销。
+    """
+
+    TABLE_HEIGHT = 0.5                 # 桌面高度 (m)
+    TABLE_HALF_EXTENT = (0.4, 0.6)     # 桌面半长/半宽 (m)，桌子尺寸 0.8 x 1.2
+    CUBE_SIZE = 0.05                   # 物块边长 (m)
+    CUBE_DEFAULT_POS = (0.0, 0.3, 0.526)
+    GRIP_TOLERANCE = 0.005             # 指距比物块边长大不超过该值时认为指尖已接触物块 (m)
+    GRAVITY = 9.81
+
+    def __init__(self, num_envs: int, env_spacing: float, device: str | torch.device = "cpu"):
+        self.num_envs = num_envs
+        self.device = torch.device(device)
+        self.env_origins = self._grid_env_origins(num_envs, env_spacing, self.device)
+
+        self.robot = KinematicArticulation(num_envs, self.env_origins, self.device)
+        self.cube = KinematicRigidObject(num_envs, self.env_origins, self.CUBE_DEFAULT_POS, self.device)
+        self.cube.on_write = self._release
+        self.articulations = {"robot": self.robot}
+        self.rigid_objects = {"cube": self.cube}
+
+        self.attached = torch.zeros(num_envs, dtype=torch.bool, device=self.device)
+        self.attach_offset = torch.zeros(num_envs, 3, device=self.device)
+
+    @staticmethod
+    def _grid_env_origins(num_envs: int, env_spacing: float, device: torch.device) -> torch.Tensor:
+        # 与 InteractiveScene 默认的网格排布一致
+        num_rows = math.ceil(num_envs / int(math.sqrt(num_envs)))
+        num_cols = math.ceil(num_envs / num_rows)
+        ii, jj = torch.meshgrid(torch.arange(num_rows, device=device), torch.arange(num_cols, device=device), indexing="ij")
+        env_origins = torch.zeros(num_envs, 3, device=device)
+        env_origins[:, 0] = -(ii.flatten()[:num_envs] - (num_rows - 1) / 2) * env_spacing
+        env_origins[:, 1] = (jj.flatten()[:num_envs] - (num_cols - 1) / 2) * env_spacing
+        return env_origins
+
+    def __getitem__(self, key: str):
+        if key in self.articulations:
+            return self.articulations[key]
+        return self.rigid_objects[key]
+
+    def keys(self) -> list[str]:
+        return list(self.articulations.keys()) + list(self.rigid_objects.keys())
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        self._release(slice(None) if env_ids is None else env_ids)
+
+    def _release(self, env_ids):
+        self.attached[env_ids] = False
+
+    def step(self, dt: float):
+        """一个物理步：关节追踪目标 -> 夹爪被物块阻挡 -> 物块附着或下落。"""
+        robot, cube = self.robot, self.cube
+
+        # --- 1. 物块是否处在两指尖之间（用本物理步开始时的指尖位置判断）---
+        tip1, tip2 = robot.data.body_pos_w[:, 7], robot.data.body_pos_w[:, 8]
+        cube_pos = cube.data.root_pos_w.clone()
+        axis = tip2 - tip1
+        finger_dist = torch.linalg.vector_norm(axis, dim=-1)
+        t = ((cube_pos - tip1) * axis).sum(-1) / finger_dist.square().clamp(min=1e-9)
+        off_axis = torch.linalg.vector_norm(cube_pos - (tip1 + t.unsqueeze(-1) * axis), dim=-1)
+        in_grasp = (t > 0.0) & (t < 1.0) & (off_axis < self.CUBE_SIZE / 2)
+        touching = in_grasp & (finger_dist <= self.CUBE_SIZE + self.GRIP_TOLERANCE)
+
+        # --- 2. 关节追踪目标；指尖已贴住物块时夹爪无法继续闭合 ---
+        gripper_prev = robot.data.joint_pos[:, -1].clone()
+        robot.integrate(dt)
+        blocked = touching & (robot.data.joint_pos[:, -1] < gripper_prev)
+        robot.data.joint_pos[:, -1] = torch.where(blocked, gripper_prev, robot.data.joint_pos[:, -1])
+        robot.data.joint_vel[:, -1] = torch.where(blocked, 0.0, robot.data.joint_vel[:, -1])
+        robot.update_kinematics()
+        tip1, tip2 = robot.data.body_pos_w[:, 7], robot.data.body_pos_w[:, 8]
+        finger_dist = torch.linalg.vector_norm(tip2 - tip1, dim=-1)
+        tcp = 0.5 * (tip1 + tip2)
+
+        # --- 3. 附着：指尖贴住物块时物块随 TCP 平移 ---
+        attached = in_grasp & (finger_dist <= self.CUBE_SIZE + self.GRIP_TOLERANCE)
+        new_attach = attached & ~self.attached
+        self.attach_offset = torch.where(new_attach.unsqueeze(-1), cube_pos - tcp, self.attach_offset)
+        self.attached = attached
+
+        # --- 4. 未附着：重力下落，落到桌面或地面 ---
+        local = cube_pos - self.env_origins
+        on_table = (local[:, 0].abs() <= self.TABLE_HALF_EXTENT[0]) & (local[:, 1].abs() <= self.TABLE_HALF_EXTENT[1])
+        rest_z = self.env_origins[:, 2] + torch.where(on_table, self.TABLE_HEIGHT, 0.0) + self.CUBE_SIZE / 2
+        vel_z = cube.data.root_lin_vel_w[:, 2] - self.GRAVITY * dt
+        fall_z = cube_pos[:, 2] + vel_z * dt
+        landed = fall_z <= rest_z
+        free_pos = torch.stack([cube_pos[:, 0], cube_pos[:, 1], torch.where(landed, rest_z, fall_z)], dim=-1)
+        free_vel = torch.stack(
+            [torch.zeros_like(vel_z), torch.zeros_like(vel_z), torch.where(landed, 0.0, vel_z)], dim=-1
+        )
+
+        held_pos = tcp + self.attach_offset
+        new_pos = torch.where(attached.unsqueeze(-1), held_pos, free_pos)
+        new_vel = torch.where(attached.unsqueeze(-1), (held_pos - cube_pos) / dt, free_vel)
+        cube.data.root_state_w[:, 0:3] = new_pos
+        cube.data.root_state_w[:, 7:10] = new_vel
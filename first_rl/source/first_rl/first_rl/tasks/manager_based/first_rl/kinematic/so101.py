@@ -0,0 +1,125 @@
+# ================================================================
+#  so101.py
+#  SO-101 机械臂的运动学模型（从 so101_new_calib_physics.usd 的关节定义中提取）
+# ================================================================
+
+from __future__ import annotations
+
+import math
+
+import torch
+
+# 刚体顺序（与仿真中 Articulation.body_names 的顺序一致）
+BODY_NAMES = [
+    "base",
+    "shoulder",
+    "upper_arm",
+    "lower_arm",
+    "wrist",
+    "gripper",
+    "moving_jaw_so101_v1",
+    "finger1",
+    "finger2",
+]
+
+# 关节顺序（前 5 个由 arm_pos 动作控制，最后一个由 gripper_pos 控制）
+JOINT_NAMES = ["shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll", "gripper"]
+
+# 关节限位 (deg)，USD 中 physics:lowerLimit / physics:upperLimit 的原始数值
+JOINT_LIMITS_DEG = [
+    (-109.99987, 109.99987),
+    (-100.00004, 100.00004),
+    (-96.829865, 96.829865),
+    (-94.99983, 94.99983),
+    (-157.21101, 162.78932),
+    (-10.000004, 100.00004),
+]
+
+# 每个转动关节在父刚体坐标系下的位置 localPos0 与姿态 localRot0 (w, x, y, z)
+# 子刚体坐标系与关节坐标系重合 (localPos1 = 0, localRot1 = I)，转轴为关节坐标系的 Z 轴
+JOINT_ORIGINS = [
+    # shoulder_pan: base -> shoulder
+    ((0.0207909, -0.0230745, 0.0948817), (8.963205e-07, -0.7071055, -0.7071081, 8.963237e-07)),
+    # shoulder_lift: shoulder -> upper_arm
+    ((-0.0303992, -0.0182778, -0.0542), (0.4999982, -0.5, -0.5, -0.5000018)),
+    # elbow_flex: upper_arm -> lower_arm
+    ((-0.11257, -0.028, 0.0), (0.7071055, 0.0, 0.0, 0.7071081)),
+    # wrist_flex: lower_arm -> wrist
+    ((-0.1349, 0.0052, 0.0), (0.7071055, 0.0, 0.0, -0.7071081)),
+    # wrist_roll: wrist -> gripper
+    ((0.0, -0.0611, 0.0181), (8.631542e-07, 9.294899e-07, 0.7071081, 0.7071055)),
+    # gripper: gripper -> moving_jaw_so101_v1
+    ((0.0202, 0.0188, -0.0234), (0.7071055, 0.7071081, 0.0, 0.0)),
+]
+
+# 指尖刚体通过固定关节挂在夹爪上：finger1 在固定夹爪 (gripper) 上，finger2 在活动夹爪上
+FINGER1_OFFSET = (-0.0076639, 0.000032, -0.0983517)   # 相对 gripper
+FINGER2_OFFSET = (-0.0121641, -0.0753674, 0.0194639)  # 相对 moving_jaw_so101_v1
+
+# 资产配置 (assets_cfg.py)：整体缩放 2 倍，根节点位置与姿态
+ASSET_SCALE = 2.0
+ROOT_POS = (-0.4, 0.0, 0.446)
+ROOT_ROT = (0.707, 0.0, 0.0, 0.707)
+
+
+def quat_to_matrix(quat: tuple[float, float, float, float]) -> torch.Tensor:
+    """(w, x, y, z) 四元数 -> 3x3 旋转矩阵（先归一化）。"""
+    w, x, y, z = quat
+    n = math.sqrt(w * w + x * x + y * y + z * z)
+    w, x, y, z = w / n, x / n, y / n, z / n
+    return torch.tensor([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+        [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+        [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+    ])
+
+
+class SO101Kinematics:
+    """
+    📌 SO-101 正运动学（批量）
+    ------------------------------------------------
+    输入关节角 (N, 6) 与根节点位置 (N, 3)，输出全部 9 个刚体原点的世界坐标 (N, 9, 3)，
+    顺序与 BODY_NAMES 一致。关节偏移已乘以资产缩放系数。
+
+    用 USD 数据校验过：夹爪关节在限位两端时两指尖距离为 0.0081 / 0.2580 m，
+    与奖励函数中的夹爪物理极限 F_MIN / F_MAX 一致。
+    """
+
+    def __init__(self, device: str | torch.device = "cpu"):
+        self.device = torch.device(device)
+        self.num_joints = len(JOINT_NAMES)
+        self.num_bodies = len(BODY_NAMES)
+
+        self.joint_offsets = ASSET_SCALE * torch.tensor([p for p, _ in JOINT_ORIGINS], device=self.device)
+        self.joint_rots = torch.stack([quat_to_matrix(q) for _, q in JOINT_ORIGINS]).to(self.device)
+        self.finger1_offset = ASSET_SCALE * torch.tensor(FINGER1_OFFSET, device=self.device)
+        self.finger2_offset = ASSET_SCALE * torch.tensor(FINGER2_OFFSET, device=self.device)
+        self.root_rot = quat_to_matrix(ROOT_ROT).to(self.device)
+        self.root_pos = torch.tensor(ROOT_POS, device=self.device)
+
+        limits = torch.tensor(JOINT_LIMITS_DEG, device=self.device)
+        self.joint_limits = torch.deg2rad(limits)   # (6, 2) rad
+
+    def forward(self, joint_pos: torch.Tensor, root_pos_w: torch.Tensor) -> torch.Tensor:
+        """正运动学：返回 (N, 9, 3) 的刚体世界坐标。"""
+        num_envs = joint_pos.shape[0]
+        cos, sin = torch.cos(joint_pos), torch.sin(joint_pos)
+
+        body_pos = torch.empty(num_envs, self.num_bodies, 3, device=joint_pos.device)
+        body_pos[:, 0] = root_pos_w
+        rot = self.root_rot.expand(num_envs, 3, 3)
+        pos = root_pos_w
+        rots = []
+        for i in range(self.num_joints):
+            # 子刚体位姿 = 父位姿 * 平移(localPos0) * 旋转(localRot0) * Rz(q)
+            pos = pos + rot @ self.joint_offsets[i]
+            r0 = rot @ self.joint_rots[i]
+            c, s = cos[:, i : i + 1], sin[:, i : i + 1]
+            rot = torch.stack([c * r0[:, :, 0] + s * r0[:, :, 1], c * r0[:, :, 1] - s * r0[:, :, 0], r0[:, :, 2]], dim=-1)
+            body_pos[:, i + 1] = pos
+            rots.append(rot)
+
+        # 指尖：finger1 固定在 gripper 上，finger2 固定在活动夹爪上
+        body_pos[:, 7] = body_pos[:, 5] + rots[4] @ self.finger1_offset
+        body_pos[:, 8] = body_pos[:, 6] + rots[5] @ self.finger2_offset
+        return body_pos
@@ -0,0 +1,70 @@
+# ================================================================
+#  vec_env.py
+#  运动学替身环境的 RSL-RL 包装（行为与 isaaclab_rl.rsl_rl.RslRlVecEnvWrapper 一致）
+# ================================================================
+
+from __future__ import annotations
+
+import torch
+from rsl_rl.env import VecEnv
+from tensordict import TensorDict
+
+from .env import KinematicRLEnv
+
+
+class KinematicVecEnvWrapper(VecEnv):
+    """
+    📌 RSL-RL VecEnv 包装
+    ------------------------------------------------
+    RslRlVecEnvWrapper 要求 env.unwrapped 是 ManagerBasedRLEnv，所以替身环境使用这个等价的包装：
+    观测打包成 TensorDict，dones = terminated | time_outs，extras["time_outs"] 交给 PPO 做超时自举。
+    可以直接交给 OnPolicyRunner。
+    """
+
+    def __init__(self, env: KinematicRLEnv, clip_actions: float | None = None):
+        self.env = env
+        self.clip_actions = clip_actions
+        self.num_envs = env.num_envs
+        self.device = env.device
+        self.max_episode_length = env.max_episode_length
+        self.num_actions = env.action_manager.total_action_dim
+        self.env.reset()
+
+    @property
+    def cfg(self):
+        return self.env.cfg
+
+    @property
+    def unwrapped(self) -> KinematicRLEnv:
+        return self.env
+
+    @property
+    def episode_length_buf(self) -> torch.Tensor:
+        return self.env.episode_length_buf
+
+    @episode_length_buf.setter
+    def episode_length_buf(self, value: torch.Tensor):
+        self.env.episode_length_buf = value
+
+    def seed(self, seed: int = -1) -> int:
+        torch.manual_seed(seed)
+        return seed
+
+    def reset(self) -> tuple[TensorDict, dict]:
+        obs_dict, extras = self.env.reset()
+        return TensorDict(obs_dict, batch_size=[self.num_envs]), extras
+
+    def get_observations(self) -> TensorDict:
+        obs_dict = self.env.observation_manager.compute()
+        return TensorDict(obs_dict, batch_size=[self.num_envs])
+
+    def step(self, actions: torch.Tensor) -> tuple[TensorDict, torch.Tensor, torch.Tensor, dict]:
+        if self.clip_actions is not None:
+            actions = torch.clamp(actions, -self.clip_actions, self.clip_actions)
+        obs_dict, rew, terminated, truncated, extras = self.env.step(actions)
+        dones = (terminated | truncated).to(dtype=torch.long)
+        extras["time_outs"] = truncated
+        return TensorDict(obs_dict, batch_size=[self.num_envs]), rew, dones, extras
+
+    def close(self):
+        return self.env.close()
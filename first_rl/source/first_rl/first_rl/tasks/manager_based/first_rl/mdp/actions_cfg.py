@@ -10,6 +10,9 @@ from isaaclab.utils import configclass
 # 导入 mdp 模块，其中包含 JointPositionActionCfg 等动作配置类型，用于定义 MDP 的动作空间
 from isaaclab.envs import mdp
 
+# 关节名与动作缩放系数与运动学替身环境共用（mdp/task_params.py）
+from .task_params import ARM_ACTION_SCALE, ARM_JOINT_NAMES, GRIPPER_ACTION_SCALE, GRIPPER_JOINT_NAMES, ROBOT_NAME
+
 
 # 使用 configclass 声明这是一个配置类（Config Class）
 @configclass
@@ -27,17 +30,13 @@ class ActionsCfg:
 
     # 定义一个 RelativeJointPositionActionCfg，用于控制多个手臂关节的增量位置
     arm_pos = mdp.RelativeJointPositionActionCfg(
-        asset_name="robot",      # 指定控制哪个资产（机器人），必须与 SceneAssetsCfg 中的属性名完全一致
+        asset_name=ROBOT_NAME,   # 指定控制哪个资产（机器人），必须与 SceneAssetsCfg 中的属性名完全一致
 
-        joint_names=[            # 指定要控制的关节名称列表（正则表达式或精确匹配）
-            "shoulder_pan",      # 关节1：肩部基座水平旋转 (Yaw)
-            "shoulder_lift",     # 关节2：肩部大臂抬升 (Pitch)
-            "elbow_flex",        # 关节3：肘部弯曲 (Pitch)
-            "wrist_flex",        # 关节4：手腕俯仰 (Pitch)
-            "wrist_roll",        # 关节5：手腕侧向旋转 (Roll)
-        ],
+        joint_names=list(ARM_JOINT_NAMES),  # 指定要控制的关节名称列表（正则表达式或精确匹配）：
+                                 # 肩部基座水平旋转 (Yaw)、肩部大臂抬升 (Pitch)、肘部弯曲 (Pitch)、
+                                 # 手腕俯仰 (Pitch)、手腕侧向旋转 (Roll)
 
-        scale=0.1,               # 动作缩放系数：
+        scale=ARM_ACTION_SCALE,  # 动作缩放系数（0.1）：
                                  # 计算公式：Target = Current + Action * Scale
                                  # 若网络输出 1.0，则实际目标关节角度在当前姿态基础上移动 0.1 rad
                                  # 较大的 scale 能让机器人动作更迅速，但过大会导致物理仿真不稳定
@@ -49,11 +48,11 @@ class ActionsCfg:
 
     # 定义另一个 RelativeJointPositionActionCfg，专门用于控制末端执行器（夹爪）
     gripper_pos = mdp.RelativeJointPositionActionCfg(
-        asset_name="robot",      # 同样控制 robot 资产，ActionManager 会自动合并所有关节指令
+        asset_name=ROBOT_NAME,   # 同样控制 robot 资产，ActionManager 会自动合并所有关节指令
 
-        joint_names=["gripper"], # 夹爪关节名，此处列表仅包含一个关节
+        joint_names=list(GRIPPER_JOINT_NAMES),  # 夹爪关节名，此处列表仅包含一个关节
 
-        scale=0.08,               # 夹爪动作缩放：
+        scale=GRIPPER_ACTION_SCALE,  # 夹爪动作缩放（0.08）：
                                  # 相比手臂，夹爪行程通常较短且需要更精细的控制，因此 scale 设得更小（0.2）
                                  # 网络输出 1.0 对应 0.08 rad 的位移
     )
@@ -0,0 +1,145 @@
+# ================================================================
+#  episode_stats.py
+#  回合统计：里程碑用时直方图与奖励分量的回合累计，全部在设备上进行（纯 torch，不依赖 Isaac Lab）
+# ================================================================
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+
+# 统计的两个里程碑（行号即 EpisodeStats 中直方图的行）
+MILESTONES = ("first_grasp", "first_lift")
+
+
+class EpisodeStats:
+    """
+    📌 回合里程碑用时统计
+    ------------------------------------------------
+    每个环境记下本回合第一次夹紧、第一次提起时的回合步数（-1 表示还没有发生）；
+    回合结束时（本步任一终止条件成立）把这些步数按用时分桶，scatter_add_ 累加到设备上的直方图。
+    每个控制步只有固定数量的原地算子，不同步、不分配；pop_log 时才换算成比例与平均用时。
+
+    直方图每行 num_bins + 2 个桶：
+    - [0, num_bins)：发生时刻落在回合时长的第 i 个等分区间；
+    - num_bins：回合结束时仍未发生；
+    - num_bins + 1：本步没有结束的环境（丢弃）。
+    """
+
+    def __init__(self, num_envs: int, max_episode_length: int, step_dt: float, num_bins: int, device: str):
+        self.max_episode_length = max_episode_length
+        self.step_dt = step_dt
+        self.num_bins = num_bins
+        self.device = device
+
+        # 各里程碑首次发生的回合步数 (len(MILESTONES), num_envs)，-1 表示尚未发生
+        self.first_step = torch.full((len(MILESTONES), num_envs), -1, dtype=torch.long, device=device)
+        # 直方图计数，以及落入各桶的步数之和（用于求平均用时）
+        self.hist = torch.zeros(len(MILESTONES), num_bins + 2, dtype=torch.long, device=device)
+        self.step_sums = torch.zeros(len(MILESTONES), num_bins + 2, dtype=torch.long, device=device)
+
+        # 临时缓冲
+        self._bin = torch.zeros(len(MILESTONES), num_envs, dtype=torch.long, device=device)
+        self._mask = torch.zeros(len(MILESTONES), num_envs, dtype=torch.bool, device=device)
+        self._ones = torch.ones(len(MILESTONES), num_envs, dtype=torch.long, device=device)
+
+        # 日志键名：按秒标注各桶的区间
+        bin_s = max_episode_length * step_dt / num_bins
+        self._bin_names = [f"{i * bin_s:g}-{(i + 1) * bin_s:g}s" for i in range(num_bins)] + ["never"]
+
+    def record_progress(self, is_clamped: torch.Tensor, has_been_lifted: torch.Tensor, episode_length: torch.Tensor):
+        """在每步推进跨步记忆之后调用：记下首次夹紧 / 首次提起的回合步数。"""
+        mask = self._mask
+        torch.lt(self.first_step, 0, out=mask)
+        mask[0] &= is_clamped
+        mask[1] &= has_been_lifted
+        torch.where(mask, episode_length, self.first_step, out=self.first_step)
+
+    def record_episode_end(self, done: torch.Tensor):
+        """在终止判定之后调用：把本步结束的回合按里程碑用时计入直方图。"""
+        b = self._bin
+        # 用时所在的等分区间：step * num_bins // max_episode_length，超出的归入最后一个区间
+        torch.mul(self.first_step, self.num_bins, out=b)
+        b.div_(self.max_episode_length, rounding_mode="floor").clamp_(max=self.num_bins - 1)
+        b.masked_fill_(torch.lt(self.first_step, 0, out=self._mask), self.num_bins)
+        b.masked_fill_(torch.logical_not(done, out=self._mask[0]), self.num_bins + 1)
+        self.hist.scatter_add_(1, b, self._ones)
+        self.step_sums.scatter_add_(1, b, self.first_step)
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        """回合重置：清除被重置环境的里程碑记录。"""
+        if env_ids is None:
+            self.first_step.fill_(-1)
+        else:
+            self.first_step.index_fill_(1, env_ids, -1)
+
+    def pop_log(self, num_episodes: torch.Tensor) -> dict[str, torch.Tensor]:
+        """
+        取出累计的直方图并清零（结果仍在设备上）。
+        每个里程碑给出：发生过的回合比例、平均用时 (s)，以及各用时区间（含 never）占全部结束回合的比例。
+        """
+        hist = self.hist[:, : self.num_bins + 1].clone()
+        step_sums = self.step_sums[:, : self.num_bins].sum(dim=1)
+        self.hist.zero_()
+        self.step_sums.zero_()
+
+        episodes = num_episodes.clamp_min(1)
+        happened = hist[:, : self.num_bins].sum(dim=1)
+        fractions = hist / episodes
+        mean_s = step_sums * self.step_dt / happened.clamp_min(1)
+        log = {}
+        for i, milestone in enumerate(MILESTONES):
+            log[f"Episode_Timing/{milestone}_rate"] = happened[i] / episodes
+            log[f"Episode_Timing/{milestone}_mean_s"] = mean_s[i]
+            for j, bin_name in enumerate(self._bin_names):
+                log[f"Episode_Timing/{milestone}_{bin_name}"] = fractions[i, j]
+        return log
+
+
+class RewardBreakdown:
+    """
+    📌 奖励分量的回合累计
+    ------------------------------------------------
+    奖励核把各分量写入 step_values 的对应行（见 TransportRewardBuffers.components），
+    record_step 每步把它们累加到每个环境的回合和；回合结束时把结束环境的回合和并入总和并清零。
+    全部是原地算子，不同步、不分配；pop_log 给出本次迭代内结束回合的各分量平均回合和。
+
+    scale 是奖励项的 weight * step_dt / episode_length_s：与 RewardManager 记录 Episode_Reward/<奖励项> 的换算相同，
+    乘上之后各分量与 Episode_Reward/transport_task 同单位，且相加即为（同一批结束回合的）该奖励项。
+    """
+
+    def __init__(self, names: Sequence[str], num_envs: int, device: str, scale: float = 1.0):
+        self.names = tuple(names)
+        self.scale = scale
+        c = len(self.names)
+        self.step_values = torch.zeros(c, num_envs, device=device)     # 本步各分量（奖励核写入）
+        self.episode_sums = torch.zeros(c, num_envs, device=device)    # 每个环境本回合的各分量之和
+        self.ended_sums = torch.zeros(c, device=device)                # 已结束回合的各分量之和
+        self.num_ended = torch.zeros((), dtype=torch.long, device=device)
+
+        # 临时缓冲
+        self._masked = torch.zeros(c, num_envs, device=device)
+        self._sums = torch.zeros(c, device=device)
+        self._count = torch.zeros((), dtype=torch.long, device=device)
+
+    def record_step(self, done: torch.Tensor):
+        """在奖励计算之后调用：累加本步各分量，并结算本步结束的回合（done 为本步任一终止条件成立）。"""
+        self.episode_sums += self.step_values
+        torch.mul(self.episode_sums, done, out=self._masked)
+        self.ended_sums += torch.sum(self._masked, dim=1, out=self._sums)
+        self.num_ended += torch.sum(done, dim=0, out=self._count)
+        self.episode_sums.masked_fill_(done, 0.0)
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        """回合重置：清零被重置环境的回合和（正常结束的回合在 record_step 中已经清零）。"""
+        if env_ids is None:
+            self.episode_sums.zero_()
+        else:
+            self.episode_sums.index_fill_(1, env_ids, 0.0)
+
+    def pop_log(self) -> dict[str, torch.Tensor]:
+        """取出结束回合的各分量平均回合和（已乘 scale，仍在设备上）并清零累计。"""
+        means = self.ended_sums * self.scale / self.num_ended.clamp_min(1)
+        self.ended_sums.zero_()
+        self.num_ended.zero_()
+        return {f"Reward_Component/{name}": means[i] for i, name in enumerate(self.names)}
@@ -0,0 +1,87 @@
+# ================================================================
+#  observation_layout.py
+#  观测布局：预分配的观测缓冲 + 按名字划分的列区间（纯 torch，不依赖 Isaac Lab）
+# ================================================================
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+
+
+def scene_obs_fields(num_joints: int) -> list[tuple[str, int]]:
+    """get_custom_scene_obs 的各分量及其维度（顺序即列顺序）。"""
+    return [
+        ("joint_pos", num_joints),      # 关节位置
+        ("joint_vel", num_joints),      # 关节速度 (裁剪到 ±10)
+        ("cube_rel_tip1", 3),           # 物块相对指尖1
+        ("cube_rel_tip2", 3),           # 物块相对指尖2
+        ("cube_rel_tcp", 3),            # 物块相对TCP
+        ("finger_dist", 1),             # 两指尖距离
+        ("cube_y", 1),                  # 物块环境 Y - 用于导航目标点
+        ("cube_z", 1),                  # 物块环境 Z - 用于判断是否提起
+    ]
+
+
+class ObservationLayout:
+    """
+    📌 观测布局
+    ------------------------------------------------
+    持有一块预分配的 (num_envs, obs_dim) 观测缓冲，每个分量对应其中一段命名的列区间：
+    - 写入：layout["cube_rel_tcp"] 返回缓冲上的视图，直接 out= / copy_ 写入，不产生新张量；
+    - 读取：layout.view(obs, "finger_dist") 从任意同布局的张量（例如策略输入、录制的数据）中取出零拷贝视图，
+      下游（策略导出、部署、调试工具）按名字取列，不再硬编码列号；
+    - 导出：to_dict() 给出 名字 -> [start, stop]，可写成 JSON 随策略一起发布。
+    """
+
+    def __init__(self, fields: Sequence[tuple[str, int]], num_envs: int, device: str | torch.device):
+        self.slices: dict[str, slice] = {}
+        start = 0
+        for name, size in fields:
+            if name in self.slices:
+                raise ValueError(f"观测分量重名: '{name}'")
+            self.slices[name] = slice(start, start + size)
+            start += size
+        self.dim = start
+        self.buffer = torch.zeros(num_envs, self.dim, device=device)
+        # 各分量的视图在构造时建好，每步写入时不再重复切片
+        self._views = {name: self.buffer[:, s] for name, s in self.slices.items()}
+
+    def __getitem__(self, name: str) -> torch.Tensor:
+        """观测缓冲中分量 name 的视图（写入用）。"""
+        return self._views[name]
+
+    def names(self) -> list[str]:
+        return list(self.slices)
+
+    def view(self, obs: torch.Tensor, name: str, offset: int = 0) -> torch.Tensor:
+        """从同布局的张量 obs（最后一维为观测维度）中取出分量 name 的零拷贝视图；offset 为本布局在 obs 中的起始列。"""
+        s = self.slices[name]
+        return obs[..., s.start + offset : s.stop + offset]
+
+    def to_dict(self) -> dict[str, list[int]]:
+        return {name: [s.start, s.stop] for name, s in self.slices.items()}
+
+
+def group_obs_layout(
+    observation_manager, group: str = "policy", term_layouts: dict[str, ObservationLayout] | None = None
+) -> dict[str, list[int]]:
+    """
+    把一个拼接的观测组展开为 名字 -> [start, stop]（相对整组观测）。
+    term_layouts 中给出布局的观测项展开为 "项名/分量名"，其余观测项整体作为一段。
+    observation_manager 只需提供 Isaac Lab ObservationManager 的 active_terms / group_obs_term_dim。
+    """
+    term_layouts = term_layouts or {}
+    layout = {}
+    start = 0
+    for term_name, term_dim in zip(
+        observation_manager.active_terms[group], observation_manager.group_obs_term_dim[group]
+    ):
+        size = term_dim[-1]
+        if term_name in term_layouts:
+            for name, (lo, hi) in term_layouts[term_name].to_dict().items():
+                layout[f"{term_name}/{name}"] = [start + lo, start + hi]
+        else:
+            layout[term_name] = [start, start + size]
+        start += size
+    return layout
@@ -0,0 +1,43 @@
+# ================================================================
+#  observations.py
+#  自定义观测函数（纯 torch，不依赖 Isaac Lab，可被运动学替身环境直接复用）
+# ================================================================
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from .task_state import get_task_state
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+def get_custom_scene_obs(env: ManagerBasedRLEnv) -> torch.Tensor:
+    """
+    扁平化观测函数：指尖、TCP、物块坐标统一从 TaskState 读取。
+    与奖励、终止函数共用同一份每步缓存，确保感知与反馈完全一致。
+    各分量原地写入 TaskState 观测布局中对应名字的列区间（分量与顺序见 observation_layout.scene_obs_fields），
+    返回整块预分配的观测缓冲。
+    """
+    # --- 1. 读取本步的任务几何量 (指尖/TCP/物块均为环境局部坐标) ---
+    state = get_task_state(env)
+    robot = env.scene[state.cfg.robot_cfg.name]
+    cube_env = state.cube_pos
+    joint_ids = state.joint_ids   # 手臂 + 夹爪关节索引，在 TaskState 构造时解析一次
+    layout = state.obs_layout
+
+    # --- 2. 逐个分量写入观测缓冲 ---
+    # 注意：建议这里也包含机械臂的基础位置数据，增强策略的全局感
+    # （关节覆盖全部关节时 joint_ids 为 slice(None)，读取为视图，不产生拷贝）
+    layout["joint_pos"].copy_(robot.data.joint_pos[:, joint_ids])
+    torch.clamp(robot.data.joint_vel[:, joint_ids], -10.0, 10.0, out=layout["joint_vel"])
+    torch.sub(cube_env, state.tip1_pos, out=layout["cube_rel_tip1"])
+    torch.sub(cube_env, state.tip2_pos, out=layout["cube_rel_tip2"])
+    layout["cube_rel_tcp"].copy_(state.cube_rel_tcp)
+    layout["finger_dist"].copy_(state.finger_dist.unsqueeze(-1))
+    layout["cube_y"].copy_(cube_env[:, 1:2])
+    layout["cube_z"].copy_(cube_env[:, 2:3])
+
+    return layout.buffer
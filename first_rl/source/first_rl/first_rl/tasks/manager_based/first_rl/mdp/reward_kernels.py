@@ -0,0 +1,309 @@
+# ================================================================
+#  reward_kernels.py
+#  搬运奖励的纯 torch 计算核（不依赖 Isaac Lab，可在 CPU 上单独校验与测速）
+# ================================================================
+
+from __future__ import annotations
+
+import functools
+
+import torch
+
+# 夹爪物理极限
+F_MIN, F_MAX = 0.0080949645, 0.2580147982
+
+# 目标 y（降落区中心）
+TARGET_Y = -0.35
+
+# 搬运奖励的各分量（顺序即 TransportRewardBuffers.components 的行号），各分量之和即总奖励
+TRANSPORT_REWARD_COMPONENTS = (
+    "clamp",            # 夹紧固定奖励
+    "approach",         # 靠近物块
+    "pose",             # 夹爪远张近合
+    "lift",             # 提升
+    "transport",        # 运输
+    "descend",          # 降落引导
+    "success",          # 成功大奖
+    "drop",             # 中途掉落惩罚（负值）
+    "out_of_table",     # 越界惩罚（负值）
+    "time",             # 步数惩罚（负值）
+)
+
+
+def transport_reward_reference(
+    finger_dist: torch.Tensor,
+    tcp_cube_dist: torch.Tensor,
+    cube_pos: torch.Tensor,
+    cube_height: torch.Tensor,
+    is_clamped: torch.Tensor,
+    has_been_lifted: torch.Tensor,
+    max_ee_cube_dist: float = 1.2,
+    target_lift_height: float = 0.2,
+    max_y_dist: float = 1.2,
+) -> torch.Tensor:
+    """
+    📌 参考实现（逐项累加 + 布尔掩码写入）
+    ------------------------------------------------
+    与最初的 cube_transport_linear_reward 逐行一致，只用于校验融合版的数值结果。
+    布尔掩码写入（pose_reward[~near_mask] = ...）在 GPU 上会触发 nonzero 同步，训练中请使用融合版。
+    """
+    num_envs = finger_dist.shape[0]
+    curr_finger_dist = finger_dist
+    dist_ee_to_cube = tcp_cube_dist
+    cube_env = cube_pos
+
+    # --- 1. 奖励计算逻辑 ---
+    total_reward = torch.zeros(num_envs, device=finger_dist.device)
+
+    # 夹紧固定奖励
+    clamp_bonus = 1.0
+    total_reward += is_clamped.float() * clamp_bonus
+
+    # [规则 1] 距离物块越近奖励越高
+    approach_reward = torch.clamp((max_ee_cube_dist - dist_ee_to_cube) / max_ee_cube_dist, min=0.0)
+    total_reward += approach_reward * 1.0
+
+    # [规则 2&3] 夹爪姿态引导 (远张近合)
+    near_mask = (dist_ee_to_cube <= 0.015)
+    pose_reward = torch.zeros(num_envs, device=finger_dist.device)
+
+    # 远：目标 0.1，两端归零（三角形函数）
+    target_far_dist = 0.1
+    far_reward_left = (curr_finger_dist - F_MIN) / (target_far_dist - F_MIN + 1e-6)
+    far_reward_right = (F_MAX - curr_finger_dist) / (F_MAX - target_far_dist + 1e-6)
+    far_pose_reward = torch.where(curr_finger_dist < target_far_dist, far_reward_left, far_reward_right)
+
+    # 近：目标 0.04，闭合引导
+    target_near_dist = 0.04
+    near_pose_reward = (F_MAX - curr_finger_dist) / (F_MAX - target_near_dist + 1e-6)
+
+    pose_reward[~near_mask] = torch.clamp(far_pose_reward[~near_mask], min=0.0, max=1.0) * 0.2
+    pose_reward[near_mask] = torch.clamp(near_pose_reward[near_mask], min=0.0, max=1.0)
+
+    total_reward += pose_reward * 1.0
+
+    # [规则 4&5] 提升与运输奖励 (仅在夹紧时)
+    is_clamped_float = is_clamped.float()
+    is_in_drop_zone = (cube_env[:, 1] < -0.3)
+
+    lift_error = torch.abs(cube_height - target_lift_height)
+    lift_reward = torch.exp(-20.0 * lift_error)
+    lift_reward = is_clamped_float * (~is_in_drop_zone).float() * lift_reward * 2.0
+    total_reward += lift_reward
+
+    dist_to_y_goal = torch.abs(cube_env[:, 1] - TARGET_Y)
+    transport_reward = torch.clamp((max_y_dist - dist_to_y_goal) / max_y_dist, min=0.0)
+    at_lift_height = (lift_error < 0.1).float()
+    transport_reward = is_clamped_float * at_lift_height * transport_reward * 4.0
+    total_reward += transport_reward
+
+    # [规则 6] 降落引导 (仅在进入降落区且夹紧时)
+    descend_reward = torch.exp(-10.0 * torch.clamp(cube_height, min=0.0))
+    descend_reward = is_clamped_float * is_in_drop_zone.float() * descend_reward * 2.0
+    total_reward += descend_reward
+
+    # --- 2. 成功与失败判定 ---
+    is_at_goal_pos = (dist_to_y_goal < 0.05) & (cube_height < 0.05)
+    is_success = is_at_goal_pos & has_been_lifted
+    dropped_midway = has_been_lifted & (~is_clamped) & (~is_at_goal_pos)
+    out_of_table = (cube_env[:, 0].abs() > 0.4) | (cube_env[:, 1] > 0.6) | (cube_height < -0.05)
+
+    # --- 3. 应用大奖与惩罚 ---
+    total_reward[is_success] += 30.0
+    total_reward[dropped_midway] -= 5.0
+    total_reward[out_of_table] -= 10.0
+
+    # 步数惩罚
+    total_reward -= 0.1
+
+    return total_reward
+
+
+def transport_reward_fused(
+    finger_dist: torch.Tensor,
+    tcp_cube_dist: torch.Tensor,
+    cube_pos: torch.Tensor,
+    cube_height: torch.Tensor,
+    is_clamped: torch.Tensor,
+    has_been_lifted: torch.Tensor,
+    max_ee_cube_dist: float = 1.2,
+    target_lift_height: float = 0.2,
+    max_y_dist: float = 1.2,
+) -> torch.Tensor:
+    """
+    📌 融合版（无分支、无掩码写入）
+    ------------------------------------------------
+    所有分支都写成 torch.where，奖励项的累加顺序与参考实现一致，因此 eager 下结果逐位相同。
+    没有布尔索引，也就没有 nonzero 同步；配合 torch.compile 时整个函数融合成一个逐元素 kernel。
+    """
+    cube_y = cube_pos[:, 1]
+
+    # --- 1. 基础判定 ---
+    near_mask = tcp_cube_dist <= 0.015
+    in_drop_zone = cube_y < -0.3
+    lift_error = torch.abs(cube_height - target_lift_height)
+    dist_to_y_goal = torch.abs(cube_y - TARGET_Y)
+    is_at_goal_pos = (dist_to_y_goal < 0.05) & (cube_height < 0.05)
+    out_of_table = (cube_pos[:, 0].abs() > 0.4) | (cube_y > 0.6) | (cube_height < -0.05)
+
+    # --- 2. 各奖励项 ---
+    approach_reward = torch.clamp((max_ee_cube_dist - tcp_cube_dist) / max_ee_cube_dist, min=0.0)
+
+    far_pose_reward = torch.where(
+        finger_dist < 0.1,
+        (finger_dist - F_MIN) / (0.1 - F_MIN + 1e-6),
+        (F_MAX - finger_dist) / (F_MAX - 0.1 + 1e-6),
+    )
+    near_pose_reward = (F_MAX - finger_dist) / (F_MAX - 0.04 + 1e-6)
+    pose_reward = torch.where(
+        near_mask,
+        torch.clamp(near_pose_reward, min=0.0, max=1.0),
+        torch.clamp(far_pose_reward, min=0.0, max=1.0) * 0.2,
+    )
+
+    lift_reward = torch.where(is_clamped & ~in_drop_zone, torch.exp(-20.0 * lift_error) * 2.0, 0.0)
+    transport_reward = torch.where(
+        is_clamped & (lift_error < 0.1),
+        torch.clamp((max_y_dist - dist_to_y_goal) / max_y_dist, min=0.0) * 4.0,
+        0.0,
+    )
+    descend_reward = torch.where(
+        is_clamped & in_drop_zone, torch.exp(-10.0 * torch.clamp(cube_height, min=0.0)) * 2.0, 0.0
+    )
+
+    # --- 3. 累加（顺序与参考实现一致）---
+    total_reward = is_clamped.float() + approach_reward + pose_reward + lift_reward + transport_reward + descend_reward
+    total_reward = total_reward + torch.where(is_at_goal_pos & has_been_lifted, 30.0, 0.0)
+    total_reward = total_reward - torch.where(has_been_lifted & ~is_clamped & ~is_at_goal_pos, 5.0, 0.0)
+    total_reward = total_reward - torch.where(out_of_table, 10.0, 0.0)
+    return total_reward - 0.1
+
+
+class TransportRewardBuffers:
+    """
+    📌 原地版奖励核的预分配缓冲
+    ------------------------------------------------
+    reward 是输出（每步被覆盖，调用方只读），其余为中间量的工作缓冲。
+    每个环境实例持有一份（挂在 TaskState 上），稳态下每步不再分配新张量。
+
+    components 默认为 None；设为 (len(TRANSPORT_REWARD_COMPONENTS), num_envs) 的张量后，
+    原地版奖励核会把每个分量（带符号）额外写入对应的行。
+    """
+
+    def __init__(self, num_envs: int, device: str | torch.device):
+        self.components: torch.Tensor | None = None
+        self.reward = torch.zeros(num_envs, device=device)
+        self.lift_error = torch.zeros(num_envs, device=device)
+        self.dist_to_y_goal = torch.zeros(num_envs, device=device)
+        self.tmp_a = torch.zeros(num_envs, device=device)
+        self.tmp_b = torch.zeros(num_envs, device=device)
+        self.mask_a = torch.zeros(num_envs, dtype=torch.bool, device=device)
+        self.mask_b = torch.zeros(num_envs, dtype=torch.bool, device=device)
+
+
+def transport_reward_inplace(
+    finger_dist: torch.Tensor,
+    tcp_cube_dist: torch.Tensor,
+    cube_pos: torch.Tensor,
+    cube_height: torch.Tensor,
+    is_clamped: torch.Tensor,
+    has_been_lifted: torch.Tensor,
+    max_ee_cube_dist: float,
+    target_lift_height: float,
+    max_y_dist: float,
+    buffers: TransportRewardBuffers,
+) -> torch.Tensor:
+    """
+    📌 原地版（零内存分配）
+    ------------------------------------------------
+    与融合版逐项相同的公式，全部用 out= 与原地运算写入 buffers，返回 buffers.reward。
+    "条件成立取值、否则取 0" 的 torch.where 写成 masked_fill_，结果与融合版逐位相同（见 bench_reward_kernel.py）。
+    buffers.components 不为 None 时，各分量另外拷贝一份到其中（总奖励的计算不变）；为 None 时没有额外开销。
+    """
+    reward, a, b = buffers.reward, buffers.tmp_a, buffers.tmp_b
+    comps = buffers.components
+    lift_error, dist_to_y_goal = buffers.lift_error, buffers.dist_to_y_goal
+    m_zero, in_drop_zone = buffers.mask_a, buffers.mask_b
+    cube_y = cube_pos[:, 1]
+
+    # --- 1. 基础判定 ---
+    torch.sub(cube_height, target_lift_height, out=lift_error).abs_()
+    torch.sub(cube_y, TARGET_Y, out=dist_to_y_goal).abs_()
+    torch.lt(cube_y, -0.3, out=in_drop_zone)
+
+    # --- 2. 夹紧奖励 + 靠近奖励 ---
+    reward.copy_(is_clamped)
+    torch.mul(tcp_cube_dist, -1.0, out=a).add_(max_ee_cube_dist).div_(max_ee_cube_dist).clamp_(min=0.0)
+    reward.add_(a)
+    if comps is not None:
+        comps[0].copy_(is_clamped)
+        comps[1].copy_(a)
+
+    # --- 3. 夹爪姿态（远张近合）---
+    torch.sub(finger_dist, F_MIN, out=a).div_(0.1 - F_MIN + 1e-6)
+    torch.mul(finger_dist, -1.0, out=b).add_(F_MAX).div_(F_MAX - 0.1 + 1e-6)
+    torch.lt(finger_dist, 0.1, out=m_zero)
+    torch.where(m_zero, a, b, out=a).clamp_(min=0.0, max=1.0).mul_(0.2)
+    torch.mul(finger_dist, -1.0, out=b).add_(F_MAX).div_(F_MAX - 0.04 + 1e-6).clamp_(min=0.0, max=1.0)
+    torch.le(tcp_cube_dist, 0.015, out=m_zero)
+    reward.add_(torch.where(m_zero, b, a, out=a))
+    if comps is not None:
+        comps[2].copy_(a)
+
+    # --- 4. 提升 / 运输 / 降落（仅在夹紧时），m_zero 为"取 0"的环境 ---
+    torch.mul(lift_error, -20.0, out=a).exp_().mul_(2.0)
+    torch.logical_not(in_drop_zone, out=m_zero).logical_and_(is_clamped).logical_not_()
+    reward.add_(a.masked_fill_(m_zero, 0.0))
+    if comps is not None:
+        comps[3].copy_(a)
+
+    torch.mul(dist_to_y_goal, -1.0, out=a).add_(max_y_dist).div_(max_y_dist).clamp_(min=0.0).mul_(4.0)
+    torch.lt(lift_error, 0.1, out=m_zero).logical_and_(is_clamped).logical_not_()
+    reward.add_(a.masked_fill_(m_zero, 0.0))
+    if comps is not None:
+        comps[4].copy_(a)
+
+    torch.clamp(cube_height, min=0.0, out=a).mul_(-10.0).exp_().mul_(2.0)
+    torch.logical_and(in_drop_zone, is_clamped, out=m_zero).logical_not_()
+    reward.add_(a.masked_fill_(m_zero, 0.0))
+    if comps is not None:
+        comps[5].copy_(a)
+
+    # --- 5. 成功大奖与失败惩罚（in_drop_zone 不再使用，复用为 is_at_goal_pos）---
+    is_at_goal_pos = in_drop_zone
+    torch.lt(dist_to_y_goal, 0.05, out=is_at_goal_pos).logical_and_(torch.lt(cube_height, 0.05, out=m_zero))
+    torch.logical_and(is_at_goal_pos, has_been_lifted, out=m_zero)
+    reward.add_(a.copy_(m_zero).mul_(30.0))
+    if comps is not None:
+        comps[6].copy_(a)
+    torch.logical_or(is_clamped, is_at_goal_pos, out=m_zero).logical_not_().logical_and_(has_been_lifted)
+    reward.sub_(a.copy_(m_zero).mul_(5.0))
+    if comps is not None:
+        torch.neg(a, out=comps[7])
+
+    torch.abs(cube_pos[:, 0], out=a)
+    torch.gt(a, 0.4, out=m_zero).logical_or_(torch.gt(cube_y, 0.6, out=is_at_goal_pos))
+    m_zero.logical_or_(torch.lt(cube_height, -0.05, out=is_at_goal_pos))
+    reward.sub_(a.copy_(m_zero).mul_(10.0))
+    if comps is not None:
+        torch.neg(a, out=comps[8])
+        comps[9].fill_(-0.1)
+
+    # 步数惩罚
+    return reward.sub_(0.1)
+
+
+@functools.cache
+def _compiled_transport_reward():
+    return torch.compile(transport_reward_fused, dynamic=False)
+
+
+def get_transport_reward_kernel(device: str | torch.device, use_compile: bool = False):
+    """
+    选择融合奖励核：
+    - use_compile=True 且在 GPU 上：返回 torch.compile 后的版本（首次调用时编译，之后复用）；
+    - 其余情况（包括 CPU）：返回 eager 版本。
+    """
+    if use_compile and torch.device(device).type == "cuda":
+        return _compiled_transport_reward()
+    return transport_reward_fused
@@ -0,0 +1,78 @@
+# ================================================================
+#  rewards.py
+#  自定义奖励函数（纯 torch，不依赖 Isaac Lab，可被运动学替身环境直接复用）
+# ================================================================
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from .reward_kernels import TRANSPORT_REWARD_COMPONENTS, get_transport_reward_kernel, transport_reward_inplace
+from .task_state import TerminationReason, get_task_state
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+def cube_transport_linear_reward(
+    env: ManagerBasedRLEnv,
+    max_ee_cube_dist: float = 1.2,
+    target_lift_height: float = 0.2,
+    max_y_dist: float = 1.2,
+    use_compile: bool = False,
+    log_components: bool = False,
+) -> torch.Tensor:
+    """
+    📌 搬运任务总奖励
+    ------------------------------------------------
+    奖励项：夹紧奖励、靠近奖励、夹爪远张近合、提升、运输、降落引导、成功大奖、中途掉落/越界惩罚、步数惩罚。
+    具体公式见 reward_kernels.py：训练中使用无分支的融合版（torch.where 组合，无布尔掩码写入、无 GPU 同步），
+    逐项累加的参考实现保留在同一文件中，用于数值校验。
+
+    默认使用原地版：结果写入 TaskState 中预分配的缓冲，稳态下每步零内存分配。
+    use_compile=True 时在 GPU 上使用 torch.compile 把整个奖励融合成一个 kernel（输出张量由编译后的图分配）；
+    CPU 上始终使用原地版。
+
+    log_components=True 时原地版额外输出各奖励分量（见 TRANSPORT_REWARD_COMPONENTS），在设备上按回合累计，
+    每次迭代以 Reward_Component/<分量> 写入训练日志（此时不使用 torch.compile）。关闭时没有任何额外开销。
+    记录的分量已按本项的 weight * step_dt / episode_length_s 换算，与 Episode_Reward/<奖励项> 同单位，相加即为该项。
+    """
+    # 指尖、TCP、物块位置等几何量，以及夹紧/提起等跨步记忆，由 TaskState 每步统一计算一次
+    # 夹紧判定基于上一帧动作 a_{t-1}（见 TaskState._advance），与终止条件完全一致
+    state = get_task_state(env)
+
+    args = (
+        state.finger_dist,
+        state.tcp_cube_dist,
+        state.cube_pos,
+        state.cube_height,
+        state.is_clamped,
+        state.has_been_lifted,
+        max_ee_cube_dist,
+        target_lift_height,
+        max_y_dist,
+    )
+    if log_components:
+        breakdown = state.reward_breakdown
+        if breakdown is None:
+            scale = _reward_term_weight(env, cube_transport_linear_reward) * env.step_dt / env.max_episode_length_s
+            breakdown = state.enable_reward_breakdown(TRANSPORT_REWARD_COMPONENTS, scale)
+        reward = transport_reward_inplace(*args, buffers=state.reward_buffers)
+        # 奖励在终止判定之后、重置之前计算：本步结束的回合在这里结算
+        reason = state.evaluate_terminations(env).termination_reason
+        done = torch.ne(reason, TerminationReason.NONE, out=state.work_mask)
+        breakdown.record_step(done)
+        return reward
+    if use_compile and torch.device(env.device).type == "cuda":
+        return get_transport_reward_kernel(env.device, use_compile)(*args)
+    return transport_reward_inplace(*args, buffers=state.reward_buffers)
+
+
+def _reward_term_weight(env: ManagerBasedRLEnv, func) -> float:
+    """在奖励管理器中查找使用 func 的奖励项，返回其权重。"""
+    for name in env.reward_manager.active_terms:
+        term_cfg = env.reward_manager.get_term_cfg(name)
+        if term_cfg.func is func:
+            return term_cfg.weight
+    raise ValueError(f"没有使用 {func.__name__} 的奖励项")
@@ -0,0 +1,127 @@
+# ================================================================
+#  scripted_expert.py
+#  批量脚本专家：只读策略观测，输出 ActionsCfg 格式的动作（纯 torch，不依赖 Isaac Lab）
+# ================================================================
+
+from __future__ import annotations
+
+import torch
+
+from ..kinematic.so101 import SO101Kinematics
+from .observation_layout import ObservationLayout
+from .reward_kernels import TARGET_Y
+
+
+class ScriptedExpert:
+    """
+    📌 搬运任务的解析脚本专家
+    ------------------------------------------------
+    输入与策略相同的观测（get_custom_scene_obs 的各分量，按 ObservationLayout 的名字取列），
+    输出 ActionsCfg 格式的动作：5 个手臂关节增量（× arm_scale rad）+ 夹爪增量（× gripper_scale rad），范围 [-1, 1]。
+    全部环境一次批量计算，没有逐环境的 Python 循环，也没有 .item() / 布尔索引（不触发 GPU 同步）。
+
+    控制点 g 取在固定指尖 tip1 沿两指尖连线方向 grasp_offset 处（闭合后物块被夹在 tip1 与 tip2 之间的位置）。
+    每步根据观测判断所处阶段（无跨步状态，回合重置后自动从头开始）：
+    1. 接近：张开夹爪，g 先到物块正上方 hover_height 处，水平对准后再下降到物块中心（TCP 先到，避免碰到物块）；
+    2. 闭合：g 与物块重合时闭合夹爪（之后夹爪动作一直为 -1，夹爪被物块挡住、指距静止即为"夹紧"）；
+    3. 提起：夹住后把物块提到离桌 lift_height；
+    4. 运输：保持高度，水平移到 y = TARGET_Y；
+    5. 降落：到达目标 y 后放低物块（离桌高度 < 0.05 即成功）。
+
+    手臂动作由阻尼最小二乘逆运动学给出：dq = Jᵀ (J Jᵀ + λ² I)⁻¹ e，
+    J 为 g 对 5 个手臂关节的雅可比（SO101Kinematics 正运动学的前向差分，全部环境一次批量计算），
+    e 为指向目标、长度不超过 max_step 的位移。观测中没有物块朝向，夹爪不对准物块的偏航角。
+    """
+
+    def __init__(
+        self,
+        obs_layout: ObservationLayout,
+        device: str | torch.device = "cpu",
+        arm_scale: float = 0.1,
+        gripper_scale: float = 0.08,
+        table_height: float = 0.5,
+        cube_size: float = 0.05,
+        lift_height: float = 0.1,
+        hover_height: float = 0.08,
+        grasp_offset: float = 0.03,
+        open_finger_dist: float = 0.12,
+        max_step: float = 0.03,
+        damping: float = 0.05,
+    ):
+        self.layout = obs_layout
+        self.device = torch.device(device)
+        self.kinematics = SO101Kinematics(self.device)
+        self.arm_scale = arm_scale
+        self.gripper_scale = gripper_scale
+        self.rest_z = table_height + cube_size / 2.0        # 物块放在桌面上时的中心高度
+        self.grasp_tol = cube_size + 0.01                   # 指距小于它且物块在 g 附近时视为已夹住
+        self.lift_height = lift_height
+        self.hover_height = hover_height
+        self.grasp_offset = grasp_offset
+        self.open_finger_dist = open_finger_dist
+        self.max_step = max_step
+        self.damping = damping
+        self._fd_eps = 1e-3
+        # 前向差分的关节扰动：第 0 组为原始关节角，第 i 组扰动第 i 个手臂关节
+        self._perturb = torch.zeros(6, 6, device=self.device)
+        self._perturb[1:, :5] = torch.eye(5, device=self.device) * self._fd_eps
+        self._eye = torch.eye(3, device=self.device)
+
+    def _grasp_point(self, joint_pos: torch.Tensor) -> torch.Tensor:
+        """正运动学求控制点 g（环境局部坐标），joint_pos: (..., 6)。"""
+        shape = joint_pos.shape[:-1]
+        flat = joint_pos.reshape(-1, joint_pos.shape[-1])
+        bodies = self.kinematics.forward(flat, self.kinematics.root_pos.expand(len(flat), 3))
+        tip1, tip2 = bodies[:, 7], bodies[:, 8]
+        axis = torch.nn.functional.normalize(tip2 - tip1, dim=-1)
+        return (tip1 + self.grasp_offset * axis).reshape(*shape, 3)
+
+    def act(self, obs: torch.Tensor) -> torch.Tensor:
+        """obs: (num_envs, obs_dim) 的策略观测（full_scene 位于开头），返回 (num_envs, 6) 的动作。"""
+        layout = self.layout
+        joint_pos = layout.view(obs, "joint_pos")
+        rel_tip1 = layout.view(obs, "cube_rel_tip1")
+        rel_tip2 = layout.view(obs, "cube_rel_tip2")
+        finger_dist = layout.view(obs, "finger_dist").squeeze(-1)
+        cube_y = layout.view(obs, "cube_y").squeeze(-1)
+        cube_z = layout.view(obs, "cube_z").squeeze(-1)
+
+        # --- 1. 控制点 g 与雅可比（一次正运动学同时算出原始与 5 个扰动姿态）---
+        points = self._grasp_point(joint_pos.unsqueeze(1) + self._perturb)   # (N, 6, 3)
+        g = points[:, 0]
+        jac = ((points[:, 1:] - g.unsqueeze(1)) / self._fd_eps).transpose(1, 2)   # (N, 3, 5)
+        # 物块相对 g：cube - g = (cube - tip1) - grasp_offset * 连线方向
+        axis = torch.nn.functional.normalize(rel_tip1 - rel_tip2, dim=-1)
+        cube_rel_g = rel_tip1 - self.grasp_offset * axis
+        cube = g + cube_rel_g
+
+        # --- 2. 阶段判定（逐环境，无分支）---
+        horizontal_err = torch.linalg.vector_norm(cube_rel_g[:, :2], dim=-1)
+        aligned = torch.linalg.vector_norm(cube_rel_g, dim=-1) < 0.01
+        holding = (torch.linalg.vector_norm(cube_rel_g, dim=-1) < 0.02) & (finger_dist < self.grasp_tol)
+        lifted = cube_z > self.rest_z + self.lift_height - 0.02
+        at_goal_y = (cube_y - TARGET_Y).abs() < 0.02
+
+        # --- 3. 目标点 ---
+        # 接近：水平误差越大悬停越高，对准后降到物块中心
+        hover = self.hover_height * (horizontal_err / 0.03).clamp(max=1.0)
+        approach = cube + torch.stack([torch.zeros_like(hover), torch.zeros_like(hover), hover], dim=-1)
+        # 夹住后：先提起，到达高度后运输，到达目标 y 后降落
+        carry_y = torch.where(lifted | at_goal_y, torch.full_like(cube_y, TARGET_Y), cube_y)
+        carry_z = torch.where(at_goal_y, torch.full_like(cube_z, self.rest_z + 0.01), self.rest_z + self.lift_height)
+        carry = torch.stack([cube[:, 0], carry_y, carry_z], dim=-1)
+        # 夹住时控制的是物块本身（g ≈ 物块），目标点换算为 g 的目标
+        target = torch.where(holding.unsqueeze(-1), carry - cube_rel_g, approach)
+
+        # --- 4. 手臂：阻尼最小二乘逆运动学 ---
+        err = target - g
+        err = err * (self.max_step / torch.linalg.vector_norm(err, dim=-1, keepdim=True).clamp(min=self.max_step))
+        jjt = jac @ jac.transpose(1, 2) + (self.damping**2) * self._eye
+        # solve_ex 不做奇异性检查（linalg.solve 的检查在 GPU 上会同步），阻尼项保证 jjt 正定
+        dq = (jac.transpose(1, 2) @ torch.linalg.solve_ex(jjt, err.unsqueeze(-1)).result).squeeze(-1)
+        arm = (dq / self.arm_scale).clamp(-1.0, 1.0)
+
+        # --- 5. 夹爪：对准或已夹住时闭合，否则张开到 open_finger_dist ---
+        open_action = ((self.open_finger_dist - finger_dist) / 0.01).clamp(-1.0, 1.0)
+        gripper = torch.where(aligned | holding, -1.0, open_action)
+        return torch.cat([arm, gripper.unsqueeze(-1)], dim=-1)
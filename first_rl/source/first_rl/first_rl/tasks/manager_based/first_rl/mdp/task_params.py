@@ -0,0 +1,54 @@
+# ================================================================
+#  task_params.py
+#  任务参数的唯一来源：FirstRLEnvCfg 与运动学替身环境 KinematicEnvCfg 共用（纯 Python，不依赖 Isaac Lab）
+# ================================================================
+
+# ------------------------------------------------------------
+# 1. 仿真与回合
+# ------------------------------------------------------------
+DECIMATION = 6                  # 每个控制步的物理步数
+SIM_DT = 1.0 / 60.0             # 物理步长 (s)，即 Isaac Sim 的默认值
+EPISODE_LENGTH_S = 20.0         # 每个回合的最大时长 (s)
+NUM_ENVS = 1024                 # 默认并行环境数（命令行 --num_envs 可覆盖）
+ENV_SPACING = 2.5               # 相邻环境原点的间距 (m)
+
+# ------------------------------------------------------------
+# 2. 资产名与关节 / 刚体名
+# ------------------------------------------------------------
+ROBOT_NAME = "robot"            # 必须与 SceneAssetsCfg 中的属性名一致
+CUBE_NAME = "cube"
+ARM_JOINT_NAMES = ("shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll")
+GRIPPER_JOINT_NAMES = ("gripper",)
+ROBOT_JOINT_NAMES = ARM_JOINT_NAMES + GRIPPER_JOINT_NAMES   # TaskState 读取的全部 6 个关节（仿真中的关节顺序）
+FINGER_BODY_NAMES = ("finger1", "finger2")
+
+# ------------------------------------------------------------
+# 3. 动作：目标关节角 = 当前关节角 + 动作 * scale
+# ------------------------------------------------------------
+ARM_ACTION_SCALE = 0.1          # 网络输出 1.0 对应手臂关节移动 0.1 rad
+GRIPPER_ACTION_SCALE = 0.08     # 夹爪行程短、需要更精细的控制
+
+# ------------------------------------------------------------
+# 4. 奖励
+# ------------------------------------------------------------
+TRANSPORT_REWARD_WEIGHT = 1.0
+TRANSPORT_REWARD_PARAMS = {
+    "max_ee_cube_dist": 1.0,
+    "target_lift_height": 0.1,
+    "max_y_dist": 0.8,
+}
+"""cube_transport_linear_reward 的几何参数（开关类参数 use_compile / log_components 在各配置中单独给出）。"""
+ACTION_RATE_WEIGHT = -0.01
+
+# ------------------------------------------------------------
+# 5. 任务几何（TaskStateCfg）
+# ------------------------------------------------------------
+TABLE_HEIGHT = 0.5              # 桌面高度 (m)
+CUBE_SIZE = 0.05                # 物块边长 (m)
+TIMING_BINS = 5                 # 首次夹紧 / 首次提起用时直方图的桶数（按回合时长等分）
+
+# ------------------------------------------------------------
+# 6. 重置时的关节域随机化
+# ------------------------------------------------------------
+JOINT_RESET_POSITION_RANGE = (-0.05, 0.05)    # rad
+JOINT_RESET_VELOCITY_RANGE = (0.0, 0.0)
@@ -0,0 +1,306 @@
+# ================================================================
+#  task_state.py
+#  每个环境实例独享的任务状态：每步几何量缓存 + 跨步记忆（观测 / 奖励 / 终止共用）
+# ================================================================
+
+from __future__ import annotations
+
+import torch
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+from .episode_stats import EpisodeStats, RewardBreakdown
+from .observation_layout import ObservationLayout, scene_obs_fields
+from .reward_kernels import TARGET_Y, TransportRewardBuffers
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+    from .task_state_cfg import TaskStateCfg
+
+
+class TerminationReason(IntEnum):
+    """
+    终止原因编码（存为 int8）。
+    同一步满足多个条件时取优先级最高的一个：成功 > 中途掉落 > 越界 > 超时。
+    """
+
+    NONE = 0
+    SUCCESS = 1
+    FAIL_DROP = 2
+    OUT_OF_TABLE = 3
+    TIME_OUT = 4
+
+
+class TaskState:
+    """
+    📌 任务状态（挂在每个 ManagerBasedRLEnv 实例上）
+    ------------------------------------------------
+    1. 几何量缓存：每个控制步只从 robot.data.body_pos_w / cube.data.root_pos_w 推导一次：
+       指尖位置、指尖间距、TCP、物块环境局部坐标、物块离桌高度、物块相对 TCP 的位移与距离。
+       缓存以 env.common_step_counter 为键；重置事件会让缓存失效，
+       因为重置之后计算的观测必须看到重置后的场景数据。
+    2. 跨步记忆：上一帧夹爪动作、上一帧指距、是否夹紧、是否曾被提起。
+       每个控制步只推进一次，奖励与终止读到的是同一份结果。
+       回合重置通过事件管理器的 reset 钩子清零，全部是按 env_ids 的原地写入，不会触发 GPU 同步。
+
+    3. 输出缓冲：观测、奖励、终止函数的返回值也写入这里预分配的张量（管理器在同一步内就会消费掉）。
+       稳态下每个控制步不分配任何新张量（检查脚本见 scripts/benchmarks/check_step_allocations.py）。
+    4. 终止判定：evaluate_terminations 每步一次性算出全部终止条件与 int8 终止原因，各终止函数只读结果，
+       与 TerminationsCfg 中的顺序无关；各原因的次数在设备上累计，由 pop_log 每次迭代取出一次。
+    5. 回合统计：回合结束时在设备上累计结果计数与首次夹紧 / 首次提起的用时直方图（见 episode_stats.py），
+       整个回合过程中没有 .item() / .cpu()，pop_log 时才换算成比例。
+
+    所有结果写入预先分配好的张量，各 MDP 函数直接读取这些张量（只读，不要原地修改）。
+    每个环境实例拥有自己的 TaskState，同一进程里的训练环境与评估环境互不干扰。
+    """
+
+    def __init__(self, cfg: TaskStateCfg, env: ManagerBasedRLEnv):
+        self.cfg = cfg
+        self.num_envs = env.num_envs
+        self.device = env.device
+
+        # --- 1. 刚体 / 关节索引：只在构造时（管理器初始化时）解析一次 ---
+        cfg.robot_cfg.resolve(env.scene)
+        cfg.cube_cfg.resolve(env.scene)
+        if len(cfg.robot_cfg.body_ids) != 2:
+            raise ValueError(f"TaskState 需要恰好两个指尖刚体，实际解析到: {cfg.robot_cfg.body_names}")
+        # 指尖索引缓存为设备上的索引张量，每步一次 index_select 同时取出两个指尖
+        self._tip_ids = torch.tensor(cfg.robot_cfg.body_ids, dtype=torch.long, device=env.device)
+        # 关节索引：覆盖全部关节时为 slice(None)（读取为视图），否则缓存为索引张量
+        joint_ids = cfg.robot_cfg.joint_ids
+        if isinstance(joint_ids, slice):
+            self.joint_ids = joint_ids
+        else:
+            self.joint_ids = torch.tensor(joint_ids, dtype=torch.long, device=env.device)
+
+        # 物块中心高度 -> 物块底面离桌高度 的偏移
+        self._height_offset = cfg.table_height + cfg.cube_size / 2.0
+
+        # --- 2. 预分配缓存张量 ---
+        n, device = self.num_envs, self.device
+        self.tips_pos = torch.zeros(n, 2, 3, device=device)    # 两个指尖 (环境局部坐标)
+        self.tip1_pos = self.tips_pos[:, 0]                    # 指尖1 (视图)
+        self.tip2_pos = self.tips_pos[:, 1]                    # 指尖2 (视图)
+        self.tcp_pos = torch.zeros(n, 3, device=device)        # 指尖中点 TCP
+        self.finger_dist = torch.zeros(n, device=device)       # 两指尖距离
+        self.cube_pos = torch.zeros(n, 3, device=device)       # 物块 (环境局部坐标)
+        self.cube_height = torch.zeros(n, device=device)       # 物块底面离桌高度
+        self.cube_rel_tcp = torch.zeros(n, 3, device=device)   # 物块相对 TCP 的位移
+        self.tcp_cube_dist = torch.zeros(n, device=device)     # TCP 到物块的距离
+        self._tip_delta = torch.zeros(n, 3, device=device)     # 计算指尖间距用的临时缓冲
+
+        # --- 3. 跨步记忆 ---
+        self.last_gripper_action = torch.zeros(n, device=device)                 # 上一帧夹爪动作 a_{t-1}
+        self.last_finger_dist = torch.zeros(n, device=device)                    # 上一帧指距
+        self.is_clamped = torch.zeros(n, dtype=torch.bool, device=device)        # 当前是否夹紧
+        self.has_been_lifted = torch.zeros(n, dtype=torch.bool, device=device)   # 本回合是否曾经提起过
+        # 回合第一步还没有"上一帧指距"，用当前指距初始化
+        self._needs_init = torch.ones(n, dtype=torch.bool, device=device)
+
+        # --- 4. MDP 函数的输出缓冲 ---
+        robot = env.scene[cfg.robot_cfg.name]
+        num_joints = robot.num_joints if isinstance(self.joint_ids, slice) else len(self.joint_ids)
+        # 观测：各分量写入布局中命名的列区间（见 observation_layout.py）
+        self.obs_layout = ObservationLayout(scene_obs_fields(num_joints), n, device)
+        self.reward_buffers = TransportRewardBuffers(n, device)
+        self.success = torch.zeros(n, dtype=torch.bool, device=device)
+        self.fail_drop = torch.zeros(n, dtype=torch.bool, device=device)
+        self.out_of_table = torch.zeros(n, dtype=torch.bool, device=device)
+        self.time_out = torch.zeros(n, dtype=torch.bool, device=device)
+        self.termination_reason = torch.zeros(n, dtype=torch.int8, device=device)
+
+        # --- 5. 设备上的日志累计（pop_log 时取出并清零）---
+        self.reason_counts = torch.zeros(len(TerminationReason), dtype=torch.long, device=device)
+        self._reason_index = torch.zeros(n, dtype=torch.long, device=device)
+        self._ones = torch.ones(n, dtype=torch.long, device=device)
+        self.episode_stats = EpisodeStats(n, env.max_episode_length, env.step_dt, cfg.timing_bins, device)
+        # 奖励分量的回合累计：默认关闭，由奖励函数按需开启（见 enable_reward_breakdown）
+        self.reward_breakdown: RewardBreakdown | None = None
+        # 各函数共用的临时缓冲（只在单个函数调用内有效）
+        self.work = torch.zeros(n, device=device)
+        self.work_mask = torch.zeros(n, dtype=torch.bool, device=device)
+
+        self._step = -1
+        self._advanced_step = -1
+        self._terminations_step = -1
+
+    def update(self, env: ManagerBasedRLEnv) -> TaskState:
+        """同一控制步内只计算一次，之后的调用直接返回缓存。"""
+        if self._step == env.common_step_counter:
+            return self
+
+        robot = env.scene[self.cfg.robot_cfg.name]
+        cube = env.scene[self.cfg.cube_cfg.name]
+        env_origins = env.scene.env_origins
+
+        # --- 指尖与 TCP ---
+        torch.index_select(robot.data.body_pos_w, 1, self._tip_ids, out=self.tips_pos)
+        self.tips_pos.sub_(env_origins.unsqueeze(1))
+        torch.add(self.tip1_pos, self.tip2_pos, out=self.tcp_pos).mul_(0.5)
+        torch.sub(self.tip1_pos, self.tip2_pos, out=self._tip_delta)
+        torch.linalg.vector_norm(self._tip_delta, dim=-1, out=self.finger_dist)
+
+        # --- 物块 ---
+        torch.sub(cube.data.root_pos_w, env_origins, out=self.cube_pos)
+        torch.sub(self.cube_pos[:, 2], self._height_offset, out=self.cube_height)
+        torch.sub(self.cube_pos, self.tcp_pos, out=self.cube_rel_tcp)
+        torch.linalg.vector_norm(self.cube_rel_tcp, dim=-1, out=self.tcp_cube_dist)
+
+        self._step = env.common_step_counter
+
+        # 跨步记忆每个控制步只推进一次（重置后重新计算几何量时不再推进）
+        if self._advanced_step != env.common_step_counter:
+            self._advance(env)
+            self._advanced_step = env.common_step_counter
+        return self
+
+    def _advance(self, env: ManagerBasedRLEnv):
+        """推进跨步记忆：夹紧判定、提起记录，并记下本帧动作与指距。"""
+        curr_finger_dist = self.finger_dist
+        mask = self.work_mask
+
+        # 回合第一步：上一帧指距取当前值
+        torch.where(self._needs_init, curr_finger_dist, self.last_finger_dist, out=self.last_finger_dist)
+        self._needs_init.fill_(False)
+
+        # ★★★ 关键点：夹紧判定必须基于上一帧动作，且指距在 (0.03, 0.1) 之间
+        # is_clamped = (a_{t-1} != 0) & 指距静止 & (0.03 < 指距 < 0.1)，逐项原地与到 is_clamped 上
+        torch.sub(curr_finger_dist, self.last_finger_dist, out=self.work).abs_()
+        torch.ne(self.last_gripper_action, 0, out=self.is_clamped)
+        self.is_clamped &= torch.lt(self.work, 1e-4, out=mask)
+        self.is_clamped &= torch.gt(curr_finger_dist, 0.03, out=mask)
+        self.is_clamped &= torch.lt(curr_finger_dist, 0.1, out=mask)
+
+        # lifted 判定
+        self.has_been_lifted |= torch.gt(self.cube_height, 0.03, out=mask).logical_and_(self.is_clamped)
+        self.episode_stats.record_progress(self.is_clamped, self.has_been_lifted, env.episode_length_buf)
+
+        # 更新跨步状态
+        self.last_gripper_action.copy_(env.action_manager.action[:, -1])
+        self.last_finger_dist.copy_(curr_finger_dist)
+
+    def evaluate_terminations(self, env: ManagerBasedRLEnv) -> TaskState:
+        """
+        📌 单次遍历的终止判定（每个控制步只计算一次）
+        ------------------------------------------------
+        写入 success / fail_drop / out_of_table / time_out 四个布尔缓冲，以及每个环境的 int8 终止原因，
+        并在同一遍里把各原因的次数累加到设备上的 reason_counts（scatter_add_，不同步、不分配）。
+        """
+        if self._terminations_step == env.common_step_counter:
+            return self
+        mask = self.work_mask
+
+        # 到达终点：|y - target_y| < 0.05 且离桌高度 < 0.05（先写入 success，再派生 fail_drop）
+        torch.sub(self.cube_pos[:, 1], TARGET_Y, out=self.work).abs_()
+        is_at_goal = torch.lt(self.work, 0.05, out=self.success)
+        is_at_goal &= torch.lt(self.cube_height, 0.05, out=mask)
+        # 中途掉落：曾经提起 & 没有夹紧 & 不在终点
+        torch.logical_or(is_at_goal, self.is_clamped, out=self.fail_drop).logical_not_()
+        self.fail_drop &= self.has_been_lifted
+        # 成功：曾经提起 & 到达终点
+        self.success &= self.has_been_lifted
+        # 越界：|x| > 0.4 或 y > 0.6 或 离桌高度 < -0.1
+        torch.gt(torch.abs(self.cube_pos[:, 0], out=self.work), 0.4, out=self.out_of_table)
+        self.out_of_table |= torch.gt(self.cube_pos[:, 1], 0.6, out=mask)
+        self.out_of_table |= torch.lt(self.cube_height, -0.1, out=mask)
+        # 超时（与 isaaclab.envs.mdp.time_out 相同）
+        torch.ge(env.episode_length_buf, env.max_episode_length, out=self.time_out)
+
+        # 终止原因：按优先级从低到高覆盖写入
+        reason = self.termination_reason.zero_()
+        reason.masked_fill_(self.time_out, TerminationReason.TIME_OUT)
+        reason.masked_fill_(self.out_of_table, TerminationReason.OUT_OF_TABLE)
+        reason.masked_fill_(self.fail_drop, TerminationReason.FAIL_DROP)
+        reason.masked_fill_(self.success, TerminationReason.SUCCESS)
+        self._reason_index.copy_(reason)
+        self.reason_counts.scatter_add_(0, self._reason_index, self._ones)
+        # 本步结束的回合（任一终止条件成立）计入用时直方图
+        self.episode_stats.record_episode_end(torch.ne(reason, TerminationReason.NONE, out=mask))
+
+        self._terminations_step = env.common_step_counter
+        return self
+
+    def pop_log(self) -> dict[str, torch.Tensor]:
+        """
+        取出自上次调用以来在设备上累计的统计量（仍在设备上，不同步），并清零累计。
+        由训练脚本每次迭代调用一次，合并进 extras["log"] 交给 OnPolicyRunner 记录。
+        - Termination_Reason/<原因>：各终止原因的回合数；
+        - Episode_Outcome/<原因>_rate：各终止原因占全部结束回合的比例；
+        - Episode_Timing/...：首次夹紧 / 首次提起的比例、平均用时与用时分布（见 EpisodeStats.pop_log）；
+        - Reward_Component/<分量>：开启奖励分量累计时，各分量的平均回合和，与 Episode_Reward/<奖励项> 同单位（见 RewardBreakdown）。
+        """
+        counts = self.reason_counts.clone()
+        self.reason_counts.zero_()
+        num_episodes = counts[TerminationReason.NONE + 1 :].sum()
+        rates = counts / num_episodes.clamp_min(1)
+        log = {}
+        for reason in TerminationReason:
+            if reason == TerminationReason.NONE:
+                continue
+            log[f"Termination_Reason/{reason.name.lower()}"] = counts[reason]
+            log[f"Episode_Outcome/{reason.name.lower()}_rate"] = rates[reason]
+        log.update(self.episode_stats.pop_log(num_episodes))
+        if self.reward_breakdown is not None:
+            log.update(self.reward_breakdown.pop_log())
+        return log
+
+    def enable_reward_breakdown(self, names: tuple[str, ...], scale: float = 1.0) -> RewardBreakdown:
+        """开启奖励分量的回合累计：奖励核此后把各分量写入 reward_buffers.components（scale 见 RewardBreakdown）。"""
+        if self.reward_breakdown is None:
+            # 第一次调用通常在 rollout 的 inference_mode 中：缓冲要建成普通张量，pop_log 时才能在外面原地清零
+            with torch.inference_mode(False):
+                self.reward_breakdown = RewardBreakdown(names, self.num_envs, self.device, scale)
+            self.reward_buffers.components = self.reward_breakdown.step_values
+        return self.reward_breakdown
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        """
+        回合重置：按 env_ids 原地清零跨步记忆，并让几何缓存失效。
+        env_ids 为设备上的索引张量，index_fill_ 不需要把数据同步回主机。
+        """
+        if env_ids is None:
+            self.last_gripper_action.zero_()
+            self.is_clamped.zero_()
+            self.has_been_lifted.zero_()
+            self._needs_init.fill_(True)
+            self.episode_stats.reset()
+            if self.reward_breakdown is not None:
+                self.reward_breakdown.reset()
+        else:
+            env_ids = torch.as_tensor(env_ids, dtype=torch.long, device=self.device)
+            self.last_gripper_action.index_fill_(0, env_ids, 0.0)
+            self.is_clamped.index_fill_(0, env_ids, False)
+            self.has_been_lifted.index_fill_(0, env_ids, False)
+            self._needs_init.index_fill_(0, env_ids, True)
+            self.episode_stats.reset(env_ids)
+            if self.reward_breakdown is not None:
+                self.reward_breakdown.reset(env_ids)
+        self.invalidate()
+
+    def invalidate(self):
+        """让几何缓存失效，下一次 update 会重新从仿真数据计算。"""
+        self._step = -1
+
+
+def get_task_state(env: ManagerBasedRLEnv) -> TaskState:
+    """
+    获取（必要时创建）挂在环境实例上的 TaskState，并确保本步数据已计算。
+    第一次调用发生在管理器初始化时（ObservationManager 会先调用一次观测函数推断维度）。
+    """
+    state = getattr(env, "task_state", None)
+    if state is None:
+        state = TaskState(env.cfg.task_state, env)
+        env.task_state = state
+    return state.update(env)
+
+
+def reset_task_state(env: ManagerBasedRLEnv, env_ids: torch.Tensor | None):
+    """
+    📌 重置事件：清零被重置环境的跨步记忆，并让几何缓存失效
+    ------------------------------------------------
+    终止/奖励在重置之前已经读过本步状态；重置之后计算的观测需要重新读取场景数据。
+    """
+    state = getattr(env, "task_state", None)
+    if state is not None:
+        state.reset(env_ids)
@@ -0,0 +1,47 @@
+# ================================================================
+#  task_state_cfg.py
+#  每步任务状态缓存的配置（观测 / 奖励 / 终止共用）
+# ================================================================
+
+from isaaclab.managers import SceneEntityCfg
+from isaaclab.utils import configclass
+
+from .task_params import (
+    CUBE_NAME,
+    CUBE_SIZE,
+    FINGER_BODY_NAMES,
+    ROBOT_JOINT_NAMES,
+    ROBOT_NAME,
+    TABLE_HEIGHT,
+    TIMING_BINS,
+)
+
+
+@configclass
+class TaskStateCfg:
+    """
+    📌 任务状态缓存配置
+    ------------------------------------------------
+    TaskState 在每个控制步只从仿真数据中推导一次指尖、TCP、物块位置等几何量，
+    观测、奖励、终止函数都从这里读取，不再各自重复计算。
+
+    机器人的指尖刚体、关节都通过 SceneEntityCfg 声明，
+    在 TaskState 构造时（即管理器初始化时）解析一次 body_ids / joint_ids，之后每步只用缓存的索引。
+    """
+
+    # 机器人资产：两个指尖刚体 + 手臂/夹爪关节
+    # （刚体顺序按仿真中的刚体顺序解析，与原先 find_bodies 的默认行为一致；
+    #   关节覆盖全部 6 个关节且顺序一致时，解析结果为 slice(None)，读取关节数据不产生拷贝）
+    # 数值与名字来自 mdp/task_params.py（与运动学替身环境共用）
+    robot_cfg: SceneEntityCfg = SceneEntityCfg(
+        ROBOT_NAME,
+        body_names=list(FINGER_BODY_NAMES),
+        joint_names=list(ROBOT_JOINT_NAMES),
+    )
+
+    cube_cfg: SceneEntityCfg = SceneEntityCfg(CUBE_NAME)   # 物块资产，名字必须与 SceneAssetsCfg 中的属性名一致
+
+    table_height: float = TABLE_HEIGHT   # 桌面高度 (m)
+    cube_size: float = CUBE_SIZE         # 物块边长 (m)
+
+    timing_bins: int = TIMING_BINS       # 首次夹紧 / 首次提起用时直方图的桶数（按回合时长等分）
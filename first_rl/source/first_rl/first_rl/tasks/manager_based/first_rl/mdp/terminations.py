@@ -0,0 +1,82 @@
+# ================================================================
+#  terminations.py
+#  自定义终止条件（纯 torch，不依赖 Isaac Lab，可被运动学替身环境直接复用）
+# ================================================================
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from .task_state import TaskState, get_task_state
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+# 全部终止条件由 TaskState.evaluate_terminations 在每步第一次被调用时一次性算出（单次遍历，与调用顺序无关），
+# 下面的终止函数只返回预分配的布尔缓冲。
+# 只有显式传入 env_ids 时才按索引取子集（会产生新张量，不在训练的每步路径上）。
+
+
+def get_termination_state(env: ManagerBasedRLEnv) -> TaskState:
+    """返回本步已完成终止判定的 TaskState（success / fail_drop / out_of_table / time_out / termination_reason）。"""
+    return get_task_state(env).evaluate_terminations(env)
+
+
+def get_termination_reason(env: ManagerBasedRLEnv) -> torch.Tensor:
+    """每个环境本步的终止原因 (int8，取值见 task_state.TerminationReason)。"""
+    return get_termination_state(env).termination_reason
+
+
+def task_time_out(
+    env: ManagerBasedRLEnv,
+    env_ids: torch.Tensor | None = None,
+) -> torch.Tensor:
+    # 与 isaaclab.envs.mdp.time_out 相同：episode_length_buf >= max_episode_length
+    time_out = get_termination_state(env).time_out
+    return time_out if env_ids is None else time_out[env_ids]
+
+
+def task_success(
+    env: ManagerBasedRLEnv,
+    env_ids: torch.Tensor | None = None,
+) -> torch.Tensor:
+    # 成功：曾经提起 & 到达终点（|y - target_y| < 0.05 且离桌高度 < 0.05）
+    success_mask = get_termination_state(env).success
+
+    # # --- 打印调试信息 ---
+    # if success_mask.any():
+    #     success_env_ids = success_mask.nonzero().squeeze(-1).tolist()
+    #     print(f"\033[92m[TERMINATION: SUCCESS]\033[0m 环境 {success_env_ids} 满足成功重置条件！")
+
+    return success_mask if env_ids is None else success_mask[env_ids]
+
+
+def task_fail_drop(
+    env: ManagerBasedRLEnv,
+    env_ids: torch.Tensor | None = None,
+) -> torch.Tensor:
+    # 失败：曾经提起 & 没有夹紧 & 不在终点
+    fail_mask = get_termination_state(env).fail_drop
+
+    # # --- 打印调试信息 ---
+    # if fail_mask.any():
+    #     fail_env_ids = fail_mask.nonzero().squeeze(-1).tolist()
+    #     print(f"\033[91m[TERMINATION: FAIL_DROP]\033[0m 环境 {fail_env_ids} 掉落重置！(曾经提起但未在终点松手)")
+
+    return fail_mask if env_ids is None else fail_mask[env_ids]
+
+
+def cube_out_of_table(
+    env: ManagerBasedRLEnv,
+    env_ids: torch.Tensor | None = None,
+) -> torch.Tensor:
+    # 越界：|x| > 0.4 或 y > 0.6 或 离桌高度 < -0.1
+    out_mask = get_termination_state(env).out_of_table
+
+    # # --- 打印调试信息 ---
+    # if out_mask.any():
+    #     out_env_ids = out_mask.nonzero().squeeze(-1).tolist()
+    #     print(f"\033[93m[TERMINATION: OUT_OF_TABLE]\033[0m 环境 {out_env_ids} 物块越界/掉下桌子！")
+
+    return out_mask if env_ids is None else out_mask[env_ids]
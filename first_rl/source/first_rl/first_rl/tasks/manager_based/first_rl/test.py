@@ -1,24 +1,43 @@
+import argparse
 import os
 import sys
+import threading
+from datetime import datetime
+
 import torch
 from pynput import keyboard
 from isaaclab.app import AppLauncher
 
+# 0. 命令行参数：示教录制
+parser = argparse.ArgumentParser(description="键盘遥操作示教（录制为轨迹数据集，可直接用于 train.py --bc_demos）")
+parser.add_argument("--record_dir", type=str, default=None, help="示教录制目录，默认 logs/teleop/<时间戳>")
+parser.add_argument("--no_record", action="store_true", default=False, help="只遥操作，不录制")
+parser.add_argument("--record_shard_steps", type=int, default=256, help="每个分片的步数")
+parser.add_argument("--display_interval", type=float, default=0.2, help="状态显示的刷新间隔 (s)")
+args_cli = parser.parse_args()
+
 # 1. 启动仿真引擎
 app_launcher = AppLauncher(headless=False)
 simulation_app = app_launcher.app
 
 # 注意：这里改为导入 ManagerBasedRLEnv
 from isaaclab.envs import ManagerBasedRLEnv
+from isaaclab_rl.rsl_rl import RslRlVecEnvWrapper
 
 # 2. 路径补丁
 current_file_path = os.path.abspath(__file__)
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
+# 轨迹录制与定频调度复用 scripts/rsl_rl 中的工具（与 train.py / play.py 的录制格式相同）
+scripts_dir = os.path.join(os.path.dirname(current_file_path), *[".."] * 6, "scripts", "rsl_rl")
+sys.path.insert(0, os.path.normpath(scripts_dir))
 
 try:
     import first_rl.first_rl_env_cfg as env_module
+    from first_rl.mdp.task_state import TerminationReason
+    import realtime
+    import trajectory_recorder
     FirstRLEnvCfg = env_module.FirstRLEnvCfg
     print("✅ 配置加载成功")
 except Exception as e:
@@ -62,16 +81,79 @@ class TeleopController:
         except: pass
 
 
+class StatusDisplay:
+    """
+    📌 节流的后台状态显示
+    ------------------------------------------------
+    控制循环每步只在设备上更新 0 号环境的状态（当前奖励、本回合累计奖励、上一回合的回报与终止原因、回合数），
+    再异步拷贝到锁页内存（non_blocking，不等待 GPU）；后台线程每 interval 秒读一次主机缓冲并刷新一行输出。
+    控制循环里没有 .item() / print，不会因为显示而同步设备或被终端输出拖慢。
+    显示的数值可能比当前步晚一两步（只用于观察，不参与控制与录制）。
+    """
+
+    # 槽位：当前奖励, 本回合累计, 上一回合回报, 上一回合终止原因, 结束的回合数
+    REWARD, RETURN, LAST_RETURN, LAST_REASON, EPISODES = range(5)
+
+    def __init__(self, device, interval: float = 0.2):
+        self.interval = interval
+        self._state = torch.zeros(5, device=device)
+        self._host = torch.zeros(5, pin_memory=torch.device(device).type == "cuda")
+        self.step = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def update(self, rew: torch.Tensor, done: torch.Tensor, reason: torch.Tensor):
+        """rew / done / reason 为 0 号环境本步的值（设备上的 0 维张量）。"""
+        s = self._state
+        done = done.bool()
+        s[self.REWARD] = rew
+        s[self.RETURN] += rew
+        s[self.LAST_RETURN] = torch.where(done, s[self.RETURN], s[self.LAST_RETURN])
+        s[self.LAST_REASON] = torch.where(done, reason.float(), s[self.LAST_REASON])
+        s[self.EPISODES] += done
+        s[self.RETURN] = torch.where(done, 0.0, s[self.RETURN])
+        self._host.copy_(s, non_blocking=True)
+        self.step += 1
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        print()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            reward, ret, last_ret, last_reason, episodes = self._host.tolist()
+            reason = TerminationReason(int(last_reason)).name.lower() if episodes > 0 else "-"
+            sys.stdout.write(
+                f"\r步数: {self.step:6d} | 当前奖励值: {reward:10.4f} | 本回合累计: {ret:10.2f}"
+                f" | 回合数: {int(episodes):4d} | 上一回合: {reason} ({last_ret:.2f})   "
+            )
+            sys.stdout.flush()
+
+
 def main():
     cfg = FirstRLEnvCfg()
     cfg.scene.num_envs = 1
-    
+
     # --- 核心修改点 1: 使用 ManagerBasedRLEnv ---
     # 只有 RLEnv 会根据 cfg 中的 RewardsCfg 自动初始化 RewardManager
-    env = ManagerBasedRLEnv(cfg=cfg)
-
-    action_shape = env.action_manager.action.shape
-    action_dim = action_shape[1]
+    # RslRlVecEnvWrapper 把 terminated | truncated 合成 dones；ManagerBasedRLEnv 在 step 内自动重置结束的回合，
+    # 录制中的回合边界就是环境自己的重置
+    env = RslRlVecEnvWrapper(ManagerBasedRLEnv(cfg=cfg))
+    if not args_cli.no_record:
+        record_dir = args_cli.record_dir or os.path.join(
+            "logs", "teleop", datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        )
+        env = trajectory_recorder.TrajectoryRecorder(
+            env,
+            os.path.abspath(record_dir),
+            shard_steps=args_cli.record_shard_steps,
+            reason_names=[reason.name.lower() for reason in TerminationReason],
+        )
+        print(f"📼 示教录制到: {os.path.abspath(record_dir)}")
+
+    action_dim = env.num_actions
     device = env.device
     print(f"✅ 环境动作维度: {action_dim}, device = {device}")
 
@@ -84,29 +166,32 @@ def main():
     print("🚀 实时示教 + 奖励监控模式已开启")
     print("=" * 60 + "\n")
 
-    while simulation_app.is_running():
-        with torch.inference_mode():
-            actions = controller.actions
-            
-            # --- 核心修改点 2: 解构 RL 环境的五个返回值 ---
-            # obs: 观测, rew: 奖励, terminated: 终止, truncated: 超时, extras: 额外信息
-            obs, rew, terminated, truncated, extras = env.step(actions)
-
-            # --- 核心修改点 3: 实时打印奖励 ---
-            # rew 的 shape 是 (num_envs,)，我们只有 1 个环境，所以取 [0]
-            current_rew = rew[0].item()
-            
-            # 使用 sys.stdout.write 实现单行刷新，避免刷屏
-            sys.stdout.write(f"\r当前奖励值: {current_rew:10.4f} | 终止状态: {terminated[0]}")
-            sys.stdout.flush()
-
-            # 如果触发了终止条件（比如掉下平台或完成任务），重置环境
-            if terminated[0] or truncated[0]:
-                print("\n🔄 检测到环境重置...")
-                env.reset()
+    state = env.unwrapped.task_state
+    display = StatusDisplay(device, interval=args_cli.display_interval)
+    # 按 step_dt 的绝对截止时间定频，键盘输入的手感与仿真时间一致
+    scheduler = realtime.FixedRateScheduler(env.unwrapped.step_dt)
+    try:
+        while simulation_app.is_running():
+            with torch.inference_mode():
+                # --- 核心修改点 2: 录制包装与 RSL-RL 包装返回四个值 ---
+                # 传入动作的拷贝：键盘线程随时会改写 controller.actions
+                obs, rew, dones, extras = env.step(controller.actions.clone())
+
+                # --- 核心修改点 3: 状态显示交给后台线程（本步不同步设备）---
+                display.update(rew[0], dones[0], state.termination_reason[0])
+            scheduler.wait()
+    finally:
+        display.close()
+        listener.stop()
+        # 写完暂存的步并定稿 manifest（录制包装），再关闭环境
+        env.close()
+        print(
+            f"⏱️ {scheduler.num_steps} 步，错过截止时间 {scheduler.num_missed} 次，"
+            f"唤醒延迟 p99 {scheduler.lateness.percentile(99) * 1e3:.2f} ms"
+        )
 
     simulation_app.close()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
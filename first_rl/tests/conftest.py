@@ -0,0 +1,20 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""CPU tests of the pure-torch parts of first_rl (no Isaac Sim).
+
+The helpers of the benchmark and deployment scripts are imported from their script directories; the task modules
+are mounted through :func:`bench_utils.import_task_module`.
+"""
+
+import os
+import sys
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts")
+
+for name in ("benchmarks", "deploy", "rsl_rl"):
+    path = os.path.normpath(os.path.join(SCRIPTS_DIR, name))
+    if path not in sys.path:
+        sys.path.insert(0, path)
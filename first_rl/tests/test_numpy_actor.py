@@ -0,0 +1,30 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Parity of the NumPy actor runtime (``policy.npz``) with the TorchScript export (``policy.pt``)."""
+
+import os
+
+import numpy as np
+import pytest
+
+from bench_numpy_actor import export_synthetic  # isort: skip
+from policy_server import load_policy  # isort: skip
+
+OBS_DIM = 30
+ACTION_DIM = 6
+
+
+@pytest.mark.parametrize("normalize", [True, False], ids=["empirical_normalization", "identity"])
+def test_numpy_actor_matches_torchscript(tmp_path, normalize):
+    export_synthetic(OBS_DIM, ACTION_DIM, str(tmp_path), normalize=normalize)
+    torch_policy = load_policy(os.path.join(tmp_path, "policy.pt"))
+    # batches beyond max_batch grow the work buffers
+    numpy_policy = load_policy(os.path.join(tmp_path, "policy.npz"), max_batch=64)
+    assert (numpy_policy.obs_mean is not None) == normalize
+    rng = np.random.default_rng(0)
+    for batch_size in (1, 64, 4096):
+        obs = 3.0 * rng.standard_normal((batch_size, OBS_DIM), dtype=np.float32)
+        np.testing.assert_allclose(numpy_policy(obs), torch_policy(obs), rtol=0.0, atol=1e-5)
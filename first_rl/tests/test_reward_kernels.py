@@ -0,0 +1,33 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Parity of the fused and in-place transport reward kernels with the mask-scatter reference."""
+
+import pytest
+import torch
+
+from bench_utils import TRANSPORT_REWARD_PARAMS, import_task_module, random_transport_inputs  # isort: skip
+
+kernels = import_task_module("mdp.reward_kernels")
+
+NUM_ENVS = 4096
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_fused_matches_reference(seed):
+    inputs = random_transport_inputs(NUM_ENVS, "cpu", seed)
+    expected = kernels.transport_reward_reference(*inputs, **TRANSPORT_REWARD_PARAMS)
+    actual = kernels.transport_reward_fused(*inputs, **TRANSPORT_REWARD_PARAMS)
+    torch.testing.assert_close(actual, expected, rtol=1e-5, atol=1e-5)
+
+
+def test_inplace_matches_reference():
+    # the buffers are reused across calls, as on the TaskState
+    buffers = kernels.TransportRewardBuffers(NUM_ENVS, "cpu")
+    for seed in range(20):
+        inputs = random_transport_inputs(NUM_ENVS, "cpu", seed)
+        expected = kernels.transport_reward_reference(*inputs, **TRANSPORT_REWARD_PARAMS)
+        actual = kernels.transport_reward_inplace(*inputs, **TRANSPORT_REWARD_PARAMS, buffers=buffers)
+        torch.testing.assert_close(actual, expected, rtol=1e-5, atol=1e-5)
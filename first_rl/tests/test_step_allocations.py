@@ -0,0 +1,18 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""The custom MDP terms of FirstRL-v0 allocate no tensors in steady state (see ``check_step_allocations.py``)."""
+
+import pytest
+
+from bench_utils import SyntheticEnv, count_step_allocations, step_terms  # isort: skip
+
+
+@pytest.mark.parametrize("reward_components", [False, True], ids=["default", "reward_components"])
+def test_step_terms_allocate_nothing_after_warmup(reward_components):
+    env = SyntheticEnv(256, device="cpu")
+    terms = step_terms(env, reward_components=reward_components)
+    allocations, _ = count_step_allocations(env, terms, warmup=3, steps=10)
+    assert allocations == dict.fromkeys(terms, 0)
@@ -0,0 +1,90 @@
+# Copyright (c) 2022-2026, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Consistency of the kinematic stand-in config with the Isaac Lab config of FirstRL-v0.
+
+The values of both configs come from ``mdp/task_params.py``; only the structure of the term tables (term names,
+order and functions) is mirrored in ``kinematic/env_cfg.py``. The Isaac Lab config files cannot be imported without
+Isaac Sim, so they are parsed: the tests compare their term tables with the kinematic ones and check that they hold
+no numeric literals (every value goes through ``task_params``).
+"""
+
+import ast
+import os
+
+import pytest
+
+from bench_utils import TASK_DIR, import_task_module  # isort: skip
+
+kinematic_cfg = import_task_module("kinematic.env_cfg")
+
+# Isaac Lab config file, class (dotted for nested classes) -> attribute of KinematicEnvCfg
+TABLES = {
+    ("mdp/actions_cfg.py", "ActionsCfg"): "actions",
+    ("mdp/observations_cfg.py", "ObservationsCfg.PolicyCfg"): "observations.policy",
+    ("mdp/rewards_cfg.py", "RewardsCfg"): "rewards",
+    ("mdp/terminations_cfg.py", "TerminationsCfg"): "terminations",
+    ("mdp/events_cfg.py", "EventsCfg"): "events",
+}
+
+
+def _class_node(path: str, dotted: str) -> ast.ClassDef:
+    with open(os.path.join(TASK_DIR, path), encoding="utf-8") as f:
+        body = ast.parse(f.read()).body
+    for name in dotted.split("."):
+        node = next(n for n in body if isinstance(n, ast.ClassDef) and n.name == name)
+        body = node.body
+    return node
+
+
+def _terms(node: ast.ClassDef) -> dict[str, ast.Call]:
+    """Class-level ``name = SomeCfg(...)`` assignments in declaration order."""
+    terms = {}
+    for stmt in node.body:
+        if isinstance(stmt, ast.Assign) and isinstance(stmt.value, ast.Call) and isinstance(stmt.targets[0], ast.Name):
+            terms[stmt.targets[0].id] = stmt.value
+    return terms
+
+
+def _func_name(call: ast.Call) -> str | None:
+    for keyword in call.keywords:
+        if keyword.arg == "func":
+            value = keyword.value
+            return value.attr if isinstance(value, ast.Attribute) else value.id
+    return None
+
+
+def _numeric_literals(node: ast.AST) -> list[str]:
+    return [
+        ast.unparse(n)
+        for n in ast.walk(node)
+        if isinstance(n, ast.Constant) and isinstance(n.value, (int, float)) and not isinstance(n.value, bool)
+    ]
+
+
+def _kinematic_table(attribute: str) -> dict:
+    table = kinematic_cfg.KinematicEnvCfg()
+    for name in attribute.split("."):
+        table = getattr(table, name) if not isinstance(table, dict) else table[name]
+    return table
+
+
+@pytest.mark.parametrize(("source", "attribute"), list(TABLES.items()), ids=[cls for _, cls in TABLES])
+def test_term_tables_match(source, attribute):
+    isaac_terms = _terms(_class_node(*source))
+    kinematic_terms = _kinematic_table(attribute)
+    assert list(isaac_terms) == list(kinematic_terms)
+    for name, call in isaac_terms.items():
+        func = _func_name(call)
+        if func is not None:
+            assert kinematic_terms[name].func.__name__ == func, name
+
+
+@pytest.mark.parametrize("source", [path for path, _ in TABLES] + ["mdp/task_state_cfg.py", "first_rl_env_cfg.py"])
+def test_isaac_config_has_no_numeric_literals(source):
+    with open(os.path.join(TASK_DIR, source), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    assert not [literal for node in classes for literal in _numeric_literals(node)]